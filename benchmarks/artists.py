@@ -0,0 +1,124 @@
+"""
+Benchmarks for drawing the custom artists on their own, without classification.
+"""
+import gc
+import tracemalloc
+
+import numpy as np
+
+from mpl_toolkits.clifford import (
+    Arrow3D, Arrow3DCollection, Circle2DCollection, Circle3D, Circle3DCollection,
+    InfiniteLine2D, InfiniteLine2DCollection,
+    InfiniteLine3D, InfiniteLine3DCollection, Plane3DCollection, Sphere3DCollection, _plane_frames,
+)
+
+from .common import make_axes
+
+
+def _add_Arrow3D(ax, rng, n):
+    for a, b in rng.uniform(-1, 1, (n, 2, 3)):
+        ax.add_artist(Arrow3D(a, b, mutation_scale=10, arrowstyle='-|>'))
+
+
+def _add_Arrow3DCollection(ax, rng, n):
+    a, b = rng.uniform(-1, 1, (2, n, 3))
+    ax.add_collection(Arrow3DCollection(a, b), autolim=False)
+
+
+def _add_Circle3D(ax, rng, n):
+    frames = _plane_frames(rng.standard_normal((n, 3)))
+    for c, r, m in zip(rng.uniform(-1, 1, (n, 3)), rng.uniform(0.1, 0.5, n), frames):
+        ax.add_patch(Circle3D(c, r, m, fill=False))
+
+
+def _add_Circle3DCollection(ax, rng, n):
+    frames = _plane_frames(rng.standard_normal((n, 3)))
+    ax.add_collection(Circle3DCollection(
+        rng.uniform(-1, 1, (n, 3)), rng.uniform(0.1, 0.5, n), frames, facecolor='none'))
+
+
+def _add_Circle2DCollection(ax, rng, n):
+    ax.add_collection(Circle2DCollection(
+        rng.uniform(-1, 1, (n, 2)), rng.uniform(0.1, 0.5, n), facecolor='none'))
+
+
+def _add_Sphere3DCollection(ax, rng, n):
+    ax.add_collection3d(Sphere3DCollection(
+        rng.uniform(-1, 1, (n, 3)), rng.uniform(0.01, 0.5, n), 'tab:blue', alpha=0.5))
+
+
+def _add_Plane3DCollection(ax, rng, n):
+    normals = rng.standard_normal((n, 3))
+    normals /= np.linalg.norm(normals, axis=-1, keepdims=True)
+    ax.add_collection3d(Plane3DCollection(rng.uniform(-1, 1, (n, 3)), normals, 'tab:green'), autolim=False)
+
+
+def _add_InfiniteLine2D(ax, rng, n):
+    for o, d in zip(rng.uniform(-1, 1, (n, 2)), rng.standard_normal((n, 2))):
+        ax.add_line(InfiniteLine2D(o, d))
+
+
+def _add_InfiniteLine2DCollection(ax, rng, n):
+    ax.add_collection(InfiniteLine2DCollection(
+        rng.uniform(-1, 1, (n, 2)), rng.standard_normal((n, 2))), autolim=False)
+
+
+def _add_InfiniteLine3D(ax, rng, n):
+    for o, d in zip(rng.uniform(-1, 1, (n, 3)), rng.standard_normal((n, 3))):
+        ax.add_line(InfiniteLine3D(o, d))
+
+
+def _add_InfiniteLine3DCollection(ax, rng, n):
+    ax.add_collection(InfiniteLine3DCollection(
+        rng.uniform(-1, 1, (n, 3)), rng.standard_normal((n, 3))), autolim=False)
+
+
+class Artists:
+    params = [
+        ['Arrow3D', 'Arrow3DCollection', 'Circle2DCollection', 'Circle3D', 'Circle3DCollection',
+         'InfiniteLine2D', 'InfiniteLine2DCollection',
+         'InfiniteLine3D', 'InfiniteLine3DCollection', 'Plane3DCollection', 'Sphere3DCollection'],
+        [1, 100, 1000],
+    ]
+    param_names = ['artist', 'n']
+    timeout = 300
+
+    def setup(self, artist, n):
+        self.fig, ax = make_axes('2d' if '2D' in artist else '3d')
+        globals()['_add_' + artist](ax, np.random.default_rng(0), n)
+        self.fig.canvas.draw()
+
+    def time_draw(self, artist, n):
+        self.fig.canvas.draw()
+
+
+class CircleMemory:
+    """ The memory kept by 3D circles once they have been drawn """
+    params = [['Circle3D', 'Circle3DCollection'], ['float64', 'float32']]
+    param_names = ['artist', 'dtype']
+    n = 1000
+
+    def setup(self, artist, dtype):
+        self.fig, self.ax = make_axes('3d')
+        rng = np.random.default_rng(0)
+        self.circles = rng.uniform(-1, 1, (self.n, 3)), rng.uniform(0.1, 0.5, self.n), \
+            _plane_frames(rng.standard_normal((self.n, 3)))
+        self.fig.canvas.draw()
+
+    def track_bytes_per_circle(self, artist, dtype):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            if artist == 'Circle3D':
+                for c, r, m in zip(*self.circles):
+                    self.ax.add_patch(Circle3D(c, r, m, dtype=dtype, fill=False))
+            else:
+                self.ax.add_collection(
+                    Circle3DCollection(*self.circles, dtype=dtype, facecolor='none'), autolim=False)
+            self.fig.canvas.draw()
+            gc.collect()
+            return tracemalloc.get_traced_memory()[0] / self.n
+        finally:
+            tracemalloc.stop()
+
+    track_bytes_per_circle.unit = 'bytes'
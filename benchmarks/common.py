@@ -0,0 +1,126 @@
+"""
+Random conformal objects and Agg axes to benchmark against.
+
+Objects are built directly from coefficient arrays, so that setting up
+:math:`10^5` of them does not take longer than the benchmark itself.
+"""
+import functools
+
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from mpl_toolkits.mplot3d import Axes3D  # noqa: F401, registers the 3d projection
+
+import numpy as np
+
+from clifford import g2c, g3c
+
+LAYOUTS = {'2d': g2c.layout, '3d': g3c.layout}
+
+KINDS = ['Point', 'Tangent', 'PointPair', 'Line', 'Circle', 'Plane', 'Sphere']
+COUNTS = [1, 100, 10_000, 100_000]
+
+# combinations which are not plottable, or which are still drawn one artist
+# per object and so would take minutes to set up at the larger counts
+MAX_COUNTS = {
+    ('2d', 'Plane'): 0,
+    ('2d', 'Sphere'): 0,
+    ('3d', 'PointPair'): 10_000,
+    ('3d', 'Sphere'): 1000,
+}
+
+
+def skip_unless_supported(dims, kind, n):
+    """ Tell asv to skip a parameter combination, by raising NotImplementedError """
+    if n > MAX_COUNTS.get((dims, kind), n):
+        raise NotImplementedError
+
+
+@functools.lru_cache()
+def _dense_omt(layout):
+    return layout.omt.todense() if hasattr(layout.omt, 'todense') else np.asarray(layout.omt)
+
+
+def _wedge(layout, a, b):
+    """ The outer product of each row of ``a`` with each row of ``b`` """
+    omt = _dense_omt(layout)
+    ia = np.flatnonzero(np.any(a, axis=0))
+    ib = np.flatnonzero(np.any(b, axis=0))
+    return np.einsum('ni,ikj,nj->nk', a[:, ia], omt[ia][:, :, ib], b[:, ib])
+
+
+def _vectors(layout, x):
+    """ Coefficients of the euclidean vectors with coordinates ``x`` """
+    v = np.zeros((len(x), layout.gaDims))
+    for e, xi in zip(layout.basis_vectors_lst, x.T):
+        v += xi[:, np.newaxis] * e.value
+    return v
+
+
+def _up(layout, x):
+    return (
+        _vectors(layout, x) +
+        0.5 * np.sum(x**2, axis=-1)[:, np.newaxis] * layout.einf.value +
+        layout.eo.value
+    )
+
+
+def make_values(dims, kind, n, seed=0):
+    """
+    Coefficients of ``n`` random objects of the given kind, in the unit box
+
+    Returns
+    -------
+    layout : clifford.ConformalLayout
+    values : np.ndarray, shape (n, layout.gaDims)
+    """
+    layout = LAYOUTS[dims]
+    d = layout.dims - 2
+    rng = np.random.default_rng(seed)
+
+    def points():
+        return _up(layout, rng.uniform(-1, 1, (n, d)))
+
+    einf = np.broadcast_to(layout.einf.value, (n, layout.gaDims))
+
+    if kind == 'Point':
+        values = points()
+    elif kind == 'Tangent':
+        # p ^ (v + (p.v) einf) squares to zero
+        x = rng.uniform(-1, 1, (n, d))
+        v = 0.2 * rng.standard_normal((n, d))
+        w = _vectors(layout, v) + np.sum(x * v, axis=-1)[:, np.newaxis] * layout.einf.value
+        values = _wedge(layout, _up(layout, x), w)
+    elif kind == 'PointPair':
+        values = _wedge(layout, points(), points())
+    elif kind == 'Line':
+        values = _wedge(layout, _wedge(layout, points(), points()), einf)
+    elif kind == 'Circle':
+        values = _wedge(layout, _wedge(layout, points(), points()), points())
+    elif kind == 'Plane':
+        values = _wedge(layout, _wedge(layout, _wedge(layout, points(), points()), points()), einf)
+    elif kind == 'Sphere':
+        values = _wedge(layout, _wedge(layout, _wedge(layout, points(), points()), points()), points())
+    else:
+        raise ValueError(kind)
+    return layout, values
+
+
+def make_objects(dims, kind, n, seed=0):
+    """ Like :func:`make_values`, but as a list of multivectors """
+    layout, values = make_values(dims, kind, n, seed)
+    return layout, [layout.MultiVector(v) for v in values]
+
+
+def make_axes(dims):
+    """ A figure with a single axes, drawn with Agg and without pyplot """
+    fig = Figure(figsize=(6, 6), dpi=100)
+    FigureCanvasAgg(fig)
+    if dims == '3d':
+        ax = fig.add_subplot(projection='3d')
+        ax.set(xlim=(-1, 1), ylim=(-1, 1), zlim=(-1, 1))
+    else:
+        ax = fig.add_subplot()
+        ax.set(xlim=(-1, 1), ylim=(-1, 1), aspect='equal')
+    return fig, ax
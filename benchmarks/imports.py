@@ -0,0 +1,22 @@
+"""
+Benchmarks for import time, each measured in a fresh interpreter.
+"""
+
+
+def timeraw_import():
+    return "import mpl_toolkits.clifford"
+
+
+def timeraw_import_animation():
+    return "import mpl_toolkits.clifford.animation"
+
+
+def timeraw_import_and_plot_2d():
+    # the first plot pays for the deferred imports
+    return """
+    from matplotlib.figure import Figure
+    from clifford.g2c import up
+    import mpl_toolkits.clifford
+    ax = Figure().add_subplot()
+    mpl_toolkits.clifford.plot(ax, [up(0)])
+    """
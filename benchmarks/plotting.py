@@ -0,0 +1,145 @@
+"""
+Benchmarks for each phase of :func:`mpl_toolkits.clifford.plot`.
+
+* ``Classify`` - grouping multivectors by type, and extracting their geometry
+* ``PlotValues`` - plotting straight from a coefficient array
+* ``PlotViews`` - plotting the same objects on several axes
+* ``Construct`` - creating artists from already classified groups
+* ``Draw`` - rendering a static scene with Agg
+* ``Animate`` - updating a scene in place and redrawing it, once per frame
+* ``Replay`` - updating a scene from recorded geometry, without classifying it
+
+Combinations which are not supported are skipped, see
+:data:`.common.MAX_COUNTS`.
+"""
+from mpl_toolkits.clifford import plot, plot_values, plot_views, ClassificationCache, _make_plotter
+from mpl_toolkits.clifford._classify import _classify_groups
+from mpl_toolkits.clifford.recording import GeometryRecording
+
+from .common import KINDS, COUNTS, make_axes, make_objects, make_values, skip_unless_supported
+
+
+class _Scene:
+    params = [['2d', '3d'], KINDS, COUNTS]
+    param_names = ['axes', 'kind', 'n']
+    timeout = 600
+
+    def setup(self, dims, kind, n):
+        skip_unless_supported(dims, kind, n)
+        self.layout, self.objs = make_objects(dims, kind, n)
+        self.fig, self.ax = make_axes(dims)
+
+
+class Classify(_Scene):
+    def time_classify(self, dims, kind, n):
+        _classify_groups(self.layout, self.objs)
+
+
+class PlotValues(_Scene):
+    number = 1
+    repeat = (3, 10, 20.0)
+
+    def setup(self, dims, kind, n):
+        super().setup(dims, kind, n)
+        _, self.values = make_values(dims, kind, n)
+
+    def time_plot_values(self, dims, kind, n):
+        plot_values(self.ax, self.layout, self.values, color='k')
+
+    def time_plot(self, dims, kind, n):
+        plot(self.ax, self.objs, color='k')
+
+
+class PlotViews(_Scene):
+    number = 1
+    repeat = (3, 10, 20.0)
+    n_views = 4
+
+    def setup(self, dims, kind, n):
+        super().setup(dims, kind, n)
+        self.axes = [self.ax] + [make_axes(dims)[1] for _ in range(self.n_views - 1)]
+
+    def time_plot_views(self, dims, kind, n):
+        plot_views(self.axes, self.objs, color='k')
+
+    def time_plot_each(self, dims, kind, n):
+        for ax in self.axes:
+            plot(ax, self.objs, color='k')
+
+
+class Construct(_Scene):
+    # artists pile up on the axes, so start afresh for every call
+    number = 1
+    repeat = (3, 10, 20.0)
+
+    def setup(self, dims, kind, n):
+        super().setup(dims, kind, n)
+        self.plotter = _make_plotter(self.ax, self.layout)
+        self.groups = list(self.plotter._dispatch(self.objs))
+
+    def time_construct(self, dims, kind, n):
+        for handler, os in self.groups:
+            list(handler(self.plotter, os, color='k'))
+
+
+class Draw(_Scene):
+    # a frame of 10^5 objects takes several seconds, so keep the sample small
+    rounds = 1
+    repeat = (1, 5, 60.0)
+
+    def setup(self, dims, kind, n):
+        super().setup(dims, kind, n)
+        plot(self.ax, self.objs, color='k')
+        self.fig.canvas.draw()
+
+    def time_draw(self, dims, kind, n):
+        self.fig.canvas.draw()
+
+
+class Animate(_Scene):
+    """ Alternate between two sets of objects, as an animation would """
+    rounds = 1
+    repeat = (1, 5, 60.0)
+
+    def setup(self, dims, kind, n):
+        super().setup(dims, kind, n)
+        _, other = make_objects(dims, kind, n, seed=1)
+        self.frames = [other, self.objs]
+        self.handle = plot(self.ax, self.objs, color='k')
+        self.fig.canvas.draw()
+        # a separate plot, whose objects are always found in the cache
+        _, cached_ax = make_axes(dims)
+        self.cached = plot(cached_ax, other, color='k', cache=ClassificationCache(maxsize=2 * n))
+        self.cached.update(self.objs)
+
+    def time_update(self, dims, kind, n):
+        self.handle.update(self.frames[0])
+        self.frames.reverse()
+
+    def time_update_and_draw(self, dims, kind, n):
+        self.handle.update(self.frames[0])
+        self.frames.reverse()
+        self.fig.canvas.draw()
+
+    def time_update_cached(self, dims, kind, n):
+        self.cached.update(self.frames[0])
+        self.frames.reverse()
+
+
+class Replay(_Scene):
+    """ Alternate between two frames of a recording, as a viewer of one would """
+    rounds = 1
+    repeat = (1, 5, 60.0)
+
+    def setup(self, dims, kind, n):
+        super().setup(dims, kind, n)
+        _, other = make_objects(dims, kind, n, seed=1)
+        recording = GeometryRecording()
+        plot(self.ax, self.objs, color='k', record=recording).update(other)
+        _, replay_ax = make_axes(dims)
+        self.handle = recording.plot(replay_ax, frame=0)
+        self.frames = [1, 0]
+
+    def time_update(self, dims, kind, n):
+        self.handle.update(self.frames[0])
+        self.frames.reverse()
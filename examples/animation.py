@@ -1,9 +1,8 @@
 from pathlib import Path
 
 from matplotlib import pyplot as plt
-from matplotlib import animation
 import numpy as np
-import mpl_toolkits.clifford
+from mpl_toolkits.clifford.animation import Animator
 from clifford.g2c import *
 
 fig = plt.figure()
@@ -11,31 +10,26 @@ ax = fig.add_subplot(1, 1, 1)
 ax.axis('equal')
 ax.set(xlim=[-2, 2], ylim=[-2, 2], autoscale_on=False)
 
-def basic_animation(fig, *, interval, **kwargs):
-    def decorator(f):
-        last_artists = []
-        def animate(i):
-            for a in last_artists:
-                a.remove()
-            last_artists[:] = list(f(i*interval))
-            return last_artists
+animator = Animator(fig)
 
-        return animation.FuncAnimation(
-            fig, animate, init_func=lambda: animate(0), **kwargs, interval=interval*1000)
+# create the artists once, and update them in place every frame
+dual_pair = animator.dynamic(ax, marker='x', color='tab:orange')
+circle = animator.dynamic(ax, color='tab:blue')
+points = animator.dynamic(ax, marker='x', color='tab:red', linestyle='none')
+line = animator.dynamic(ax, color='tab:green')
+pair = animator.dynamic(ax, color='tab:purple')
 
-    return decorator
-
-@basic_animation(fig, interval=0.005, save_count=100)
+@animator.animate(interval=0.005, save_count=100)
 def animation(t):
     freq = 0.5
     A = up(np.cos(t*2*np.pi*freq)*e1+  np.sin(t*2*np.pi*freq)*e2)
     B = up(e1)
     C = up(e2)
-    yield from mpl_toolkits.clifford.plot(ax, [(A ^ C).dual()], marker='x', color='tab:orange')
-    yield from mpl_toolkits.clifford.plot(ax, [A ^ B ^ C], color='tab:blue')
-    yield from mpl_toolkits.clifford.plot(ax, [A, B, C], marker='x', color='tab:red', linestyle='none')
-    yield from mpl_toolkits.clifford.plot(ax, [A ^ B ^ einf], color='tab:green')
-    yield from mpl_toolkits.clifford.plot(ax, [(A ^ B ^ C) | B], color='tab:purple')
+    dual_pair.update([(A ^ C).dual()])
+    circle.update([A ^ B ^ C])
+    points.update([A, B, C])
+    line.update([A ^ B ^ einf])
+    pair.update([(A ^ B ^ C) | B])
 
 # animation.save(Path(__file__).with_suffix('.gif'), writer='imagemagick')
 
@@ -0,0 +1,39 @@
+import random
+import time
+
+from matplotlib import pyplot as plt
+import numpy as np
+from mpl_toolkits.clifford.animation import Animator, LiveViewer
+from clifford.g2c import *
+
+fig = plt.figure()
+ax = fig.add_subplot(1, 1, 1)
+ax.axis('equal')
+ax.set(xlim=[-2, 2], ylim=[-2, 2], autoscale_on=False)
+
+animator = Animator(fig)
+animator.static(ax, [up(e1) ^ up(e2) ^ up(-e1)], color='tab:gray')
+points = animator.dynamic(ax, marker='x', color='tab:red', linestyle='none')
+circle = animator.dynamic(ax, color='tab:blue')
+
+
+def simulation():
+    """ A stand-in for a simulation, which takes a varying time per step """
+    t = 0
+    while True:
+        time.sleep(random.uniform(0.001, 0.1))
+        t += 0.02
+        A = up(np.cos(t*np.pi)*e1 + np.sin(t*np.pi)*e2)
+        B = up(0.5*np.sin(3*t)*e1)
+        # the third point is further out than the others, so never meets them
+        yield [A, B], [A ^ B ^ up(-1.5*e2)]
+
+
+# the frames are produced and classified in a background thread, and the
+# timer shows whichever is the latest each time it fires
+viewer = LiveViewer(animator, simulation())
+animation = viewer.start(interval=0.03)
+
+plt.show()
+viewer.stop()
+print(viewer)
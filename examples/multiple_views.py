@@ -0,0 +1,22 @@
+from matplotlib import pyplot as plt
+import mpl_toolkits.clifford
+from clifford.g3c import *
+
+A = up(-e1)
+B = up(e1)
+C = up(e2*0.6 + e3*0.8)
+D = up(e3)
+
+fig = plt.figure(figsize=(12, 4))
+axes = [fig.add_subplot(1, 3, i + 1, projection='3d') for i in range(3)]
+for ax, azim in zip(axes, [-60, 30, 120]):
+    ax.view_init(elev=20, azim=azim)
+
+# the objects are classified once, and drawn on all three axes
+mpl_toolkits.clifford.plot_views(axes, [A ^ B ^ C], color='tab:blue')
+mpl_toolkits.clifford.plot_views(axes, [A ^ B ^ C ^ D], color='tab:blue')
+mpl_toolkits.clifford.plot_views(axes, [A, B, C], marker='x', color='tab:red', linestyle='none')
+mpl_toolkits.clifford.plot_views(axes, [A ^ B ^ einf], color='tab:green')
+mpl_toolkits.clifford.plot_views(axes, [A ^ B ^ C ^ einf], color='tab:red')
+
+plt.show()
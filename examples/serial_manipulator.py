@@ -4,9 +4,8 @@ import math
 from pathlib import Path
 
 from matplotlib import pyplot as plt
-from matplotlib import animation
 import numpy as np
-import mpl_toolkits.clifford
+from mpl_toolkits.clifford.animation import Animator
 
 from clifford.g3c import *
 
@@ -16,27 +15,21 @@ ax = fig.add_subplot(1, 1, 1, projection="3d")
 ax.set(xlim=[-1, 1], ylim=[0, 2], zlim=[-1, 1], autoscale_on=False)
 ax.view_init(azim=120)
 
-def basic_animation(fig, *, interval, **kwargs):
-    def decorator(f):
-        last_artists = []
-        def animate(i):
-            for a in last_artists:
-                a.remove()
-            last_artists[:] = list(f(i*interval))
-            return last_artists
+animator = Animator(fig)
 
-        return animation.FuncAnimation(
-            fig, animate, init_func=lambda: animate(0), **kwargs, interval=interval*1000)
-
-    return decorator
+# create the artists once, and update them in place every frame
+base_pair = animator.dynamic(ax, color='tab:blue')
+arm = animator.dynamic(ax, marker='x', color='tab:orange')
+trajectory_line = animator.dynamic(ax, color='tab:gray', linewidth=0.5)
 
 
 # Draw a robot base
 C = up(0.2*e1)^up(0.2*e3)^up(-0.2*e1);
+animator.static(ax, [C], color='tab:blue')
 
 trajectory = []
 
-@basic_animation(fig, interval=0.005, save_count=100)
+@animator.animate(interval=0.005, save_count=100)
 def animation(t):
     # Set up time varying parameters for the the rotors
     speed = 4
@@ -59,10 +52,9 @@ def animation(t):
     endpoint = elb0 + R2*0.5*e2*~R2
     trajectory.append(up(endpoint))
 
-    yield from mpl_toolkits.clifford.plot(ax, [up(0), R0*up(0.2*e1)*~R0], color='tab:blue')
-    yield from mpl_toolkits.clifford.plot(ax, [C], color='tab:blue')
-    yield from mpl_toolkits.clifford.plot(ax, [up(0), up(elb0), up(endpoint)], marker='x', color='tab:orange')
-    yield from mpl_toolkits.clifford.plot(ax, trajectory, color='tab:gray', linewidth=0.5)
+    base_pair.update([up(0), R0*up(0.2*e1)*~R0])
+    arm.update([up(0), up(elb0), up(endpoint)])
+    trajectory_line.update(trajectory)
 
 # animation.save(Path(__file__).with_suffix('.gif'), writer='imagemagick')
 
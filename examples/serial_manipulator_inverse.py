@@ -4,9 +4,8 @@ import math
 from pathlib import Path
 
 from matplotlib import pyplot as plt
-from matplotlib import animation
 import numpy as np
-import mpl_toolkits.clifford
+from mpl_toolkits.clifford.animation import Animator
 
 from clifford.g3c import *
 
@@ -16,19 +15,14 @@ ax = fig.add_subplot(1, 1, 1, projection="3d")
 ax.set(xlim=[-1, 1], ylim=[0, 2], zlim=[-1, 1], autoscale_on=False)
 ax.view_init(azim=150)
 
-def basic_animation(fig, *, interval, **kwargs):
-    def decorator(f):
-        last_artists = []
-        def animate(i):
-            for a in last_artists:
-                a.remove()
-            last_artists[:] = list(f(i*interval))
-            return last_artists
+animator = Animator(fig)
 
-        return animation.FuncAnimation(
-            fig, animate, init_func=lambda: animate(0), **kwargs, interval=interval*1000)
-
-    return decorator
+# create the artists once, and update them in place every frame
+spheres = animator.dynamic(ax, color='k', alpha=0.1)
+arm = animator.dynamic(ax, marker='x', color='tab:orange')
+circle = animator.dynamic(ax, color='tab:red')
+target_point = animator.dynamic(ax, color='tab:red')
+pair = animator.dynamic(ax, color='tab:red')
 
 
 target_traj = [
@@ -38,8 +32,13 @@ target_traj = [
     0.6*e2 - 0.5*e1,
 ]
 
+# Draw a robot base, and the path of the target
+Cbase = up(0.2*e1)^up(0.2*e3)^up(-0.2*e1)
+animator.static(ax, [Cbase], color='tab:blue')
+animator.static(ax, [up(t) for t in (target_traj + target_traj[:1])], color='tab:gray', linewidth=0.5)
+
 
-@basic_animation(fig, interval=0.005, save_count=100)
+@animator.animate(interval=0.005, save_count=100)
 def animation(t):
     speed = 16
 
@@ -55,9 +54,6 @@ def animation(t):
 
     target = up(target_traj[ind]*(1-frac) + target_traj[next_ind]*frac)
 
-    # Draw a robot base
-    Cbase = up(0.2*e1)^up(0.2*e3)^up(-0.2*e1)
-
     # The actual inverse kinematics of the robot
     S0 = (up(0) - 0.5*rho**2*einf).dual()
     S1 = (target - 0.5*l**2*einf).dual()
@@ -76,13 +72,11 @@ def animation(t):
         endpoint = up((rho+l)*down(target).normal())
         elb = up(rho*down(target).normal())
 
-    yield from mpl_toolkits.clifford.plot(ax, [S0, S1, P], color='k', alpha=0.1)
-    yield from mpl_toolkits.clifford.plot(ax, [Cbase], color='tab:blue')
-    yield from mpl_toolkits.clifford.plot(ax, [up(0), elb, endpoint], marker='x', color='tab:orange')
-    yield from mpl_toolkits.clifford.plot(ax, [C], color='tab:red')
-    yield from mpl_toolkits.clifford.plot(ax, [target], color='tab:red')
-    yield from mpl_toolkits.clifford.plot(ax, [PP], color='tab:red')
-    yield from mpl_toolkits.clifford.plot(ax, [up(t) for t in (target_traj + target_traj[:1])], color='tab:gray', linewidth=0.5)
+    spheres.update([S0, S1, P])
+    arm.update([up(0), elb, endpoint])
+    circle.update([C])
+    target_point.update([target])
+    pair.update([PP])
 
 # animation.save(Path(__file__).with_suffix('.gif'), writer='imagemagick')
 
@@ -1,65 +1,460 @@
-import math
-from typing import Iterator
-import itertools
+"""
+Plotting of conformal multivectors from :mod:`clifford` with matplotlib.
+
+Importing this is cheap: :mod:`clifford` and :mod:`mpl_toolkits.mplot3d` are
+only imported by the private submodules which need them, the first time
+something is plotted or a 3D artist is accessed.
+"""
 import collections
+import collections.abc
+import contextlib
 import functools
-import warnings
+import importlib
+import itertools
+from typing import TYPE_CHECKING
 
-from matplotlib.artist import Artist
-from matplotlib.patches import Circle, FancyArrowPatch, Patch
-from matplotlib.collections import PatchCollection
-from matplotlib.tri import Triangulation
-from matplotlib.path import Path
+from matplotlib.collections import LineCollection, PolyCollection
 from matplotlib.lines import Line2D
-
-from mpl_toolkits.mplot3d import Axes3D
-from mpl_toolkits.mplot3d import proj3d, art3d
+from matplotlib.transforms import Bbox
 
 import numpy as np
 
-from clifford.tools import classify
-import clifford
-
 from ._version import __version__
+from . import _profiling
+from ._profiling import profile, Profile
+from ._cache import ClassificationCache
+
+if TYPE_CHECKING:
+    # which imports from this module in turn
+    from . import _plotter
+
+__all__ = ['plot', 'plot_values', 'plot_views', 'profile', 'ClassificationCache', 'GeometryRecording', 'RenderPool']
+
+# public names which are loaded on first access, and the modules providing them
+_lazy_names = {
+    'Arrow3D': '._plot3d',
+    'Arrow3DCollection': '._plot3d',
+    'Circle3D': '._plot3d',
+    'Circle3DCollection': '._plot3d',
+    'Sphere3DCollection': '._plot3d',
+    'Plane3DCollection': '._plot3d',
+    'Scene3DCollection': '._plot3d',
+    'InfiniteLine3D': '._plot3d',
+    'InfiniteLine3DCollection': '._plot3d',
+    'RenderPool': '.render',
+    'GeometryRecording': '.recording',
+}
+
+
+def __getattr__(name):
+    try:
+        module = _lazy_names[name]
+    except KeyError:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name)) from None
+    return getattr(importlib.import_module(module, __name__), name)
+
+
+def __dir__():
+    return sorted(set(globals()) | _lazy_names.keys())
+
+
+def _line_styles_for_radii(r):
+    return np.where(np.imag(r) == 0, '-', ':').tolist()
+
+
+def _normalized(v):
+    return v / np.linalg.norm(v, axis=-1, keepdims=True)
+
+
+# `Line2D` properties which collections do not understand
+_MARKER_KWARGS = {
+    'marker', 'markersize', 'ms', 'markeredgecolor', 'mec', 'markeredgewidth', 'mew',
+    'markerfacecolor', 'mfc', 'markerfacecoloralt', 'mfcalt', 'fillstyle', 'markevery',
+}
+
+
+def _pop_marker_kwargs(kwargs):
+    return {k: kwargs.pop(k) for k in _MARKER_KWARGS & kwargs.keys()}
+
+
+def _append_linestyles(col, n, linestyles):
+    """ Add ``linestyles`` after the first ``n`` linestyles of a collection """
+    # `get_linestyle` gives the dash patterns after scaling by the linewidth
+    old = col._us_linestyles
+    if len(old) != n:
+        old = [old[i % len(old)] for i in range(n)]
+    col.set_linestyle(list(old) + list(linestyles))
+
+
+def _group_name(plotter, os):
+    """ The key to profile a plotter method under """
+    return os.type_names[0]
+
+
+def _shared_geometry(f):
+    """
+    Decorate a plotter method taking a group of objects, to store its result
+    on the group. Plotters shown the same group, as by :func:`plot_views`,
+    then compute it only once, and their artists share the arrays.
+    """
+    @functools.wraps(f)
+    def wrapper(self, os):
+        try:
+            return os._geometry[f]
+        except KeyError:
+            result = os._geometry[f] = f(self, os)
+            return result
+    return wrapper
+
+
+def _artist_name(artist, *args):
+    """ The key to profile an artist method under """
+    return type(artist).__name__
+
+
+def _plane_frames(normals):
+    """ Orthonormal ``(3, 2)`` bases for the planes with the given unit normals """
+    # use whichever axis is least parallel to the normal, to avoid degeneracy
+    axis = np.eye(3)[np.argmin(np.abs(normals), axis=-1)]
+    u = _normalized(np.cross(normals, axis))
+    v = np.cross(normals, u)
+    return np.stack([u, v], axis=-1)
+
+
+def plot(ax, cga_objs, **kwargs) -> 'PlotHandle':
+    """
+    Plot a multivector, list of multivectors, or :class:`clifford.MVArray`
+
+    When more than a handful of objects are passed, they are classified
+    together in a single vectorized pass.
+
+    Any other iterable, such as a generator, is consumed a chunk at a time,
+    with each chunk appended to the artists of the ones before. Only one
+    chunk of multivectors is held in memory at once.
 
-__all__ = ['plot']
+    Passing ``cache=``, a :class:`ClassificationCache`, skips classifying
+    objects which it holds from earlier plots or updates.
 
+    With ``cull=True``, and autoscaling turned off, no artists are created
+    for rounds lying entirely outside the axis limits, nor for points when
+    they are not joined by a line (``linestyle='none'``). The
+    artists are recreated whenever the limits change, so all the objects
+    plotted are kept until the next :meth:`PlotHandle.update`. The axes keep
+    the plot alive for this until it is updated to show no objects.
 
-def _line_style_for_radius(r):
-    return '-' if r.imag == 0 else ":"
+    On 3D axes, ``scene=True`` draws planes, spheres, and the fill of
+    circles as part of a single :class:`Scene3DCollection` shared
+    by every such plot on the axes, which depth sorts their triangles
+    together. Only the ``color``, ``facecolor``, and ``alpha`` arguments
+    apply to these.
 
+    The data limits are grown once per call to cover the bounding boxes of
+    the new objects, and the axes autoscale when they are next drawn. On 3D
+    axes, call ``ax.autoscale_view()`` to read the new limits before then.
 
-def plot(ax, cga_objs, **kwargs):
+    Passing ``record=``, a :class:`GeometryRecording`, keeps the classified
+    geometry of this and every later update, to be saved and plotted again
+    without :mod:`clifford`.
+
+    Returns a :class:`PlotHandle`, which is a list of the created artists that
+    can also be pointed at new objects with :meth:`PlotHandle.update`.
+    """
+    handle = PlotHandle(ax, **kwargs)
+    handle.update(cga_objs)
+    return handle
+
+
+def plot_values(ax, layout, values, **kwargs) -> 'PlotHandle':
     """
-    Plot a multivector or list of multivectors
+    Plot objects given as an array of coefficients, rather than multivectors
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+    layout : clifford.ConformalLayout
+    values : array_like, shape (..., layout.gaDims), or clifford.MVArray
+        The coefficients of each object. Most objects are classified without
+        creating a :class:`~clifford.MultiVector` for each one.
+    **kwargs
+        As for :func:`plot`.
+    """
+    handle = PlotHandle(ax, **kwargs)
+    handle.update_values(values, layout)
+    return handle
+
+
+def plot_views(axes, cga_objs, **kwargs) -> 'MultiViewHandle':
     """
+    Plot the same objects on each of several axes, such as 3D axes viewed
+    from different angles, classifying them only once.
+
+    The geometry of the objects is also computed once, and shared between
+    the artists of each axes, so that only creating and drawing the artists
+    is repeated for each view. The axes must all be 2D or all be 3D.
+
+    Parameters
+    ----------
+    axes : sequence of matplotlib.axes.Axes
+    cga_objs
+        As for :func:`plot`.
+    **kwargs
+        As for :func:`plot`, and applied to every axes.
+
+    Returns a :class:`MultiViewHandle`, holding the :class:`PlotHandle` of each
+    axes, which can be pointed at new objects with
+    :meth:`MultiViewHandle.update`.
+    """
+    handle = MultiViewHandle(axes, **kwargs)
+    handle.update(cga_objs)
+    return handle
+
+
+def _as_sequence(cga_objs):
+    import clifford
     if isinstance(cga_objs, clifford.MultiVector):
-        cga_objs = [cga_objs]
-    if not cga_objs:
-        return []
+        return [cga_objs]
+    elif isinstance(cga_objs, np.ndarray):
+        # including `clifford.MVArray`
+        return cga_objs.ravel()
+    return cga_objs
+
+
+# the number of objects taken at once from an iterator passed to `plot`
+_STREAM_CHUNK_SIZE = 4096
+
 
+def _chunks(cga_objs):
+    """ Split ``cga_objs`` into sequences, reading iterators a chunk at a time """
+    if isinstance(cga_objs, (collections.abc.Sequence, np.ndarray)):
+        yield cga_objs
+        return
+    it = iter(cga_objs)
+    while True:
+        chunk = list(itertools.islice(it, _STREAM_CHUNK_SIZE))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _common_layout(cga_objs):
     layout = cga_objs[0].layout
     if not all(cga_obj.layout is layout for cga_obj in cga_objs[1:]):
         raise ValueError("All multivectors must have the same layout")
+    return layout
 
+
+def _make_plotter(ax, layout, cache=None, cull=False, scene=False) -> '_plotter._Plotter':
+    import clifford
     if not isinstance(layout, clifford.ConformalLayout):
         raise TypeError("Layout must be conformal")
+    # the dimensions of ei and eo are not part of the space
+    return _new_plotter(ax, layout.dims - 2, layout, cache, cull, scene)
+
 
-    if isinstance(ax, Axes3D):
+def _new_plotter(ax, obj_dims, layout, cache=None, cull=False, scene=False) -> '_plotter._Plotter':
+    """
+    A plotter for ``obj_dims``-dimensional objects on ``ax``. ``layout`` is
+    ``None`` when plotting geometry from a recording, in which case the
+    caller sets the basis.
+    """
+    # `Axes3D.name`, which avoids importing mplot3d just for the isinstance check
+    if ax.name == '3d':
         axis_dims = 3
     else:
         axis_dims = 2
-    obj_dims = layout.dims - 2  # for ei, eo
+    if scene and axis_dims != 3:
+        raise ValueError("Scene mode is only available on 3D axes")
     if obj_dims == axis_dims == 2:
-        return list(_Plotter2d(ax, layout).plot(cga_objs, **kwargs))
+        from ._plot2d import _Plotter2d
+        return _Plotter2d(ax, layout, cache, cull)
     elif obj_dims == axis_dims == 3:
-        return list(_Plotter3d(ax, layout).plot(cga_objs, **kwargs))
+        from ._plot3d import _Plotter3d
+        return _Plotter3d(ax, layout, cache, cull, scene)
     elif obj_dims == axis_dims:
         raise NotImplementedError("Cannot plot {}-D objects".format(obj_dims))
     elif obj_dims != axis_dims:
         raise TypeError("Objects live in {}-D space, but the axes are {}-D".format(obj_dims, axis_dims))
 
 
+class PlotHandle(list):
+    """
+    The artists created by :func:`plot`.
+
+    As well as being a list of artists, this remembers which artists were
+    created for each type of object, so that :meth:`update` can reuse them.
+    This avoids creating new artists every frame of an animation.
+    """
+    def __init__(self, ax, cache=None, cull=False, scene=False, record=None, **kwargs):
+        super().__init__()
+        self.axes = ax
+        self._cache = cache
+        self._cull = cull
+        self._scene = scene
+        self._record = record
+        self._kwargs = kwargs
+        self._plotter = None
+        self._parts = []
+        self._cids = []
+
+    def update(self, cga_objs) -> 'PlotHandle':
+        """
+        Show ``cga_objs`` in place of the previously plotted objects.
+
+        Existing artists are modified in place where the classified types
+        match, and are only created or removed when the types change.
+        Iterators are read a chunk at a time, as in :func:`plot`.
+        """
+        chunks = _chunks(_as_sequence(cga_objs))
+        first = next(chunks, [])
+        if len(first) == 0:
+            self._clear()
+        else:
+            layout = _common_layout(first)
+            plotter = self._plotter_for(layout)
+            # the chunks are joined into the artists once, when the batch ends
+            with plotter.batch():
+                self._parts = plotter.update(self._parts, first, **self._kwargs)
+                del first
+
+                for chunk in chunks:
+                    if _common_layout(chunk) is not layout:
+                        raise ValueError("All multivectors must have the same layout")
+                    self._parts = plotter.extend(self._parts, chunk, **self._kwargs)
+        self[:] = [a for _, artists in self._parts for a in artists]
+        return self
+
+    def update_values(self, values, layout=None) -> 'PlotHandle':
+        """
+        Like :meth:`update`, but taking an array of coefficients as in
+        :func:`plot_values`.
+
+        ``layout`` defaults to the layout of the previously plotted objects.
+        """
+        import clifford
+        if isinstance(values, clifford.MVArray):
+            if layout is None and values.size:
+                layout = values.flat[0].layout
+            values = values.value
+        if layout is None:
+            if self._plotter is None:
+                raise ValueError("A layout is needed to interpret the coefficients")
+            layout = self._plotter._layout
+        values = np.asarray(values, dtype=float)
+        if values.shape[-1] != layout.gaDims:
+            raise ValueError(
+                "Expected coefficients of shape (..., {}), got {}".format(layout.gaDims, values.shape))
+        values = values.reshape(-1, layout.gaDims)
+
+        if len(values) == 0:
+            self._clear()
+        else:
+            self._parts = self._plotter_for(layout).update(self._parts, values, **self._kwargs)
+        self[:] = [a for _, artists in self._parts for a in artists]
+        return self
+
+    def _show_groups(self, groups, extend=False):
+        """
+        Show objects which the caller has already classified for the current
+        plotter, either in place of the current ones or, if ``extend``, in
+        addition to them
+        """
+        if extend:
+            self._parts = self._plotter.extend_groups(self._parts, groups, **self._kwargs)
+        else:
+            self._parts = self._plotter.update_groups(self._parts, groups, **self._kwargs)
+        self[:] = [a for _, artists in self._parts for a in artists]
+
+    def _plotter_for(self, layout) -> '_plotter._Plotter':
+        """ The plotter for objects of ``layout``, replacing the current one if it differs """
+        if self._plotter is None or self._plotter._layout is not layout:
+            plotter = _make_plotter(self.axes, layout, self._cache, self._cull, self._scene)
+            if self._record is not None:
+                options = dict(self._kwargs, cull=self._cull, scene=self._scene)
+                plotter._recorder = self._record._new_track(plotter, options)._record
+            self._remove_parts()
+            self._plotter = plotter
+        self._connect_cull()
+        return self._plotter
+
+    def _clear(self):
+        """ Remove the artists, as when updating to show no objects """
+        self._remove_parts()
+        if self._plotter is not None and self._plotter._recorder is not None:
+            # keep the recorded frames in step with the updates
+            self._plotter._recorder([], extend=False)
+
+    def _connect_cull(self):
+        """ Recull the objects whenever the limits change, while there are artists to show them """
+        if self._cull and not self._cids:
+            # the registry only holds a weak reference to bound methods, so
+            # this refers to the handle through a partial, which the axes
+            # keep alive even when the caller drops the handle
+            on_lim_changed = functools.partial(PlotHandle._on_lim_changed, self)
+            self._cids = [
+                self.axes.callbacks.connect('{}lim_changed'.format(name), on_lim_changed)
+                for name in 'xyz'[:3 if self.axes.name == '3d' else 2]
+            ]
+
+    def _on_lim_changed(self, ax):
+        if self._plotter is not None:
+            self._parts = self._plotter.recull(self._parts, **self._kwargs)
+            self[:] = [a for _, artists in self._parts for a in artists]
+
+    def _remove_parts(self):
+        for _, artists in self._parts:
+            for a in artists:
+                a.remove()
+        self._parts = []
+        for cid in self._cids:
+            self.axes.callbacks.disconnect(cid)
+        self._cids = []
+
+
+class MultiViewHandle(list):
+    """
+    The plots created by :func:`plot_views`, a :class:`PlotHandle` per axes.
+    """
+    def __init__(self, axes, cache=None, **kwargs):
+        super().__init__(PlotHandle(ax, **kwargs) for ax in axes)
+        self._cache = cache
+
+    def update(self, cga_objs) -> 'MultiViewHandle':
+        """
+        Show ``cga_objs`` on every axes in place of the previously plotted
+        objects, as :meth:`PlotHandle.update` would, classifying them once.
+        """
+        from ._classify import _classify_groups
+        chunks = _chunks(_as_sequence(cga_objs))
+        first = next(chunks, [])
+        if len(first) == 0:
+            for handle in self:
+                handle._clear()
+                handle[:] = []
+            return self
+
+        layout = _common_layout(first)
+        # this checks that the layout can be plotted, before classifying
+        for handle in self:
+            handle._plotter_for(layout)
+        with contextlib.ExitStack() as stack:
+            for handle in self:
+                stack.enter_context(handle._plotter.batch())
+            groups = _classify_groups(layout, first, self._cache)
+            del first
+            for handle in self:
+                handle._show_groups(groups)
+            for chunk in chunks:
+                if _common_layout(chunk) is not layout:
+                    raise ValueError("All multivectors must have the same layout")
+                groups = _classify_groups(layout, chunk, self._cache)
+                for handle in self:
+                    handle._show_groups(groups, extend=True)
+        # the artists may have been replaced when the batches ended
+        for handle in self:
+            handle[:] = [a for _, artists in handle._parts for a in artists]
+        return self
+
+
 def _groupby(l, key=lambda x: x):
     d = collections.defaultdict(list)
     for item in l:
@@ -67,23 +462,41 @@ def _groupby(l, key=lambda x: x):
     return d.items()
 
 
-def _ray_box_intersection(origin, direction, mins, maxs):
-    n = len(origin)
-    valid_points = []
-    # ok to ignore these, the `NaN`s end up not meeting the comparison conditions
+def _ray_box_intersections(origins, directions, mins, maxs):
+    """
+    Clip many infinite lines to a box, using the slab method.
+
+    Parameters
+    ----------
+    origins, directions : array_like, shape (N, d)
+    mins, maxs : array_like, shape (d,)
+
+    Returns
+    -------
+    segments : np.ndarray, shape (N, 2, d)
+        The end points of each clipped line, or ``NaN`` for lines which miss
+        the box.
+    """
+    origins = np.asarray(origins, dtype=float)
+    directions = np.asarray(directions, dtype=float)
+    parallel = directions == 0
+    inside = (mins <= origins) & (origins <= maxs)
+    # ok to ignore these, the parallel axes are replaced below
     with np.errstate(invalid='ignore', divide='ignore'):
-        for src in mins, maxs:
-            lams = (src - origin) / direction
-            for i, lam in enumerate(lams):
-                i_other = (i + np.arange(1, n)) % n
-                p = origin + lam*direction
-                if (mins[i_other,] <= p[i_other,]).all() and (p[i_other,] <= maxs[i_other,]).all():
-                    valid_points.append((lam, p))
-    valid_points.sort(key=lambda t: t[0])
-    if valid_points:
-        return np.array([valid_points[0][1], valid_points[-1][1]])
-    else:
-        return np.empty((0, n))
+        lam_a = (mins - origins) / directions
+        lam_b = (maxs - origins) / directions
+    lam_lo = np.where(parallel, np.where(inside, -np.inf, np.inf), np.minimum(lam_a, lam_b)).max(axis=-1)
+    lam_hi = np.where(parallel, np.where(inside, np.inf, -np.inf), np.maximum(lam_a, lam_b)).min(axis=-1)
+    lams = np.stack([lam_lo, lam_hi], axis=-1)
+    lams[lam_lo > lam_hi] = np.nan
+    return origins[:, np.newaxis, :] + lams[:, :, np.newaxis] * directions[:, np.newaxis, :]
+
+
+def _ray_box_intersection(origin, direction, mins, maxs):
+    points, = _ray_box_intersections([origin], [direction], mins, maxs)
+    if np.isnan(points).any():
+        return np.empty((0, len(origin)))
+    return points
 
 
 class _InfiniteLine:
@@ -108,244 +521,103 @@ class InfiniteLine2D(Line2D, _InfiniteLine):
         super().draw(renderer)
 
 
-class InfiniteLine3D(art3d.Line3D, _InfiniteLine):
-    def __init__(self, origin, direction, *args, **kwargs):
-        art3d.Line3D.__init__(self, [], [], [], *args, **kwargs)
-        _InfiniteLine.__init__(self, origin, direction)
+class _InfiniteLineCollection:
+    def __init__(self, origins, directions):
+        self._origins = np.asarray(origins)
+        self._directions = np.asarray(directions)
+
+    def set_lines(self, origins, directions):
+        self._origins = np.asarray(origins)
+        self._directions = np.asarray(directions)
+        self.stale = True
+
+
+class InfiniteLine2DCollection(LineCollection, _InfiniteLineCollection):
+    """ Many infinite lines, clipped to the axes each time they are drawn """
+    def __init__(self, origins, directions, *args, **kwargs):
+        LineCollection.__init__(self, [], *args, **kwargs)
+        _InfiniteLineCollection.__init__(self, origins, directions)
 
     def draw(self, renderer):
         mins, maxs = np.array([
             self.axes.get_xbound(),
             self.axes.get_ybound(),
-            self.axes.get_zbound(),
         ]).T
-        points = _ray_box_intersection(self._origin, self._direction, mins, maxs)
-        self._verts3d = points.T
+
+        self.set_segments(_ray_box_intersections(self._origins, self._directions, mins, maxs))
         super().draw(renderer)
 
 
-class _Plotter:
-    def __init__(self, ax, layout):
-        self._layout = layout
-        self._ax = ax
-
-    def plot(self, cga_objs, **kwargs) -> Iterator[Artist]:
-        all_os = [classify.classify(cga_obj) for cga_obj in cga_objs]
-        for handler, os in _groupby(all_os, lambda o: functools._find_impl(type(o), self._handlers)):
-            if not handler:
-                unsupported_msg = (\
-                    "Unable to plot any of the following objects:\n{}"
-                    .format("\n".join(" * {!r}".format(o) for o in os))
-                )
-                warnings.warn(unsupported_msg)
-            else:
-                yield from handler(self, os, **kwargs)
-
-
-class _Plotter2d(_Plotter):
-    _handlers = {}
-
-    def _handles(t, _handlers=_handlers):
-        def decorator(f):
-            _handlers[t] = f
-            return f
-        return decorator
-
-    @classmethod
-    def _as_point_tuple_2d(cls, p):
-        return p[(1,)], p[(2,)]
-
-    @_handles(classify.Point)
-    def _plot_Point(self, os, **kwargs) -> Iterator[Artist]:
-        x, y = zip(*[self._as_point_tuple_2d(point.location) for point in os])
-        yield from self._ax.plot(x, y, **kwargs)
-
-    @_handles(classify.Tangent[2])
-    def _plot_Tangent(self, os, **kwargs) -> Iterator[Artist]:
-        for tangent in os:
-            p = FancyArrowPatch(
-                self._as_point_tuple_2d(tangent.location),
-                self._as_point_tuple_2d(tangent.location + tangent.direction.normal()),
-                arrowstyle="->", shrinkA=0, shrinkB=0, mutation_scale=10
-            )
-            self._ax.add_patch(p)
-            yield p
-
-    @_handles(classify.PointPair)
-    def _plot_PointPair(self, os, **kwargs) -> Iterator[Artist]:
-        for o in os:
-            d = o.direction.normal()
-            a = o.location - abs(o.radius) * d
-            b = o.location + abs(o.radius) * d
-            x, y = zip(*[self._as_point_tuple_2d(end) for end in (a, b)])
-            yield from self._ax.plot(x, y, linestyle=_line_style_for_radius(o.radius), **kwargs)
-
-    @_handles(classify.Line)
-    def _plot_Line(self, os, **kwargs) -> Iterator[Artist]:
-        for line in os:
-            l = InfiniteLine2D(
-                self._as_point_tuple_2d(line.location),
-                self._as_point_tuple_2d(line.direction),
-                **kwargs
-            )
-            self._ax.add_line(l)
-            yield l
-
-    @_handles(classify.Circle)
-    def _plot_Circle(self, os, **kwargs) -> Iterator[Artist]:
-        # adjust the color arguments to make sense
-        kwargs.setdefault('facecolors', 'none')
-        try:
-            color = kwargs.pop('color')
-        except KeyError:
-            raise
-        else:
-            kwargs['edgecolors'] = color
-        c = [
-            Circle(self._as_point_tuple_2d(circle.location), abs(circle.radius))
-            for circle in os
-        ]
-        linestyles = [_line_style_for_radius(circle.radius) for circle in os]
-        col = PatchCollection(c, linestyles=linestyles, **kwargs)
-        self._ax.add_collection(col)
-        self._ax.autoscale_view(None)
-        yield col
-
-
-
-class Arrow3D(FancyArrowPatch):
-    def __init__(self, posA, posB, *args, **kwargs):
-        FancyArrowPatch.__init__(self, (0,0), (0,0), *args, **kwargs)
-        self._posA_3d = posA
-        self._posB_3d = posB
-
-    def do_3d_projection(self, renderer):
-        xs3d, ys3d, zs3d = zip(self._posA_3d, self._posB_3d)
-        xs, ys, zs = proj3d.proj_transform(xs3d, ys3d, zs3d, renderer.M)
-        self.set_positions((xs[0],ys[0]),(xs[1],ys[1]))
-        return min(zs)
-
-
-class Circle3D(Patch):
-    def __init__(self, center, radius, matrix, **kwargs):
-        Patch.__init__(self, **kwargs)
-        path = Path.unit_circle()
-        self.radius = radius
-        self._code3d = path.codes
-        self._segment3d = center + radius * (path.vertices @ matrix.T)
-        self._path2d = Path(np.zeros((0, 2)))
-
-    def get_path(self):
-        return self._path2d
-
-    def do_3d_projection(self, renderer):
-        s = self._segment3d
-        xs, ys, zs = zip(*s)
-        vxs, vys, vzs, vis = proj3d.proj_transform_clip(xs, ys, zs, renderer.M)
-        self._path2d = Path(np.column_stack([vxs, vys]), self._code3d)
-        return min(vzs)
-
-    # def draw(self, renderer):
-    #     self.do_3d_projection()
-    #     super().draw(self, renderer)
-
-
-
-
-class _Plotter3d(_Plotter):
-    _handlers = {}
-
-    def _handles(t, _handlers=_handlers):
-        def decorator(f):
-            _handlers[t] = f
-            return f
-        return decorator
-
-    @classmethod
-    def _as_point_tuple_3d(cls, p):
-        return p[(1,)], p[(2,)], p[(3,)]
-
-    @_handles(classify.Point)
-    def _plot_Point(self, os, **kwargs) -> Iterator[Artist]:
-        coords = zip(*[self._as_point_tuple_3d(point.location) for point in os])
-        return self._ax.plot(*coords, **kwargs)
-
-    @_handles(classify.Tangent[2])
-    def _plot_Tangent(self, os, **kwargs) -> Iterator[Artist]:
-        for tangent in os:
-            p = Arrow3D(
-                self._as_point_tuple_3d(tangent.location),
-                self._as_point_tuple_3d(tangent.location + tangent.direction.normal()),
-                arrowstyle="->", shrinkA=0, shrinkB=0, mutation_scale=10
-            )
-            self._ax.add_patch(p)
-            yield p
-
-    @_handles(classify.PointPair)
-    def _plot_PointPair(self, os, **kwargs) -> Iterator[Artist]:
-        for o in os:
-            d = o.direction.normal()
-            a = o.location - abs(o.radius) * d
-            b = o.location + abs(o.radius) * d
-            coords = zip(*[self._as_point_tuple_3d(end) for end in (a, b)])
-            yield from self._ax.plot(*coords, linestyle=_line_style_for_radius(o.radius), **kwargs)
-
-    @_handles(classify.Line)
-    def _plot_Line(self, os, **kwargs) -> Iterator[Artist]:
-        for o in os:
-            l = InfiniteLine3D(
-                origin=self._as_point_tuple_3d(o.location),
-                direction=self._as_point_tuple_3d(o.direction), **kwargs)
-            self._ax.add_line(l)
-            yield l
-
-    @_handles(classify.Circle)
-    def _plot_Circle(self, os, **kwargs) -> Iterator[Artist]:
-        # adjust the color arguments to make sense
-        kwargs.setdefault('facecolor', 'none')
-        try:
-            color = kwargs.pop('color')
-        except KeyError:
-            raise
-        else:
-            kwargs['edgecolor'] = color
-
-        e1, e2, e3 = self._layout.blades['e1'], self._layout.blades['e2'], self._layout.blades['e3']
-        ret = []
-        for circle in os:
-            rotor = (circle.direction.normal() * (e1 ^ e2) + 1).normal()
-            mat = clifford.linear_operator_as_matrix(lambda x: rotor * x * ~rotor, [e1, e2], [e1, e2, e3])
-            p = Circle3D(
-                self._as_point_tuple_3d(circle.location),
-                abs(circle.radius), mat,
-                linestyle=_line_style_for_radius(circle.radius),
-                **kwargs
-            )
-            self._ax.add_patch(p)
-            yield p
-
-    @_handles(classify.Plane)
-    def _plot_Plane(self, os, **kwargs) -> Iterator[Artist]:
-        kwargs.setdefault('alpha', 0.5)
-        for plane in os:
-            loc = plane.location
-            dir = plane.direction
-            (a, b), sc = dir.factorise()
-
-            # todo: make this extend to the bounds of the plot area
-            points = np.sqrt(sc)*np.array([
-                [self._as_point_tuple_3d(loc - a), self._as_point_tuple_3d(loc - b)],
-                [self._as_point_tuple_3d(loc + b), self._as_point_tuple_3d(loc + a)]
-            ])
-            yield self._ax.plot_surface(*points.T, **kwargs)
-
-    @_handles(classify.Sphere)
-    def _plot_Sphere(self, os, **kwargs) -> Iterator[Artist]:
-        from trimesh.creation import icosphere
-        kwargs.setdefault('alpha', 0.5)
-        ret = []
-        for o in os:
-            tmesh = icosphere(radius=abs(o.radius))
-            loc = self._as_point_tuple_3d(o.location)
-            t = Triangulation(loc[0] + tmesh.vertices[:, 0], loc[1] + tmesh.vertices[:, 1], triangles=tmesh.faces)
-            yield self._ax.plot_trisurf(t, loc[2] + tmesh.vertices[:, 2], **kwargs)
+@functools.lru_cache(maxsize=None)
+def _unit_circle_vertices(n):
+    """ ``n`` points evenly spaced around the unit circle, of shape ``(n, 2)`` """
+    theta = np.linspace(0, 2*np.pi, n, endpoint=False)
+    vertices = np.stack([np.cos(theta), np.sin(theta)], axis=-1)
+    vertices.flags.writeable = False
+    return vertices
+
+
+class _CircleLevelOfDetail:
+    """
+    Mixin to choose how many vertices each circle is drawn with, from its
+    radius on screen.
+
+    ``vertex_bounds`` is the ``(min, max)`` number of vertices, and between
+    these each edge is kept shorter than ``pixels_per_segment``. Both can be
+    changed on the class, or on a single artist.
+    """
+    vertex_bounds = (8, 128)
+    pixels_per_segment = 4.0
+
+    def _vertex_groups(self, screen_radii):
+        """ Yield ``(n, indices)``, for the circles to draw with ``n`` vertices """
+        lo, hi = self.vertex_bounds
+        n = 2 * np.pi * np.nan_to_num(screen_radii) / self.pixels_per_segment
+        # round up to a power of two, so that only a few templates are needed
+        n = 2 ** np.ceil(np.log2(np.maximum(n, 1)))
+        n = np.clip(n, lo, hi).astype(int)
+        for count in np.unique(n):
+            yield count, np.flatnonzero(n == count)
+
+
+class Circle2DCollection(PolyCollection, _CircleLevelOfDetail):
+    """
+    Many circles in 2D, drawn as polygons with a number of vertices chosen
+    from their size on screen
+
+    Parameters
+    ----------
+    centers : array_like, shape (N, 2)
+    radii : array_like, shape (N,)
+    """
+    def __init__(self, centers, radii, **kwargs):
+        PolyCollection.__init__(self, [], closed=True, **kwargs)
+        self.set_circles(centers, radii)
+
+    def set_circles(self, centers, radii):
+        self._centers = np.asarray(centers, dtype=float).reshape(-1, 2)
+        self._radii = np.asarray(radii, dtype=float)
+        self.stale = True
+
+    def get_datalim(self, transData):
+        if not len(self._radii):
+            return Bbox.null()
+        r = self._radii[:, np.newaxis]
+        return Bbox([np.min(self._centers - r, axis=0), np.max(self._centers + r, axis=0)])
+
+    def draw(self, renderer):
+        c = self._centers
+        r = self._radii
+        # measure along both axes, in case the aspect is not equal
+        center, x, y = self.get_transform().transform(np.concatenate([
+            c, c + r[:, np.newaxis] * [1, 0], c + r[:, np.newaxis] * [0, 1]
+        ])).reshape(3, -1, 2)
+        screen_radii = np.maximum(np.linalg.norm(x - center, axis=-1), np.linalg.norm(y - center, axis=-1))
+
+        polygons = [None] * len(r)
+        for n, idx in self._vertex_groups(screen_radii):
+            vertices = c[idx, np.newaxis] + r[idx, np.newaxis, np.newaxis] * _unit_circle_vertices(n)
+            for i, v in zip(idx, vertices):
+                polygons[i] = v
+        self.set_verts(polygons, closed=True)
+        super().draw(renderer)
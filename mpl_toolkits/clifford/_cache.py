@@ -0,0 +1,90 @@
+"""
+An opt-in cache of classification results, for objects which are plotted
+over and over again.
+"""
+import collections
+
+import numpy as np
+
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class ClassificationCache:
+    """
+    A bounded cache of classified objects, used by the plots it is passed to
+    with ``plot(ax, objs, cache=cache)``.
+
+    Objects are looked up by their layout and coefficients, so ones which are
+    plotted again, such as the parts of an animation which do not move, are
+    only classified the first time. Once more than ``maxsize`` objects are
+    stored, the least recently used are discarded.
+
+    Like :func:`functools.lru_cache`, statistics are available from
+    :meth:`cache_info`.
+
+    Parameters
+    ----------
+    maxsize : int
+        The number of objects to remember.
+    decimals : int, optional
+        If given, coefficients are rounded to this many decimal places before
+        lookup, so that objects differing only by rounding error share an
+        entry, and are all plotted as the first of them to be seen.
+    """
+    def __init__(self, maxsize: int = 4096, decimals: int = None):
+        self.maxsize = maxsize
+        self.decimals = decimals
+        self._entries = collections.OrderedDict()
+        # layouts are looked up by id, so keep them alive to avoid reuse
+        self._layouts = {}
+        self._hits = 0
+        self._misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """ The number of hits and misses so far, and the current and maximum size """
+        return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def cache_clear(self):
+        """ Forget all the stored objects, and reset the statistics """
+        self._entries.clear()
+        self._layouts.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return '{}(maxsize={!r}, decimals={!r})'.format(type(self).__name__, self.maxsize, self.decimals)
+
+    def _keys(self, layout, values):
+        """ The key of each row of an ``(N, layout.gaDims)`` coefficient array """
+        self._layouts.setdefault(id(layout), layout)
+        if self.decimals is not None:
+            # adding zero turns -0.0 into 0.0, so that they compare equal
+            values = np.round(values, self.decimals) + 0.0
+        values = np.ascontiguousarray(values, dtype=float)
+        layout_id = id(layout)
+        return [(layout_id, row.tobytes()) for row in values]
+
+    def _lookup(self, keys):
+        """ The stored entry for each key, or ``None`` where there is none """
+        entries = self._entries
+        found = []
+        for key in keys:
+            entry = entries.get(key)
+            if entry is not None:
+                entries.move_to_end(key)
+            found.append(entry)
+        n_misses = found.count(None)
+        self._misses += n_misses
+        self._hits += len(found) - n_misses
+        return found
+
+    def _store(self, keys, new_entries):
+        entries = self._entries
+        for key, entry in zip(keys, new_entries):
+            entries[key] = entry
+            entries.move_to_end(key)
+        while len(entries) > self.maxsize:
+            entries.popitem(last=False)
@@ -0,0 +1,392 @@
+"""
+Classification of many multivectors at once.
+
+This imports :mod:`clifford`, so is only loaded when something is plotted.
+"""
+import collections
+import functools
+from typing import List, Tuple
+
+import numpy as np
+
+from clifford.tools import classify
+import clifford
+
+from . import _profiling, _groupby
+
+
+@functools.lru_cache(maxsize=None)
+def _type_names(t) -> Tuple[str, ...]:
+    return tuple(c.__name__ for c in t.__mro__)
+
+
+class _BladeGroup:
+    """
+    A collection of classified blades which all have the same type.
+
+    For rounds and flats, the parameters are available as arrays, with
+    ``direction`` and ``location`` holding coefficients of shape
+    ``(N, layout.gaDims)``, and ``radius`` of shape ``(N,)`` (``None`` for
+    flats). Iterating produces the corresponding
+    :class:`clifford.tools.classify.Blade` objects.
+    """
+    def __init__(self, layout, type, blades=None, direction=None, location=None, radius=None):
+        self.layout = layout
+        self.type = type
+        self._blades = blades
+        self._direction = direction
+        self._location = location
+        self._radius = radius
+        # results of the plotters' geometry methods, see `_shared_geometry`
+        self._geometry = {}
+
+    @property
+    def _is_round(self):
+        return issubclass(self.type, classify.Round)
+
+    @property
+    def type_names(self) -> Tuple[str, ...]:
+        """ The names of the type and its bases, which the plotters dispatch on """
+        return _type_names(self.type)
+
+    @property
+    def direction(self) -> np.ndarray:
+        if self._direction is None:
+            with _profiling.timed('geometry', self.type.__name__):
+                self._direction = np.array([o.direction.value for o in self._blades], dtype=float)
+        return self._direction
+
+    @property
+    def location(self) -> np.ndarray:
+        if self._location is None:
+            with _profiling.timed('geometry', self.type.__name__):
+                self._location = np.array([o.location.value for o in self._blades], dtype=float)
+        return self._location
+
+    @property
+    def radius(self) -> np.ndarray:
+        if self._radius is None and self._is_round:
+            with _profiling.timed('geometry', self.type.__name__):
+                self._radius = np.array([o.radius for o in self._blades])
+        return self._radius
+
+    def __len__(self):
+        if self._blades is not None:
+            return len(self._blades)
+        return len(self._direction)
+
+    def __iter__(self):
+        if self._blades is None:
+            self._blades = list(self._make_blades())
+        return iter(self._blades)
+
+    def take(self, rows) -> '_BladeGroup':
+        """ A group of just the objects at the given indices """
+        if self._blades is not None:
+            return _BladeGroup(self.layout, self.type, blades=[self._blades[i] for i in rows])
+        return _BladeGroup(
+            self.layout, self.type, direction=self._direction[rows], location=self._location[rows],
+            radius=None if self._radius is None else self._radius[rows])
+
+    @classmethod
+    def concatenate(cls, groups) -> '_BladeGroup':
+        """ Join groups of the same type into one """
+        first = groups[0]
+        if len(groups) == 1:
+            return first
+        if any(g._blades is not None for g in groups):
+            return cls(first.layout, first.type, blades=[o for g in groups for o in g])
+        return cls(
+            first.layout, first.type,
+            direction=np.concatenate([g._direction for g in groups]),
+            location=np.concatenate([g._location for g in groups]),
+            radius=None if first._radius is None else np.concatenate([g._radius for g in groups]))
+
+    def _make_blades(self):
+        mv = self.layout.MultiVector
+        for i in range(len(self._direction)):
+            direction = mv(self._direction[i])
+            location = mv(self._location[i])
+            if issubclass(self.type, classify.Tangent):
+                yield self.type(direction=direction, location=location)
+            elif self._is_round:
+                r = complex(self._radius[i])
+                yield self.type(direction=direction, location=location, radius=r.real if r.imag == 0 else r)
+            else:
+                yield self.type(direction=direction, location=location)
+
+
+class _Classified(collections.namedtuple(
+        '_Classified', ['types', 'kinds', 'direction', 'location', 'radius', 'others'])):
+    """
+    The classification of each row of a coefficient array.
+
+    ``kinds`` indexes into ``types`` for each row. Rounds and flats have their
+    parameters in the ``direction``, ``location``, and ``radius`` arrays,
+    while ``others`` maps the row of anything else to its classified object.
+    """
+    def entries(self) -> list:
+        """ Split into a ``(type, direction, location, radius, other)`` tuple per row """
+        return [
+            (self.types[k], self.direction[i].copy(), self.location[i].copy(), self.radius[i], self.others.get(i))
+            for i, k in enumerate(self.kinds)
+        ]
+
+    @classmethod
+    def from_entries(cls, entries) -> '_Classified':
+        """ The inverse of :meth:`entries` """
+        types = list(dict.fromkeys(e[0] for e in entries))
+        type_kinds = {t: k for k, t in enumerate(types)}
+        return cls(
+            types=types,
+            kinds=np.array([type_kinds[e[0]] for e in entries]),
+            direction=np.array([e[1] for e in entries]),
+            location=np.array([e[2] for e in entries]),
+            radius=np.array([e[3] for e in entries], dtype=complex),
+            others={i: e[4] for i, e in enumerate(entries) if e[4] is not None},
+        )
+
+    def groups(self, layout) -> List['_BladeGroup']:
+        """ Group the rows by type, in order of first appearance """
+        groups = []
+        unique_kinds, first = np.unique(self.kinds, return_index=True)
+        for k in unique_kinds[np.argsort(first)]:
+            t = self.types[k]
+            rows = np.flatnonzero(self.kinds == k)
+            if issubclass(t, (classify.Round, classify.Flat)):
+                r = self.radius[rows] if issubclass(t, classify.Round) else None
+                if r is not None and not r.imag.any():
+                    r = r.real
+                groups.append(_BladeGroup(
+                    layout, t, direction=self.direction[rows], location=self.location[rows], radius=r))
+            else:
+                groups.append(_BladeGroup(layout, t, blades=[self.others[i] for i in rows]))
+        return groups
+
+
+# the number of objects above which `plot` uses `_BatchClassifier`
+_BATCH_MIN_SIZE = 8
+
+
+class _BatchClassifier:
+    """
+    Vectorized version of :func:`clifford.tools.classify.classify`, acting on
+    an ``(N, layout.gaDims)`` array of coefficients.
+
+    Every operation in ``classify`` is either linear in its argument or a
+    product of two such terms, so these are precomputed as matrices and
+    multiplication tables restricted to the grades involved. Rounds, tangents,
+    and flats are handled here; anything else (directions, dual flats, and
+    values which are not blades) is passed to ``classify`` one at a time, so
+    that results and errors are unchanged.
+    """
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def for_layout(cls, layout):
+        return cls(layout)
+
+    def __init__(self, layout):
+        self._layout = layout
+        einf, eo, E0 = layout.einf.value, layout.eo.value, layout.E0.value
+
+        # multiplication tables, indexed as ``[a, out, b]``
+        def dense(t):
+            return np.asarray(t.todense() if hasattr(t, 'todense') else t, dtype=float)
+        gmt, omt, imt = dense(layout.gmt), dense(layout.omt), dense(layout.imt)
+
+        # matrices for `a op x` and `x op b`, acting on `x`
+        def left(a, table):
+            return np.einsum('i,ikj->kj', a, table)
+
+        def right(table, b):
+            return np.einsum('ikj,j->ki', table, b)
+
+        self._grades = np.asarray(layout.gradeList)
+        # the basis blades are orthogonal, so reversion and squaring are diagonal
+        self._rev = (-1.0)**(self._grades * (self._grades - 1) // 2)
+        self._square = np.diagonal(gmt[:, 0, :]).copy()
+        self._gmt = np.moveaxis(gmt, 1, 2)
+
+        self._y = left(-einf, imt)
+        self._einf_wedge = left(einf, omt)
+        self._eo_dot = left(eo, imt)
+        self._flat_direction = right(imt, -eo) @ self._y
+        self._round_direction = right(imt, -eo) @ right(omt, einf) @ self._y
+
+        # `down(u)` is `D @ u / (h @ u)`, so the normalization of the inverses
+        # used below cancels out
+        down = right(gmt, E0) @ right(omt, E0)
+        self._down_support = np.flatnonzero(down.any(axis=1))
+        self._down = np.vstack([down[self._down_support], -right(imt, einf)[0]])
+
+        self._tables = {}
+
+    def _grade_tables(self, g):
+        try:
+            return self._tables[g]
+        except KeyError:
+            pass
+        sel = np.flatnonzero(self._grades == g)
+        y_sel = np.flatnonzero(self._y[:, sel].any(axis=1))
+        eo_sel = np.flatnonzero(self._eo_dot[:, sel].any(axis=1))
+        wedge_sel = np.flatnonzero(self._einf_wedge[:, sel].any(axis=1))
+
+        # x * x.gradeInvol(), for the outputs which can be non-zero
+        sq_table = self._gmt[np.ix_(sel, sel)] * (-1)**g
+        sq_sel = np.flatnonzero(sq_table.any(axis=(0, 1)))
+
+        t = self._tables[g] = dict(
+            sel=sel,
+            y_sel=y_sel,
+            y=self._y[np.ix_(y_sel, sel)],
+            wedge=self._einf_wedge[np.ix_(wedge_sel, sel)],
+            eo_dot=self._eo_dot[np.ix_(eo_sel, sel)],
+            sq=sq_table[..., sq_sel],
+            sq_scalar=sq_sel == 0,
+            # down(x * ~y)
+            round_loc=self._gmt[np.ix_(sel, y_sel)] @ self._down.T,
+            # down((eo | x) * ~x)
+            flat_loc=self._gmt[np.ix_(eo_sel, sel)] @ self._down.T,
+            round_direction=self._round_direction[:, sel],
+            flat_direction=self._flat_direction[:, sel],
+        )
+        return t
+
+    def _down_from(self, u):
+        loc = np.zeros((len(u), self._layout.gaDims))
+        loc[:, self._down_support] = u[:, :-1] / u[:, -1:]
+        return loc
+
+    def __call__(self, values) -> List['_BladeGroup']:
+        """
+        Classify every row of ``values``, returning one group per type in
+        order of first appearance.
+        """
+        return self.classify_rows(values).groups(self._layout)
+
+    def classify_rows(self, values) -> _Classified:
+        """ Classify every row of ``values``, without grouping them """
+        eps = clifford.eps()
+        values = np.asarray(values, dtype=float)
+        n = len(values)
+        direction = np.zeros_like(values)
+        location = np.zeros_like(values)
+        radius = np.zeros(n, dtype=complex)
+        kinds = np.full(n, -1)
+        types = []
+        type_kinds = {}
+
+        def kind_of(t):
+            try:
+                return type_kinds[t]
+            except KeyError:
+                types.append(t)
+                k = type_kinds[t] = len(types) - 1
+                return k
+
+        nonzero = np.abs(values) > eps
+        n_grades = np.zeros(n, dtype=int)
+        grade = np.zeros(n, dtype=int)
+        for g in np.unique(self._grades):
+            has_g = nonzero[:, self._grades == g].any(axis=1)
+            n_grades += has_g
+            grade[has_g] = g
+
+        for g in np.unique(grade[n_grades == 1]):
+            if g == 0:
+                continue
+            t = self._grade_tables(g)
+            rows = np.flatnonzero((n_grades == 1) & (grade == g))
+            x = values[np.ix_(rows, t['sel'])]
+            y = x @ t['y'].T
+            rad2 = np.einsum('ni,ijk,nj->nk', x, t['sq'], x)
+            is_blade = (np.abs(rad2[:, ~t['sq_scalar']]) < eps).all(axis=1)
+            is_flat = (np.abs(x @ t['wedge'].T) < eps).all(axis=1)
+            is_direction = (np.abs(y) < eps).all(axis=1)
+            rad2 = rad2[:, t['sq_scalar']][:, 0]
+
+            # rounds, using `y.normalInv()`
+            r = np.flatnonzero(is_blade & ~is_direction & ~is_flat)
+            y_r = y[r]
+            y_inv = (y_r**2) @ (self._rev * self._square)[t['y_sel']]
+            r = r[np.abs(y_inv) > eps]
+            y_r = y[r]
+            direction[rows[r]] = x[r] @ t['round_direction'].T
+            location[rows[r]] = self._down_from(
+                np.einsum('ni,ijk,nj->nk', x[r], t['round_loc'], y_r * self._rev[t['y_sel']]))
+            is_tangent = np.abs(rad2[r]) < eps
+            with np.errstate(invalid='ignore', divide='ignore'):
+                rad2_r = rad2[r] / ((y_r**2) @ self._square[t['y_sel']])
+            radius[rows[r]] = np.where(is_tangent, 0, np.sqrt(rad2_r.astype(complex)))
+            kinds[rows[r]] = np.where(is_tangent, kind_of(classify.Tangent[g]), kind_of(classify.Round[g]))
+
+            # flats, using `x.normalInv()`
+            f = np.flatnonzero(is_blade & ~is_direction & is_flat)
+            x_inv = (x[f]**2) @ (self._rev * self._square)[t['sel']]
+            f = f[np.abs(x_inv) > eps]
+            x_f = x[f]
+            direction[rows[f]] = x_f @ t['flat_direction'].T
+            location[rows[f]] = self._down_from(
+                np.einsum('ni,ijk,nj->nk', x_f @ t['eo_dot'].T, t['flat_loc'], x_f * self._rev[t['sel']]))
+            kinds[rows[f]] = kind_of(classify.Flat[g])
+
+        # everything else goes through the scalar implementation
+        others = {}
+        for i in np.flatnonzero(kinds == -1):
+            o = classify.classify(self._layout.MultiVector(values[i]))
+            kinds[i] = kind_of(type(o))
+            if isinstance(o, (classify.Round, classify.Flat)):
+                direction[i] = o.direction.value
+                location[i] = o.location.value
+                radius[i] = getattr(o, 'radius', 0)
+            else:
+                others[i] = o
+
+        return _Classified(types, kinds, direction, location, radius, others)
+
+
+@_profiling.timed_method('classify', lambda *args: 'all')
+def _classify_groups(layout, cga_objs, cache=None) -> List['_BladeGroup']:
+    """
+    Classify the objects, grouping them by type.
+
+    ``cga_objs`` is a sequence of multivectors, or an ``(N, layout.gaDims)``
+    array of their coefficients. If a :class:`~._cache.ClassificationCache`
+    is given, only the objects it does not already hold are classified.
+    """
+    if cache is not None:
+        return _classify_cached(layout, _as_values(cga_objs), cache)
+    if isinstance(cga_objs, np.ndarray) and cga_objs.dtype != object:
+        if len(cga_objs) >= _BATCH_MIN_SIZE:
+            return _BatchClassifier.for_layout(layout)(cga_objs)
+        cga_objs = [layout.MultiVector(v) for v in cga_objs]
+    if len(cga_objs) < _BATCH_MIN_SIZE:
+        all_os = [classify.classify(cga_obj) for cga_obj in cga_objs]
+        return [
+            _BladeGroup(layout, t, blades=os)
+            for t, os in _groupby(all_os, type)
+        ]
+    return _BatchClassifier.for_layout(layout)(_as_values(cga_objs))
+
+
+def _as_values(cga_objs) -> np.ndarray:
+    """ The ``(N, layout.gaDims)`` coefficients of a sequence of multivectors """
+    if isinstance(cga_objs, clifford.MVArray):
+        return cga_objs.value
+    elif isinstance(cga_objs, np.ndarray) and cga_objs.dtype != object:
+        return cga_objs
+    return np.array([cga_obj.value for cga_obj in cga_objs], dtype=float)
+
+
+def _classify_cached(layout, values, cache) -> List['_BladeGroup']:
+    keys = cache._keys(layout, values)
+    entries = cache._lookup(keys)
+    missing = [i for i, e in enumerate(entries) if e is None]
+    if missing:
+        # even a few objects go through the batch classifier, which gives
+        # results in the form that is stored
+        new_entries = _BatchClassifier.for_layout(layout).classify_rows(values[missing]).entries()
+        cache._store([keys[i] for i in missing], new_entries)
+        for i, e in zip(missing, new_entries):
+            entries[i] = e
+    return _Classified.from_entries(entries).groups(layout)
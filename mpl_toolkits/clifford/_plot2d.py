@@ -0,0 +1,227 @@
+"""
+Plotting of classified objects onto 2D axes.
+"""
+from typing import Iterator
+
+from matplotlib.artist import Artist
+from matplotlib.collections import LineCollection
+
+import numpy as np
+
+from . import (
+    _profiling, _append_linestyles, _group_name, _line_styles_for_radii, _normalized, _pop_marker_kwargs,
+    _shared_geometry, Circle2DCollection, InfiniteLine2DCollection,
+)
+from ._plotter import _Plotter
+
+
+class _Plotter2d(_Plotter):
+    _handlers = {}
+    _updaters = {}
+    _extenders = {}
+
+    def _handles(t, _handlers=_handlers):
+        def decorator(f):
+            _handlers[t] = f
+            return f
+        return decorator
+
+    def _updates(t, _updaters=_updaters):
+        def decorator(f):
+            _updaters[t] = f
+            return f
+        return decorator
+
+    def _extends(t, _extenders=_extenders):
+        def decorator(f):
+            _extenders[t] = f
+            return f
+        return decorator
+
+    @_handles('Point')
+    def _plot_Point(self, os, **kwargs) -> Iterator[Artist]:
+        x, y = self._as_point_array(os.location).T
+        yield from self._ax.plot(x, y, **kwargs)
+
+    @_updates('Point')
+    def _update_Point(self, artists, os, **kwargs) -> bool:
+        line, = artists
+        line.set_data(*self._as_point_array(os.location).T)
+        return True
+
+    @_extends('Point')
+    def _extend_Point(self, artists, os, **kwargs) -> bool:
+        new = self._as_point_array(os.location)
+        self._stage(artists, _join_points, new)
+        self._include(new)
+        return True
+
+    @_handles('Tangent[2]')
+    def _plot_Tangent(self, os, **kwargs) -> Iterator[Artist]:
+        loc = self._as_point_array(os.location)
+        d = _normalized(self._as_point_array(os.direction))
+        yield self._quiver(loc, d, **kwargs)
+
+    def _quiver(self, loc, d, **kwargs):
+        return self._ax.quiver(
+            *loc.T, *d.T, angles='xy', scale_units='xy', scale=1,
+            **{k: kwargs[k] for k in ('color', 'alpha') if k in kwargs}
+        )
+
+    @_updates('Tangent[2]')
+    def _update_Tangent(self, artists, os, **kwargs) -> bool:
+        q, = artists
+        if q.N != len(os):
+            return False
+        q.set_offsets(self._as_point_array(os.location))
+        q.set_UVC(*_normalized(self._as_point_array(os.direction)).T)
+        return True
+
+    @_extends('Tangent[2]')
+    def _extend_Tangent(self, artists, os, **kwargs) -> bool:
+        # a quiver cannot change its number of arrows, and sizes them by how
+        # many there are, so replace it with one showing them all
+        def finish(artists, chunks):
+            q, = artists
+            loc, d = zip(*chunks)
+            loc = np.concatenate([q.get_offsets(), *loc])
+            d = np.concatenate([np.column_stack([q.U, q.V]), *d])
+            q.remove()
+            artists[:] = [self._quiver(loc, d, **kwargs)]
+
+        self._stage(
+            artists, finish, self._as_point_array(os.location), _normalized(self._as_point_array(os.direction)))
+        return True
+
+    @_shared_geometry
+    @_profiling.timed_method('geometry', _group_name)
+    def _point_pair_ends(self, os):
+        """ The end points of each point pair, of shape ``(N, 2, dims)`` """
+        d = _normalized(self._as_point_array(os.direction))
+        loc = self._as_point_array(os.location)
+        r = np.abs(os.radius)[:, np.newaxis]
+        return np.stack([loc - r * d, loc + r * d], axis=1)
+
+    @_handles('PointPair')
+    def _plot_PointPair(self, os, **kwargs) -> Iterator[Artist]:
+        ends = self._point_pair_ends(os)
+
+        marker_kwargs = _pop_marker_kwargs(kwargs)
+        col = LineCollection(ends, linestyles=_line_styles_for_radii(os.radius), **kwargs)
+        self._ax.add_collection(col, autolim=False)
+        self._include(ends)
+        yield col
+
+        # collections cannot draw markers, so add them separately
+        if 'marker' in marker_kwargs:
+            yield from self._ax.plot(
+                *ends.reshape(-1, 2).T, linestyle='none',
+                **{k: kwargs[k] for k in ('color', 'alpha') if k in kwargs},
+                **marker_kwargs
+            )
+
+    @_updates('PointPair')
+    def _update_PointPair(self, artists, os, **kwargs) -> bool:
+        ends = self._point_pair_ends(os)
+        col, *markers = artists
+        col.set_segments(ends)
+        col.set_linestyle(_line_styles_for_radii(os.radius))
+        for m in markers:
+            m.set_data(*ends.reshape(-1, 2).T)
+        return True
+
+    @_extends('PointPair')
+    def _extend_PointPair(self, artists, os, **kwargs) -> bool:
+        ends = self._point_pair_ends(os)
+        self._stage(artists, _join_point_pairs, ends, _line_styles_for_radii(os.radius))
+        self._include(ends)
+        return True
+
+    @_handles('Line')
+    def _plot_Line(self, os, **kwargs) -> Iterator[Artist]:
+        # collections cannot draw markers, and the ends of a line are off screen anyway
+        _pop_marker_kwargs(kwargs)
+        col = InfiniteLine2DCollection(
+            self._as_point_array(os.location),
+            self._as_point_array(os.direction),
+            **kwargs
+        )
+        self._ax.add_collection(col, autolim=False)
+        yield col
+
+    @_updates('Line')
+    def _update_Line(self, artists, os, **kwargs) -> bool:
+        col, = artists
+        col.set_lines(self._as_point_array(os.location), self._as_point_array(os.direction))
+        return True
+
+    @_extends('Line')
+    def _extend_Line(self, artists, os, **kwargs) -> bool:
+        self._stage(artists, _join_lines, self._as_point_array(os.location), self._as_point_array(os.direction))
+        return True
+
+    @_handles('Circle')
+    def _plot_Circle(self, os, **kwargs) -> Iterator[Artist]:
+        # adjust the color arguments to make sense
+        kwargs.setdefault('facecolors', 'none')
+        try:
+            color = kwargs.pop('color')
+        except KeyError:
+            raise
+        else:
+            kwargs['edgecolors'] = color
+        centers, radii = self._circle_params(os)
+        col = Circle2DCollection(centers, radii, linestyles=_line_styles_for_radii(os.radius), **kwargs)
+        self._ax.add_collection(col, autolim=False)
+        self._include(centers, radii[:, np.newaxis])
+        yield col
+
+    @_shared_geometry
+    @_profiling.timed_method('geometry', _group_name)
+    def _circle_params(self, os):
+        return self._as_point_array(os.location), np.abs(os.radius)
+
+    @_updates('Circle')
+    def _update_Circle(self, artists, os, **kwargs) -> bool:
+        col, = artists
+        col.set_circles(*self._circle_params(os))
+        col.set_linestyle(_line_styles_for_radii(os.radius))
+        return True
+
+    @_extends('Circle')
+    def _extend_Circle(self, artists, os, **kwargs) -> bool:
+        centers, radii = self._circle_params(os)
+        self._stage(artists, _join_circles, centers, radii, _line_styles_for_radii(os.radius))
+        self._include(centers, radii[:, np.newaxis])
+        return True
+
+
+# the functions which add the chunks staged by the extenders to the artists
+
+def _join_points(artists, chunks):
+    line, = artists
+    line.set_data(*np.concatenate([np.column_stack(line.get_data())] + [new for new, in chunks]).T)
+
+
+def _join_point_pairs(artists, chunks):
+    col, *markers = artists
+    ends, linestyles = zip(*chunks)
+    segments = col.get_segments()
+    col.set_segments(segments + [e for es in ends for e in es])
+    _append_linestyles(col, len(segments), [ls for lss in linestyles for ls in lss])
+    for m in markers:
+        m.set_data(*np.concatenate([np.column_stack(m.get_data())] + [es.reshape(-1, 2) for es in ends]).T)
+
+
+def _join_lines(artists, chunks):
+    col, = artists
+    origins, directions = zip(*chunks)
+    col.set_lines(np.concatenate([col._origins, *origins]), np.concatenate([col._directions, *directions]))
+
+
+def _join_circles(artists, chunks):
+    col, = artists
+    centers, radii, linestyles = zip(*chunks)
+    n = len(col._radii)
+    col.set_circles(np.concatenate([col._centers, *centers]), np.concatenate([col._radii, *radii]))
+    _append_linestyles(col, n, [ls for lss in linestyles for ls in lss])
@@ -0,0 +1,999 @@
+"""
+3D artists, and plotting of classified objects onto 3D axes.
+
+This imports :mod:`mpl_toolkits.mplot3d`, so is only loaded when needed.
+"""
+import functools
+from typing import Iterator
+
+from matplotlib import rcParams
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import LightSource, to_rgba, to_rgba_array
+from matplotlib.patches import FancyArrowPatch, Patch
+from matplotlib.path import Path
+from mpl_toolkits.mplot3d import proj3d, art3d
+
+import numpy as np
+
+from . import (
+    _profiling, _append_linestyles, _artist_name, _unit_circle_vertices, _CircleLevelOfDetail, _group_name,
+    _shared_geometry, _line_styles_for_radii, _normalized, _plane_frames, _pop_marker_kwargs,
+    _InfiniteLine, _InfiniteLineCollection, _ray_box_intersection, _ray_box_intersections,
+)
+from ._plotter import _Plotter
+
+
+@functools.lru_cache(maxsize=None)
+def _unit_icosphere(subdivisions=3):
+    """
+    The triangles of a unit icosphere, of shape ``(F, 3, 3)``, and their unit
+    normals, of shape ``(F, 3)``
+    """
+    t = (1 + np.sqrt(5)) / 2
+    vertices = np.array([
+        [-1, t, 0], [1, t, 0], [-1, -t, 0], [1, -t, 0],
+        [0, -1, t], [0, 1, t], [0, -1, -t], [0, 1, -t],
+        [t, 0, -1], [t, 0, 1], [-t, 0, -1], [-t, 0, 1],
+    ])
+    faces = np.array([
+        [0, 11, 5], [0, 5, 1], [0, 1, 7], [0, 7, 10], [0, 10, 11],
+        [1, 5, 9], [5, 11, 4], [11, 10, 2], [10, 7, 6], [7, 1, 8],
+        [3, 9, 4], [3, 4, 2], [3, 2, 6], [3, 6, 8], [3, 8, 9],
+        [4, 9, 5], [2, 4, 11], [6, 2, 10], [8, 6, 7], [9, 8, 1],
+    ])
+    triangles = _normalized(vertices[faces])
+    for _ in range(subdivisions):
+        # split each triangle into four, pushing the edge midpoints out onto the sphere
+        a, b, c = triangles.transpose(1, 0, 2)
+        ab, bc, ca = _normalized(a + b), _normalized(b + c), _normalized(c + a)
+        triangles = np.stack([
+            np.stack([a, ab, ca], axis=1),
+            np.stack([ab, b, bc], axis=1),
+            np.stack([ca, bc, c], axis=1),
+            np.stack([ab, bc, ca], axis=1),
+        ], axis=1).reshape(-1, 3, 3)
+    normals = _normalized(triangles.mean(axis=1))
+    triangles.flags.writeable = False
+    normals.flags.writeable = False
+    return triangles, normals
+
+
+def _shade_colors(color, normals):
+    """
+    Shade colors by face normals, in the same way as ``plot_trisurf``.
+    ``color`` is either a single color, or one for each normal.
+    """
+    light = LightSource(azdeg=225, altdeg=19.4712).direction
+    shade = normals @ light
+    rgba = to_rgba_array(color)
+    colors = rgba * (0.3 + 0.7 * (shade[:, np.newaxis] + 1) / 2)
+    colors[:, 3] = rgba[:, 3]
+    return colors
+
+
+class InfiniteLine3DCollection(art3d.Line3DCollection, _InfiniteLineCollection):
+    """ Many infinite lines in 3D, clipped to the axes each time they are projected """
+    def __init__(self, origins, directions, *args, **kwargs):
+        art3d.Line3DCollection.__init__(self, [], *args, **kwargs)
+        _InfiniteLineCollection.__init__(self, origins, directions)
+
+    @_profiling.timed_method('project', _artist_name)
+    def do_3d_projection(self, *args, **kwargs):
+        mins, maxs = np.array([
+            self.axes.get_xbound(),
+            self.axes.get_ybound(),
+            self.axes.get_zbound(),
+        ]).T
+        self.set_segments(_ray_box_intersections(self._origins, self._directions, mins, maxs))
+        return super().do_3d_projection(*args, **kwargs)
+
+
+class InfiniteLine3D(art3d.Line3D, _InfiniteLine):
+    def __init__(self, origin, direction, *args, **kwargs):
+        art3d.Line3D.__init__(self, [], [], [], *args, **kwargs)
+        _InfiniteLine.__init__(self, origin, direction)
+
+    def draw(self, renderer):
+        mins, maxs = np.array([
+            self.axes.get_xbound(),
+            self.axes.get_ybound(),
+            self.axes.get_zbound(),
+        ]).T
+        points = _ray_box_intersection(self._origin, self._direction, mins, maxs)
+        self._verts3d = points.T
+        super().draw(renderer)
+
+
+class Arrow3D(FancyArrowPatch):
+    def __init__(self, posA, posB, *args, **kwargs):
+        FancyArrowPatch.__init__(self, (0,0), (0,0), *args, **kwargs)
+        self._posA_3d = posA
+        self._posB_3d = posB
+
+    @_profiling.timed_method('project', _artist_name)
+    def do_3d_projection(self, renderer=None):
+        xs3d, ys3d, zs3d = zip(self._posA_3d, self._posB_3d)
+        xs, ys, zs = proj3d.proj_transform(xs3d, ys3d, zs3d, self.axes.M)
+        self.set_positions((xs[0],ys[0]),(xs[1],ys[1]))
+        return min(zs)
+
+
+class Arrow3DCollection(LineCollection):
+    """
+    Many arrows in 3D, which are all projected at once when drawn
+
+    Each arrow is a shaft with an open head, as drawn by :class:`Arrow3D`
+    with ``arrowstyle='->'``. The head is sized in points, as
+    ``head_length`` and ``head_width`` times ``mutation_scale``, which can
+    be changed on the class, or on a single artist.
+
+    Parameters
+    ----------
+    tails, heads : array_like, shape (N, 3)
+    mutation_scale : float
+    """
+    head_length = 0.4
+    head_width = 0.2
+
+    # the shaft, then the head, with its tip in the middle
+    _codes = np.array([Path.MOVETO, Path.LINETO, Path.MOVETO, Path.LINETO, Path.LINETO], dtype=Path.code_type)
+
+    def __init__(self, tails, heads, mutation_scale=10, **kwargs):
+        # as thin as the lines of an `Arrow3D`
+        if not {'linewidth', 'linewidths', 'lw'} & kwargs.keys():
+            kwargs['linewidths'] = rcParams['patch.linewidth']
+        LineCollection.__init__(self, [], **kwargs)
+        self.mutation_scale = mutation_scale
+        self.set_arrows(tails, heads)
+
+    def set_arrows(self, tails, heads):
+        self._tails = np.asarray(tails, dtype=float).reshape(-1, 3)
+        self._heads = np.asarray(heads, dtype=float).reshape(-1, 3)
+        self.stale = True
+
+    @_profiling.timed_method('project', _artist_name)
+    def do_3d_projection(self, renderer=None):
+        n = len(self._tails)
+        xs, ys, zs = proj3d.proj_transform(*np.concatenate([self._tails, self._heads]).T, self.axes.M)
+        # the heads are sized on screen, so work in pixels
+        trans = self.get_transform()
+        tails, heads = trans.transform(np.column_stack([xs, ys])).reshape(2, n, 2)
+
+        back = tails - heads
+        size = self.mutation_scale * self.figure.dpi / 72
+        with np.errstate(invalid='ignore', divide='ignore'):
+            back *= self.head_length * size / np.linalg.norm(back, axis=-1, keepdims=True)
+        t = np.arctan2(self.head_width, self.head_length)
+        rotations = np.array([[[np.cos(t), s * np.sin(t)], [-s * np.sin(t), np.cos(t)]] for s in (1, -1)])
+        barbs = heads + back @ rotations
+
+        vertices = np.stack([tails, heads, barbs[0], heads, barbs[1]], axis=1)
+        vertices = trans.inverted().transform(vertices.reshape(-1, 2)).reshape(n, 5, 2)
+        self._paths = [Path(v, self._codes) for v in vertices]
+        return np.min(zs) if n else np.nan
+
+
+class Circle3D(Patch):
+    """
+    A single circle in 3D, stored as just its center, radius and orientation
+
+    The vertices are expanded from the unit circle template shared by every
+    instance only while the circle is projected and drawn. For many circles,
+    :class:`Circle3DCollection` is far more compact, as it avoids the cost
+    of a patch for each one.
+
+    Parameters
+    ----------
+    center : array_like, shape (3,)
+    radius : float
+    matrix : array_like, shape (3, 2)
+        The linear map taking the plane of the unit circle to the plane of
+        the circle.
+    dtype : optional
+        The dtype to store the geometry with, ``float32`` to halve its size.
+        By default this is the ``dtype`` attribute of the class.
+    """
+    dtype = np.float64
+
+    # shared by every instance, so never written to
+    _template = Path.unit_circle()
+    _empty_path = Path(np.zeros((0, 2)))
+
+    def __init__(self, center, radius, matrix, dtype=None, **kwargs):
+        Patch.__init__(self, **kwargs)
+        if dtype is not None:
+            self.dtype = dtype
+        self.radius = radius
+        self._center = np.asarray(center, dtype=self.dtype)
+        self._matrix = np.asarray(matrix, dtype=self.dtype)
+        self._path2d = self._empty_path
+
+    @property
+    def nbytes(self) -> int:
+        """ The size of the stored geometry, in bytes """
+        return self._center.nbytes + self._matrix.nbytes + np.dtype(self.dtype).itemsize
+
+    def get_path(self):
+        return self._path2d
+
+    @_profiling.timed_method('project', _artist_name)
+    def do_3d_projection(self, renderer=None):
+        t = self._template
+        s = self._center + self.radius * (t.vertices @ self._matrix.T)
+        vxs, vys, vzs = proj3d.proj_transform(*s.T, self.axes.M)
+        self._path2d = Path(np.column_stack([vxs, vys]), t.codes)
+        return min(vzs)
+
+    def draw(self, renderer):
+        super().draw(renderer)
+        # the path depends on the view, and is made again by the next projection
+        self._path2d = self._empty_path
+
+
+def _screen_radii(axes, centers, offsets):
+    """
+    Approximate radii in pixels of objects once projected, from their
+    ``(N, 3)`` centers and ``(N, k, 3)`` offsets from the center to the rim
+    """
+    points = np.concatenate([centers[:, np.newaxis], centers[:, np.newaxis] + offsets], axis=1)
+    xs, ys, _ = proj3d.proj_transform(*points.reshape(-1, 3).T, axes.M)
+    screen = axes.transData.transform(np.column_stack([xs, ys])).reshape(points.shape[:-1] + (2,))
+    return np.max(np.linalg.norm(screen[:, 1:] - screen[:, :1], axis=-1), axis=-1)
+
+
+class Circle3DCollection(PolyCollection, _CircleLevelOfDetail):
+    """
+    Many circles in 3D, which are all projected at once when drawn, with a
+    number of vertices chosen from their size on screen
+
+    Parameters
+    ----------
+    centers : array_like, shape (N, 3)
+    radii : array_like, shape (N,)
+    matrices : array_like, shape (N, 3, 2)
+        The linear map taking the plane of the unit circle to the plane of
+        each circle.
+    dtype : optional
+        The dtype to store the geometry with, ``float32`` to halve its size.
+        By default this is the ``dtype`` attribute of the class.
+
+    Only these 10 numbers are kept for each circle. The polygons drawn are
+    made from shared templates when the circles are projected, and
+    released again once they have been drawn.
+    """
+    dtype = np.float64
+
+    def __init__(self, centers, radii, matrices, dtype=None, **kwargs):
+        PolyCollection.__init__(self, [], closed=True, **kwargs)
+        if dtype is not None:
+            self.dtype = dtype
+        self.set_circles(centers, radii, matrices)
+
+    def set_circles(self, centers, radii, matrices):
+        self._centers = np.asarray(centers, dtype=self.dtype).reshape(-1, 3)
+        self._radii = np.asarray(radii, dtype=self.dtype)
+        # the images of the x and y axes of the unit circle, shape (N, 2, 3)
+        self._axes3d = np.swapaxes(np.asarray(matrices, dtype=self.dtype), -1, -2)
+        self.stale = True
+
+    @property
+    def nbytes(self) -> int:
+        """ The size of the stored geometry, in bytes """
+        return self._centers.nbytes + self._radii.nbytes + self._axes3d.nbytes
+
+    @_profiling.timed_method('project', _artist_name)
+    def do_3d_projection(self, renderer=None):
+        c = self._centers
+        r = self._radii
+        screen_radii = _screen_radii(self.axes, c, r[:, np.newaxis, np.newaxis] * self._axes3d)
+
+        polygons = [None] * len(r)
+        zmin = np.nan
+        for n, idx in self._vertex_groups(screen_radii):
+            s = c[idx, np.newaxis] + r[idx, np.newaxis, np.newaxis] * (_unit_circle_vertices(n) @ self._axes3d[idx])
+            xs, ys, zs = proj3d.proj_transform(*s.reshape(-1, 3).T, self.axes.M)
+            for i, v in zip(idx, np.stack([xs, ys], axis=-1).reshape(len(idx), n, 2)):
+                polygons[i] = v
+            zmin = np.fmin(zmin, np.min(zs))
+        self.set_verts(polygons, closed=True)
+        return zmin
+
+    def draw(self, renderer):
+        super().draw(renderer)
+        # the polygons depend on the view, and are made again by the next projection
+        self._paths = []
+
+
+# the corners of the unit cube, and the pairs of them joined by its edges
+_CUBE_CORNERS = np.array([[(i >> k) & 1 for k in range(3)] for i in range(8)], dtype=float)
+_CUBE_EDGES = np.array([(i, i | 1 << k) for i in range(8) for k in range(3) if not i & 1 << k])
+
+
+def _clip_planes(origins, normals, mins, maxs):
+    """
+    The convex polygons where planes cross a box, as a list of ``(k, 3)``
+    vertices in order around each polygon. ``k`` is at most 6, and less
+    than 3 for planes which miss the box or only touch it.
+    """
+    corners = mins + _CUBE_CORNERS * (maxs - mins)
+    # signed distance of each corner from each plane
+    dist = corners @ normals.T - np.sum(origins * normals, axis=-1)
+    s0, s1 = dist[_CUBE_EDGES[:, 0]].T, dist[_CUBE_EDGES[:, 1]].T
+    valid = (s0 * s1 <= 0) & (s0 != s1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t = np.where(valid, s0 / (s0 - s1), 0)
+    c0, c1 = corners[_CUBE_EDGES[:, 0]], corners[_CUBE_EDGES[:, 1]]
+    points = c0 + t[..., np.newaxis] * (c1 - c0)
+
+    # sort the crossings by angle about their centroid, with unused ones last
+    count = valid.sum(axis=-1)
+    center = np.sum(points * valid[..., np.newaxis], axis=1) / np.maximum(count, 1)[:, np.newaxis]
+    uv = np.einsum('nki,nij->nkj', points - center[:, np.newaxis], _plane_frames(normals))
+    angle = np.where(valid, np.arctan2(uv[..., 1], uv[..., 0]), np.inf)
+    order = np.argsort(angle, axis=-1)
+    points = np.take_along_axis(points, order[..., np.newaxis], axis=1)
+    valid = np.take_along_axis(valid, order, axis=1)
+
+    # a plane through a corner crosses every edge meeting there
+    valid[:, 1:] &= ~np.all(np.isclose(points[:, 1:], points[:, :-1]), axis=-1)
+    order = np.argsort(~valid, axis=-1, kind='stable')[:, :6]
+    polygons = np.take_along_axis(points, order[..., np.newaxis], axis=1)
+    # ragged, as older matplotlib cannot draw masked vertices
+    return [polygon[:k] for polygon, k in zip(polygons, valid.sum(axis=-1))]
+
+
+class Plane3DCollection(art3d.Poly3DCollection):
+    """
+    Many planes in 3D, each drawn as the polygon where it crosses the axes
+    box, which is recomputed only when the limits change
+
+    Parameters
+    ----------
+    origins : array_like, shape (N, 3)
+        A point on each plane
+    normals : array_like, shape (N, 3)
+        The unit normal of each plane
+    colors : color or list of color
+        The color of each plane, before shading
+    """
+    def __init__(self, origins, normals, colors, **kwargs):
+        art3d.Poly3DCollection.__init__(self, [], **kwargs)
+        self.set_planes(origins, normals, colors)
+
+    def set_planes(self, origins, normals, colors=None):
+        self._origins = np.asarray(origins, dtype=float).reshape(-1, 3)
+        self._normals = np.asarray(normals, dtype=float).reshape(-1, 3)
+        if colors is not None:
+            self._colors = np.broadcast_to(to_rgba_array(colors), (len(self._normals), 4))
+        self.set_facecolor(_shade_colors(self._colors, self._normals))
+        self._bounds = None
+        self.stale = True
+
+    @_profiling.timed_method('project', _artist_name)
+    def do_3d_projection(self, *args, **kwargs):
+        bounds = np.array([self.axes.get_xbound(), self.axes.get_ybound(), self.axes.get_zbound()]).T
+        if self._bounds is None or not np.array_equal(bounds, self._bounds):
+            self._bounds = bounds
+            self.set_verts(_clip_planes(self._origins, self._normals, *bounds))
+        return super().do_3d_projection(*args, **kwargs)
+
+
+class Sphere3DCollection(art3d.Poly3DCollection):
+    """
+    Many spheres in 3D, drawn as a single shaded triangle mesh
+
+    Each sphere is an icosphere, subdivided more the larger it appears on
+    screen. ``subdivision_bounds`` is the ``(min, max)`` number of
+    subdivisions, and between these each triangle edge is kept shorter than
+    ``pixels_per_edge``. Both can be changed on the class, or on a single
+    artist.
+
+    Parameters
+    ----------
+    centers : array_like, shape (N, 3)
+    radii : array_like, shape (N,)
+    color : color
+        The color of every sphere, before shading
+    """
+    subdivision_bounds = (0, 3)
+    pixels_per_edge = 8.0
+
+    def __init__(self, centers, radii, color, **kwargs):
+        art3d.Poly3DCollection.__init__(self, [], **kwargs)
+        self._color = color
+        self.set_spheres(centers, radii)
+
+    def set_spheres(self, centers, radii):
+        self._centers = np.asarray(centers, dtype=float).reshape(-1, 3)
+        self._radii = np.asarray(radii, dtype=float)
+        # the real subdivisions are only known once projected
+        self._subdivisions = None
+        self._set_subdivisions(np.full(len(self._radii), self.subdivision_bounds[0]))
+
+    def _set_subdivisions(self, subdivisions):
+        if self._subdivisions is not None and np.array_equal(subdivisions, self._subdivisions):
+            return
+        self._subdivisions = subdivisions
+        verts, colors = _sphere_triangles(self._centers, self._radii, subdivisions, self._color)
+        self.set_verts(verts)
+        self.set_facecolor(colors)
+
+    @_profiling.timed_method('project', _artist_name)
+    def do_3d_projection(self, *args, **kwargs):
+        self._set_subdivisions(_sphere_subdivisions(
+            self.axes, self._centers, self._radii, self.subdivision_bounds, self.pixels_per_edge))
+        return super().do_3d_projection(*args, **kwargs)
+
+
+def _sphere_subdivisions(axes, centers, radii, bounds, pixels_per_edge):
+    """ The number of times to subdivide the icosphere of each sphere """
+    screen_radii = _screen_radii(axes, centers, radii[:, np.newaxis, np.newaxis] * np.eye(3))
+    lo, hi = bounds
+    # each subdivision halves the edges, which start at about 1.05 times the radius
+    levels = np.ceil(np.log2(np.maximum(1.05 * np.nan_to_num(screen_radii) / pixels_per_edge, 1)))
+    return np.clip(levels, lo, hi).astype(int)
+
+
+def _sphere_triangles(centers, radii, subdivisions, color):
+    """ The ``(F, 3, 3)`` triangles of the spheres, and their shaded ``(F, 4)`` colors """
+    verts = [np.zeros((0, 3, 3))]
+    colors = [np.zeros((0, 4))]
+    for level in np.unique(subdivisions):
+        idx = np.flatnonzero(subdivisions == level)
+        triangles, normals = _unit_icosphere(int(level))
+        v = centers[idx, np.newaxis, np.newaxis] + radii[idx, np.newaxis, np.newaxis, np.newaxis] * triangles
+        verts.append(v.reshape(-1, 3, 3))
+        colors.append(np.tile(_shade_colors(color, normals), (len(idx), 1)))
+    return np.concatenate(verts), np.concatenate(colors)
+
+
+class Scene3DCollection(art3d.Poly3DCollection):
+    """
+    The surfaces of many plots on one 3D axes, drawn as a single collection
+    of triangles.
+
+    Rather than each plane or sphere being projected and depth sorted as a
+    whole, every triangle is sorted against every other, so surfaces which
+    pass through each other are drawn correctly, with one projection per
+    draw however many objects there are. Objects are plotted into the scene
+    of their axes with ``plot(ax, objs, scene=True)``.
+    """
+    def __init__(self, **kwargs):
+        kwargs.setdefault('linewidths', 0)
+        art3d.Poly3DCollection.__init__(self, [], **kwargs)
+        self._parts = []
+        self._part_triangles = []
+
+    @classmethod
+    def _for_axes(cls, ax) -> 'Scene3DCollection':
+        """ The scene of ``ax``, creating it if needed """
+        for c in ax.collections:
+            if isinstance(c, cls):
+                return c
+        scene = cls()
+        ax.add_collection3d(scene, autolim=False)
+        return scene
+
+    def _add_part(self, part):
+        self._parts.append(part)
+        self.stale = True
+
+    def _remove_part(self, part):
+        self._parts.remove(part)
+        self.stale = True
+
+    @_profiling.timed_method('project', _artist_name)
+    def do_3d_projection(self, *args, **kwargs):
+        triangles = [p._triangles(self.axes) for p in self._parts if p.get_visible()]
+        # the parts return the same arrays until they change
+        if len(triangles) != len(self._part_triangles) or any(
+                a is not b for t, old in zip(triangles, self._part_triangles) for a, b in zip(t, old)):
+            self._part_triangles = triangles
+            self.set_verts(np.concatenate([np.zeros((0, 3, 3))] + [v for v, _ in triangles]))
+            self.set_facecolor(np.concatenate([np.zeros((0, 4))] + [c for _, c in triangles]))
+        return super().do_3d_projection(*args, **kwargs)
+
+
+class _ScenePart(Artist):
+    """
+    Triangles which are drawn by a :class:`Scene3DCollection`, rather than
+    by themselves
+    """
+    def __init__(self, scene):
+        Artist.__init__(self)
+        self._scene = scene
+        self.axes = scene.axes
+        self._remove_method = scene._remove_part
+        scene._add_part(self)
+
+    def _changed(self):
+        self._scene.stale = True
+
+    def _triangles(self, axes):
+        """ The ``(F, 3, 3)`` triangles and their ``(F, 4)`` colors """
+        raise NotImplementedError
+
+    def draw(self, renderer):
+        pass
+
+
+class _SceneTriangles(_ScenePart):
+    """ Fixed triangles in a scene """
+    def __init__(self, scene, triangles, colors):
+        _ScenePart.__init__(self, scene)
+        self.set_triangles(triangles, colors)
+
+    def set_triangles(self, triangles, colors):
+        self._verts = np.asarray(triangles, dtype=float).reshape(-1, 3, 3)
+        self._colors = np.broadcast_to(to_rgba_array(colors), (len(self._verts), 4))
+        self._changed()
+
+    def _triangles(self, axes):
+        return self._verts, self._colors
+
+
+class _SceneSpheres(_ScenePart):
+    """ Spheres in a scene, tessellated like :class:`Sphere3DCollection` """
+    def __init__(self, scene, centers, radii, color):
+        _ScenePart.__init__(self, scene)
+        self._color = color
+        self.set_spheres(centers, radii)
+
+    def set_spheres(self, centers, radii):
+        self._centers = np.asarray(centers, dtype=float).reshape(-1, 3)
+        self._radii = np.asarray(radii, dtype=float)
+        self._subdivisions = None
+        self._mesh = None
+        self._changed()
+
+    def _triangles(self, axes):
+        subdivisions = _sphere_subdivisions(
+            axes, self._centers, self._radii,
+            Sphere3DCollection.subdivision_bounds, Sphere3DCollection.pixels_per_edge)
+        if self._mesh is None or not np.array_equal(subdivisions, self._subdivisions):
+            self._subdivisions = subdivisions
+            self._mesh = _sphere_triangles(self._centers, self._radii, subdivisions, self._color)
+        return self._mesh
+
+
+class _ScenePlanes(_ScenePart):
+    """ Planes in a scene, clipped to the axes like :class:`Plane3DCollection` """
+    def __init__(self, scene, origins, normals, colors):
+        _ScenePart.__init__(self, scene)
+        self.set_planes(origins, normals, colors)
+
+    def set_planes(self, origins, normals, colors):
+        self._origins = np.asarray(origins, dtype=float).reshape(-1, 3)
+        self._normals = np.asarray(normals, dtype=float).reshape(-1, 3)
+        self._colors = np.broadcast_to(to_rgba_array(colors), (len(self._normals), 4))
+        self._shaded = _shade_colors(self._colors, self._normals)
+        self._bounds = None
+        self._changed()
+
+    def _triangles(self, axes):
+        bounds = np.array([axes.get_xbound(), axes.get_ybound(), axes.get_zbound()]).T
+        if self._bounds is None or not np.array_equal(bounds, self._bounds):
+            self._bounds = bounds
+            polygons = _clip_planes(self._origins, self._normals, *bounds)
+            # a fan of triangles about the centroid of each polygon, each
+            # split further so that they sort well against other surfaces
+            verts, colors = [np.zeros((0, 3, 3))], [np.zeros((0, 4))]
+            for polygon, color in zip(polygons, self._shaded):
+                if len(polygon) < 3:
+                    continue
+                center = np.broadcast_to(polygon.mean(axis=0), polygon.shape)
+                fan = _subdivide_triangles(np.stack([center, polygon, np.roll(polygon, -1, axis=0)], axis=1), 3)
+                verts.append(fan)
+                colors.append(np.broadcast_to(color, (len(fan), 4)))
+            self._mesh = np.concatenate(verts), np.concatenate(colors)
+        return self._mesh
+
+
+def _subdivide_triangles(triangles, n):
+    """ Split each of ``(F, 3, 3)`` triangles into four, ``n`` times over """
+    for _ in range(n):
+        a, b, c = triangles.transpose(1, 0, 2)
+        ab, bc, ca = (a + b) / 2, (b + c) / 2, (c + a) / 2
+        triangles = np.stack([
+            np.stack([a, ab, ca], axis=1),
+            np.stack([ab, b, bc], axis=1),
+            np.stack([ca, bc, c], axis=1),
+            np.stack([ab, bc, ca], axis=1),
+        ], axis=1).reshape(-1, 3, 3)
+    return triangles
+
+
+def _circle_extents(radii, matrices):
+    """ How far each circle reaches from its center along each axis """
+    return radii[:, np.newaxis] * np.linalg.norm(matrices, axis=-1)
+
+
+def _disc_triangles(centers, radii, matrices, n=32):
+    """ The ``(N, n, 3, 3)`` fans of triangles filling each circle """
+    unit_rims = _unit_circle_vertices(n) @ np.swapaxes(matrices, -1, -2)
+    rim = centers[:, np.newaxis] + radii[:, np.newaxis, np.newaxis] * unit_rims
+    center = np.broadcast_to(centers[:, np.newaxis], rim.shape)
+    return np.stack([center, rim, np.roll(rim, -1, axis=1)], axis=-2)
+
+
+def _plot_lines(ax, xs, ys, zs, **kwargs):
+    """
+    Like :meth:`Axes3D.plot`, but leaving the data limits to the caller rather
+    than autoscaling straight away, which is slow when repeated
+    """
+    lines = Axes.plot(ax, xs, ys, **kwargs)
+    for line in lines:
+        art3d.line_2d_to_3d(line, zs=zs)
+    return lines
+
+
+class _Plotter3d(_Plotter):
+    _handlers = {}
+    _updaters = {}
+    _extenders = {}
+
+    # alternative handlers for scene mode, which take precedence over the
+    # ones above
+    _scene_handlers = {}
+    _scene_updaters = {}
+    _scene_extenders = {}
+
+    def __init__(self, ax, layout, cache=None, cull=False, scene=False):
+        super().__init__(ax, layout, cache, cull)
+        if scene:
+            self._handlers = {**self._handlers, **self._scene_handlers}
+            self._updaters = {**self._updaters, **self._scene_updaters}
+            self._extenders = {**self._extenders, **self._scene_extenders}
+
+    def _basis(self, layout) -> dict:
+        # coefficients of the bivectors dual to e1, e2, e3
+        e1, e2, e3 = layout.basis_vectors_lst[:3]
+        normal_matrix = np.stack([(e2 ^ e3).value, (e3 ^ e1).value, (e1 ^ e2).value])
+        return dict(super()._basis(layout), normal_matrix=normal_matrix)
+
+    def _set_basis(self, point_indices, normal_matrix):
+        super()._set_basis(point_indices)
+        self._basis_arrays['normal_matrix'] = normal_matrix
+        self._normal_matrix = normal_matrix
+
+    def _update_datalim(self, corners, had_data):
+        # as `Axes3D.auto_scale_xyz` does, without autoscaling
+        self._ax.xy_dataLim.update_from_data_xy(corners[:, :2], not had_data)
+        self._ax.zz_dataLim.update_from_data_x(corners[:, 2], not had_data)
+
+    def _as_normal_array(self, values):
+        """ Get the unit normals of an ``(N, gaDims)`` array of euclidean bivectors """
+        return _normalized(values @ self._normal_matrix.T)
+
+    def _handles(t, _handlers=_handlers):
+        def decorator(f):
+            _handlers[t] = f
+            return f
+        return decorator
+
+    def _updates(t, _updaters=_updaters):
+        def decorator(f):
+            _updaters[t] = f
+            return f
+        return decorator
+
+    def _extends(t, _extenders=_extenders):
+        def decorator(f):
+            _extenders[t] = f
+            return f
+        return decorator
+
+    @_handles('Point')
+    def _plot_Point(self, os, **kwargs) -> Iterator[Artist]:
+        coords = self._as_point_array(os.location)
+        self._include(coords)
+        return _plot_lines(self._ax, *coords.T, **kwargs)
+
+    @_updates('Point')
+    def _update_Point(self, artists, os, **kwargs) -> bool:
+        line, = artists
+        line._verts3d = tuple(self._as_point_array(os.location).T)
+        line.stale = True
+        return True
+
+    @_extends('Point')
+    def _extend_Point(self, artists, os, **kwargs) -> bool:
+        new = self._as_point_array(os.location)
+        self._stage(artists, _join_points, new)
+        self._include(new)
+        return True
+
+    @_shared_geometry
+    @_profiling.timed_method('geometry', _group_name)
+    def _tangent_ends(self, os):
+        loc = self._as_point_array(os.location)
+        return loc, loc + _normalized(self._as_point_array(os.direction))
+
+    @_handles('Tangent[2]')
+    def _plot_Tangent(self, os, **kwargs) -> Iterator[Artist]:
+        tails, heads = self._tangent_ends(os)
+        col = Arrow3DCollection(tails, heads, **{k: kwargs[k] for k in ('color', 'alpha') if k in kwargs})
+        self._ax.add_collection(col, autolim=False)
+        self._include(np.concatenate([tails, heads]))
+        yield col
+
+    @_updates('Tangent[2]')
+    def _update_Tangent(self, artists, os, **kwargs) -> bool:
+        col, = artists
+        col.set_arrows(*self._tangent_ends(os))
+        return True
+
+    @_extends('Tangent[2]')
+    def _extend_Tangent(self, artists, os, **kwargs) -> bool:
+        tails, heads = self._tangent_ends(os)
+        self._stage(artists, _join_arrows, tails, heads)
+        self._include(np.concatenate([tails, heads]))
+        return True
+
+    @_shared_geometry
+    @_profiling.timed_method('geometry', _group_name)
+    def _point_pair_ends(self, os):
+        """ The end points of each point pair, of shape ``(N, 2, dims)`` """
+        d = _normalized(self._as_point_array(os.direction))
+        loc = self._as_point_array(os.location)
+        r = np.abs(os.radius)[:, np.newaxis]
+        return np.stack([loc - r * d, loc + r * d], axis=1)
+
+    @_handles('PointPair')
+    def _plot_PointPair(self, os, **kwargs) -> Iterator[Artist]:
+        all_ends = self._point_pair_ends(os)
+        self._include(all_ends)
+        for ends, linestyle in zip(all_ends, _line_styles_for_radii(os.radius)):
+            yield from _plot_lines(self._ax, *ends.T, linestyle=linestyle, **kwargs)
+
+    @_updates('PointPair')
+    def _update_PointPair(self, artists, os, **kwargs) -> bool:
+        if len(artists) != len(os):
+            return False
+        for line, ends, linestyle in zip(artists, self._point_pair_ends(os), _line_styles_for_radii(os.radius)):
+            line._verts3d = tuple(ends.T)
+            line.set_linestyle(linestyle)
+        return True
+
+    @_handles('Line')
+    def _plot_Line(self, os, **kwargs) -> Iterator[Artist]:
+        # collections cannot draw markers, and the ends of a line are off screen anyway
+        _pop_marker_kwargs(kwargs)
+        col = InfiniteLine3DCollection(
+            self._as_point_array(os.location),
+            self._as_point_array(os.direction),
+            **kwargs
+        )
+        self._ax.add_collection(col, autolim=False)
+        yield col
+
+    @_updates('Line')
+    def _update_Line(self, artists, os, **kwargs) -> bool:
+        col, = artists
+        col.set_lines(self._as_point_array(os.location), self._as_point_array(os.direction))
+        return True
+
+    @_extends('Line')
+    def _extend_Line(self, artists, os, **kwargs) -> bool:
+        self._stage(artists, _join_lines, self._as_point_array(os.location), self._as_point_array(os.direction))
+        return True
+
+    @_handles('Circle')
+    def _plot_Circle(self, os, **kwargs) -> Iterator[Artist]:
+        # adjust the color arguments to make sense
+        kwargs.setdefault('facecolor', 'none')
+        try:
+            color = kwargs.pop('color')
+        except KeyError:
+            raise
+        else:
+            kwargs['edgecolor'] = color
+
+        centers, radii, matrices = self._circle_params(os)
+        col = Circle3DCollection(
+            centers, radii, matrices,
+            linestyles=_line_styles_for_radii(os.radius),
+            **kwargs
+        )
+        self._ax.add_collection(col, autolim=False)
+        self._include(centers, _circle_extents(radii, matrices))
+        yield col
+
+    @_shared_geometry
+    @_profiling.timed_method('geometry', _group_name)
+    def _circle_params(self, os):
+        return (
+            self._as_point_array(os.location),
+            np.abs(os.radius),
+            _plane_frames(self._as_normal_array(os.direction)),
+        )
+
+    @_updates('Circle')
+    def _update_Circle(self, artists, os, **kwargs) -> bool:
+        col, = artists
+        col.set_circles(*self._circle_params(os))
+        col.set_linestyle(_line_styles_for_radii(os.radius))
+        return True
+
+    @_extends('Circle')
+    def _extend_Circle(self, artists, os, **kwargs) -> bool:
+        centers, radii, matrices = self._circle_params(os)
+        self._stage(artists, _join_circles, centers, radii, matrices, _line_styles_for_radii(os.radius))
+        self._include(centers, _circle_extents(radii, matrices))
+        return True
+
+    @_shared_geometry
+    @_profiling.timed_method('geometry', _group_name)
+    def _plane_params(self, os):
+        return self._as_point_array(os.location), self._as_normal_array(os.direction)
+
+    def _plane_colors(self, n, kwargs):
+        """ The color of each of ``n`` planes, taking a new one from the cycle for each if not given """
+        color = kwargs.pop('color', None)
+        if color is not None:
+            return to_rgba_array(color, kwargs.get('alpha', 0.5))
+        return to_rgba_array([self._ax._get_lines.get_next_color() for _ in range(n)], kwargs.get('alpha', 0.5))
+
+    @_handles('Plane')
+    def _plot_Plane(self, os, **kwargs) -> Iterator[Artist]:
+        colors = self._plane_colors(len(os), kwargs)
+        kwargs.pop('alpha', None)
+        col = Plane3DCollection(*self._plane_params(os), colors, **kwargs)
+        # planes are infinite, so do not affect the limits
+        self._ax.add_collection3d(col, autolim=False)
+        yield col
+
+    @_updates('Plane')
+    def _update_Plane(self, artists, os, **kwargs) -> bool:
+        col, = artists
+        colors = None
+        if 'color' in kwargs:
+            colors = self._plane_colors(len(os), dict(kwargs))
+        elif len(os) != len(col._colors):
+            # the colors came from the cycle, one per plane
+            return False
+        col.set_planes(*self._plane_params(os), colors)
+        return True
+
+    @_handles('Sphere')
+    def _plot_Sphere(self, os, **kwargs) -> Iterator[Artist]:
+        kwargs.setdefault('alpha', 0.5)
+        color = kwargs.pop('color', None)
+        if color is None:
+            color = self._ax._get_lines.get_next_color()
+
+        loc = self._as_point_array(os.location)
+        r = np.abs(os.radius)
+        col = Sphere3DCollection(loc, r, color, **kwargs)
+        self._ax.add_collection3d(col, autolim=False)
+        self._include(loc, r[:, np.newaxis])
+        yield col
+
+    @_updates('Sphere')
+    def _update_Sphere(self, artists, os, **kwargs) -> bool:
+        col, = artists
+        col.set_spheres(self._as_point_array(os.location), np.abs(os.radius))
+        return True
+
+    @_extends('Sphere')
+    def _extend_Sphere(self, artists, os, **kwargs) -> bool:
+        loc = self._as_point_array(os.location)
+        r = np.abs(os.radius)
+        self._stage(artists, _join_spheres, loc, r)
+        self._include(loc, r[:, np.newaxis])
+        return True
+
+    # scene mode
+
+    @_handles('Plane', _scene_handlers)
+    def _plot_Plane_scene(self, os, **kwargs) -> Iterator[Artist]:
+        colors = self._plane_colors(len(os), kwargs)
+        yield _ScenePlanes(Scene3DCollection._for_axes(self._ax), *self._plane_params(os), colors)
+
+    @_updates('Plane', _scene_updaters)
+    def _update_Plane_scene(self, artists, os, **kwargs) -> bool:
+        part, = artists
+        if 'color' in kwargs:
+            colors = self._plane_colors(len(os), dict(kwargs))
+        elif len(os) == len(part._colors):
+            colors = part._colors
+        else:
+            return False
+        part.set_planes(*self._plane_params(os), colors)
+        return True
+
+    @_handles('Sphere', _scene_handlers)
+    def _plot_Sphere_scene(self, os, **kwargs) -> Iterator[Artist]:
+        color = kwargs.get('color')
+        if color is None:
+            color = self._ax._get_lines.get_next_color()
+        loc = self._as_point_array(os.location)
+        r = np.abs(os.radius)
+        self._include(loc, r[:, np.newaxis])
+        yield _SceneSpheres(Scene3DCollection._for_axes(self._ax), loc, r, to_rgba(color, kwargs.get('alpha', 0.5)))
+
+    @_updates('Sphere', _scene_updaters)
+    def _update_Sphere_scene(self, artists, os, **kwargs) -> bool:
+        part, = artists
+        part.set_spheres(self._as_point_array(os.location), np.abs(os.radius))
+        return True
+
+    @_extends('Sphere', _scene_extenders)
+    def _extend_Sphere_scene(self, artists, os, **kwargs) -> bool:
+        loc = self._as_point_array(os.location)
+        r = np.abs(os.radius)
+        self._stage(artists, _join_spheres, loc, r)
+        self._include(loc, r[:, np.newaxis])
+        return True
+
+    def _disc_colors(self, os, kwargs):
+        """ The fill of circles in scene mode, or ``None`` if they are not filled """
+        facecolor = kwargs.get('facecolor', kwargs.get('fc', 'none'))
+        if isinstance(facecolor, str) and facecolor.lower() == 'none':
+            return None
+        return to_rgba(facecolor, kwargs.get('alpha'))
+
+    @_handles('Circle', _scene_handlers)
+    def _plot_Circle_scene(self, os, **kwargs) -> Iterator[Artist]:
+        # the outline is drawn as usual, and any fill in the scene
+        fill = self._disc_colors(os, kwargs)
+        kwargs.pop('fc', None)
+        kwargs['facecolor'] = 'none'
+        yield from self._plot_Circle(os, **kwargs)
+        if fill is not None:
+            triangles = _disc_triangles(*self._circle_params(os))
+            yield _SceneTriangles(Scene3DCollection._for_axes(self._ax), triangles, fill)
+
+    @_updates('Circle', _scene_updaters)
+    def _update_Circle_scene(self, artists, os, **kwargs) -> bool:
+        col, *parts = artists
+        self._update_Circle([col], os, **kwargs)
+        for part in parts:
+            part.set_triangles(_disc_triangles(*self._circle_params(os)), part._colors[:1])
+        return True
+
+    @_extends('Circle', _scene_extenders)
+    def _extend_Circle_scene(self, artists, os, **kwargs) -> bool:
+        # the outlines alone could be extended, but not the fill
+        return len(artists) == 1 and self._extend_Circle(artists, os, **kwargs)
+
+
+# the functions which add the chunks staged by the extenders to the artists
+
+def _join_points(artists, chunks):
+    line, = artists
+    line._verts3d = tuple(np.concatenate([np.column_stack(line._verts3d)] + [new for new, in chunks]).T)
+    line.stale = True
+
+
+def _join_arrows(artists, chunks):
+    col, = artists
+    tails, heads = zip(*chunks)
+    col.set_arrows(np.concatenate([col._tails, *tails]), np.concatenate([col._heads, *heads]))
+
+
+def _join_lines(artists, chunks):
+    col, = artists
+    origins, directions = zip(*chunks)
+    col.set_lines(np.concatenate([col._origins, *origins]), np.concatenate([col._directions, *directions]))
+
+
+def _join_circles(artists, chunks):
+    col, = artists
+    centers, radii, matrices, linestyles = zip(*chunks)
+    n = len(col._radii)
+    col.set_circles(
+        np.concatenate([col._centers, *centers]),
+        np.concatenate([col._radii, *radii]),
+        np.concatenate([np.swapaxes(col._axes3d, -1, -2), *matrices]),
+    )
+    _append_linestyles(col, n, [ls for lss in linestyles for ls in lss])
+
+
+def _join_spheres(artists, chunks):
+    # either a `Sphere3DCollection`, or the spheres of a scene
+    col, = artists
+    centers, radii = zip(*chunks)
+    col.set_spheres(np.concatenate([col._centers, *centers]), np.concatenate([col._radii, *radii]))
@@ -0,0 +1,309 @@
+"""
+The plotting of classified objects which is the same in 2D and 3D.
+
+:class:`_Plotter` classifies objects, culls them, and creates, updates, or
+extends artists through the handlers which its subclasses register for each
+type of object.
+"""
+import contextlib
+from typing import TYPE_CHECKING, Callable, Hashable, Iterator, List, Tuple
+import warnings
+
+from matplotlib.artist import Artist
+
+import numpy as np
+
+from . import _profiling, _groupby
+
+if TYPE_CHECKING:
+    # which imports clifford
+    from ._classify import _BladeGroup
+
+
+def _find_impl(type_names, registry):
+    """
+    The entry of ``registry`` for the first of ``type_names`` it contains.
+
+    Registries are keyed by the names of the types in
+    :mod:`clifford.tools.classify`, and ``type_names`` are those of a type
+    and its bases in method resolution order, so that the closest base class
+    is found without needing the types themselves.
+    """
+    with _profiling.timed('dispatch', type_names[0]):
+        return next((registry[n] for n in type_names if n in registry), None)
+
+
+# the margin around the view within which objects are kept when culling, in
+# pixels, so that markers and lines just outside it are still drawn
+_CULL_MARGIN = 10
+
+
+def _is_cullable(type_names, kwargs) -> bool:
+    """ Whether objects of the named type can be left out one at a time when out of view """
+    if type_names[0] == 'Point':
+        # unless drawn without a line, points are joined up in order
+        return kwargs.get('linestyle', kwargs.get('ls')) in ('None', 'none', '', ' ')
+    # other tangents are drawn as arrows, with a length not known in advance
+    return 'Round' in type_names and 'Tangent' not in type_names
+
+
+class _Plotter:
+    def __init__(self, ax, layout, cache=None, cull=False):
+        self._layout = layout
+        self._ax = ax
+        self._cache = cache
+        self._culling = cull
+        # when culling, every classified group, visible or not, and the view
+        # they were last culled to
+        self._groups = []
+        self._culled_box = None
+        # called with the groups classified by each update, if recording
+        self._recorder = None
+        # the bounds of what the current update plots, see `_include`
+        self._bounds = []
+        # the data which extenders are adding to artists, see `_stage`
+        self._staged = {}
+        self._batching = False
+        if layout is not None:
+            self._set_basis(**self._basis(layout))
+
+    def _basis(self, layout) -> dict:
+        """
+        The arrays which extract euclidean geometry from the coefficients of
+        ``layout``, as keyword arguments to :meth:`_set_basis`
+        """
+        # indices of e1, e2, ... within the coefficients
+        return dict(point_indices=np.array([
+            np.flatnonzero(e.value)[0] for e in layout.basis_vectors_lst[:-2]
+        ]))
+
+    def _set_basis(self, point_indices):
+        self._basis_arrays = dict(point_indices=point_indices)
+        self._dims = len(point_indices)
+        if np.all(np.diff(point_indices) == 1):
+            # a slice gives views rather than copies
+            point_indices = slice(point_indices[0], point_indices[-1] + 1)
+        self._point_indices = point_indices
+
+    def _as_point_array(self, values):
+        """ Get the euclidean coordinates of an ``(N, gaDims)`` coefficient array """
+        return values[:, self._point_indices]
+
+    def _view_box(self):
+        """ The lower and upper corners of the view, or ``None`` while autoscaling """
+        ax = self._ax
+        names = 'xyz'[:self._dims]
+        if any(getattr(ax, 'get_autoscale{}_on'.format(n))() for n in names):
+            return None
+        lims = np.sort([getattr(ax, 'get_{}lim'.format(n))() for n in names], axis=1)
+        pixels = min(ax.bbox.width, ax.bbox.height)
+        margin = (lims[:, 1] - lims[:, 0]) * _CULL_MARGIN / max(pixels, 1)
+        return lims[:, 0] - margin, lims[:, 1] + margin
+
+    def _include(self, points, extents=0):
+        """
+        Grow the data limits to cover ``points``, or boxes reaching
+        ``extents`` either side of them, once the current update is done
+        """
+        points = np.reshape(points, (-1, self._dims))
+        lower, upper = points - extents, points + extents
+        finite = np.isfinite(lower).all(axis=1) & np.isfinite(upper).all(axis=1)
+        if finite.any():
+            self._bounds.append((lower[finite].min(axis=0), upper[finite].max(axis=0)))
+
+    def _apply_bounds(self, had_data):
+        """
+        Add everything passed to :meth:`_include` to the data limits at once,
+        and have the axes autoscale the next time they are drawn
+        """
+        if not self._bounds:
+            return
+        lower, upper = zip(*self._bounds)
+        self._bounds = []
+        self._update_datalim(np.stack([np.min(lower, axis=0), np.max(upper, axis=0)]), had_data)
+        self._ax._request_autoscale_view()
+
+    def _update_datalim(self, corners, had_data):
+        self._ax.update_datalim(corners)
+
+    def _stage(self, artists, finish, *arrays):
+        """
+        Add ``arrays`` to the artists of a part once the current batch is
+        done, by calling ``finish(artists, chunks)`` with the arrays of each
+        call in order. This way a stream of chunks is joined up once, rather
+        than copying everything plotted so far for each chunk.
+        """
+        self._staged.setdefault(id(artists), (artists, finish, []))[2].append(arrays)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Within this block, gather the data which extenders add to artists and
+        the bounds of what is plotted, and apply them all once at the end.
+        Updates and extensions outside such a block are each a batch of
+        their own.
+        """
+        if self._batching:
+            yield
+            return
+        self._batching = True
+        had_data = self._ax.has_data()
+        try:
+            yield
+        finally:
+            self._batching = False
+            staged, self._staged = self._staged, {}
+            for artists, finish, chunks in staged.values():
+                finish(artists, chunks)
+            self._apply_bounds(had_data)
+
+    def _cull(self, groups, kwargs) -> List['_BladeGroup']:
+        """ Drop the objects whose bounding spheres lie entirely outside the view """
+        box = self._culled_box = self._view_box()
+        if box is None:
+            return groups
+        lower, upper = box
+        visible_groups = []
+        for os in groups:
+            if _is_cullable(os.type_names, kwargs):
+                with _profiling.timed('cull', os.type_names[0]):
+                    centers = self._as_point_array(os.location)
+                    r = np.abs(os.radius)[:, np.newaxis]
+                    visible = np.all((centers + r >= lower) & (centers - r <= upper), axis=1)
+                    if not visible.all():
+                        os = os.take(np.flatnonzero(visible))
+                if len(os) == 0:
+                    continue
+            visible_groups.append(os)
+        return visible_groups
+
+    def _classify(self, cga_objs, kwargs, extend=False) -> List['_BladeGroup']:
+        """ Classify the objects, and drop any which are out of view if culling """
+        from ._classify import _classify_groups
+        return self._prepare(_classify_groups(self._layout, cga_objs, self._cache), kwargs, extend)
+
+    def _prepare(self, groups, kwargs, extend=False) -> List['_BladeGroup']:
+        """ Record the classified groups if needed, and drop any objects which are out of view if culling """
+        if self._recorder is not None:
+            self._recorder([g for g in groups if _find_impl(g.type_names, self._handlers)], extend)
+        if not self._culling:
+            return groups
+        if extend:
+            self._groups += groups
+        else:
+            self._groups = groups
+        return self._cull(groups, kwargs)
+
+    def _dispatch(self, cga_objs) -> Iterator[Tuple[Callable, '_BladeGroup']]:
+        """ Classify the objects, and pair each group with its handler """
+        from ._classify import _classify_groups
+        return self._dispatch_groups(_classify_groups(self._layout, cga_objs, self._cache))
+
+    def _dispatch_groups(self, all_groups) -> Iterator[Tuple[Callable, '_BladeGroup']]:
+        for handler, groups in _groupby(all_groups, lambda g: _find_impl(g.type_names, self._handlers)):
+            if not handler:
+                unsupported_msg = (\
+                    "Unable to plot any of the following objects:\n{}"
+                    .format("\n".join(" * {!r}".format(o) for os in groups for o in os))
+                )
+                warnings.warn(unsupported_msg)
+            else:
+                for os in groups:
+                    yield handler, os
+
+    def update(self, parts, cga_objs, **kwargs) -> List[Tuple[Hashable, List[Artist]]]:
+        """
+        Plot ``cga_objs``, reusing the artists in ``parts`` where possible.
+
+        ``parts`` is a list of ``(key, artists)`` pairs as returned by a
+        previous call, or empty. Artists for a type which is no longer present
+        are removed, and artists for which no updater is registered, or whose
+        updater returns ``False``, are recreated.
+        """
+        return self._update_groups(parts, self._classify(cga_objs, kwargs), **kwargs)
+
+    def update_groups(self, parts, groups, **kwargs) -> List[Tuple[Hashable, List[Artist]]]:
+        """ Like :meth:`update`, but with objects which are already classified """
+        return self._update_groups(parts, self._prepare(groups, kwargs), **kwargs)
+
+    def recull(self, parts, **kwargs) -> List[Tuple[Hashable, List[Artist]]]:
+        """
+        Like :meth:`update`, but showing the objects of previous calls which
+        are within the current view.
+        """
+        box = self._view_box()
+        if box is None and self._culled_box is None or (
+                box is not None and self._culled_box is not None and np.array_equal(box, self._culled_box)):
+            return parts
+        groups = [type(gs[0]).concatenate(gs) for _, gs in _groupby(self._groups, lambda g: g.type_names)]
+        return self._update_groups(parts, self._cull(groups, kwargs), **kwargs)
+
+    def _update_groups(self, parts, groups, **kwargs) -> List[Tuple[Hashable, List[Artist]]]:
+        with self.batch():
+            old_parts = dict(parts)
+            new_parts = []
+            for handler, os in self._dispatch_groups(groups):
+                name = os.type_names[0]
+                key = (handler, name)
+                artists = old_parts.pop(key, None)
+                if artists is not None:
+                    updater = _find_impl(os.type_names, self._updaters)
+                    if updater:
+                        with _profiling.timed('update', name):
+                            updated = updater(self, artists, os, **kwargs)
+                        if updated:
+                            new_parts.append((key, artists))
+                            continue
+                    for a in artists:
+                        a.remove()
+                with _profiling.timed('construct', name):
+                    artists = list(handler(self, os, **kwargs))
+                _profiling.count_artists(name, len(artists))
+                new_parts.append((key, artists))
+
+            for artists in old_parts.values():
+                for a in artists:
+                    a.remove()
+        return new_parts
+
+    def extend(self, parts, cga_objs, **kwargs) -> List[Tuple[Hashable, List[Artist]]]:
+        """
+        Plot ``cga_objs`` in addition to the objects already in ``parts``.
+
+        Existing artists are grown to include the new objects where an
+        extender is registered, and new artists are added otherwise. Parts
+        which gain extra artists can no longer be reused by :meth:`update`.
+        """
+        return self._extend_groups(parts, self._classify(cga_objs, kwargs, extend=True), **kwargs)
+
+    def extend_groups(self, parts, groups, **kwargs) -> List[Tuple[Hashable, List[Artist]]]:
+        """ Like :meth:`extend`, but with objects which are already classified """
+        return self._extend_groups(parts, self._prepare(groups, kwargs, extend=True), **kwargs)
+
+    def _extend_groups(self, parts, groups, **kwargs) -> List[Tuple[Hashable, List[Artist]]]:
+        with self.batch():
+            parts = list(parts)
+            index = {key[:2]: i for i, (key, _) in enumerate(parts)}
+            for handler, os in self._dispatch_groups(groups):
+                name = os.type_names[0]
+                key = (handler, name)
+                i = index.get(key)
+                if i is not None:
+                    extender = _find_impl(os.type_names, self._extenders)
+                    if extender:
+                        with _profiling.timed('update', name):
+                            extended = extender(self, parts[i][1], os, **kwargs)
+                        if extended:
+                            continue
+                with _profiling.timed('construct', name):
+                    artists = list(handler(self, os, **kwargs))
+                _profiling.count_artists(name, len(artists))
+                if i is None:
+                    index[key] = len(parts)
+                    parts.append((key, artists))
+                else:
+                    # the updaters expect the artists of a single handler call,
+                    # and anything staged refers to this same list
+                    parts[i][1].extend(artists)
+                    parts[i] = (key + ('extended',), parts[i][1])
+        return parts
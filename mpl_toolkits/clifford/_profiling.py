@@ -0,0 +1,170 @@
+"""
+Opt-in timing of the phases of plotting.
+
+Nothing is recorded unless a :func:`profile` block is active, in which case
+each instrumented phase adds its wall time and call count to every active
+:class:`Profile`. Profiles only see the thread which entered them, so work
+done in other threads, such as by a :class:`~.animation.LiveViewer` or a
+shared :class:`~.render.RenderPool`, is neither recorded nor mixed in.
+"""
+import collections
+import contextlib
+import functools
+import threading
+import time
+from typing import Iterator
+
+
+class _State(threading.local):
+    """ The profiles recording on a thread, and the phases it is timing """
+    def __init__(self):
+        self.active = []
+        self.running = set()
+
+
+_state = _State()
+
+_null = contextlib.nullcontext()
+
+PHASES = ('classify', 'cull', 'dispatch', 'geometry', 'construct', 'update', 'project')
+
+
+class PhaseStats:
+    """ The number of calls to a phase, and the total wall time they took """
+    __slots__ = ('calls', 'time')
+
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.0
+
+    def __repr__(self):
+        return 'PhaseStats(calls={}, time={:.6f})'.format(self.calls, self.time)
+
+
+class Profile:
+    """
+    Wall time and call counts for each phase of plotting, split by type.
+
+    The phases are:
+
+    ``classify``
+        classifying multivectors and grouping them by type
+    ``cull``
+        dropping objects outside the view, when plotting with ``cull=True``
+    ``dispatch``
+        looking up the handler or updater for each group
+    ``geometry``
+        computing locations, directions, radii, and the vertices derived from
+        them
+    ``construct``
+        creating artists for a group, including the ``geometry`` this needs
+    ``update``
+        updating existing artists for a group, including ``geometry``
+    ``project``
+        projecting 3D artists at draw time, keyed by artist class
+
+    Attributes
+    ----------
+    phases : dict
+        Maps ``(phase, key)`` to :class:`PhaseStats`, where ``key`` is the
+        name of the classified type, or ``'all'`` for ``classify``.
+    artists : collections.Counter
+        The number of artists created, by the name of the classified type.
+    """
+    def __init__(self):
+        self.phases = collections.defaultdict(PhaseStats)
+        self.artists = collections.Counter()
+
+    def summary(self) -> dict:
+        """
+        The recorded statistics as nested dictionaries, of the form::
+
+            {
+                'phases': {phase: {key: {'calls': int, 'time': float}}},
+                'artists': {key: int},
+            }
+        """
+        phases = {}
+        for (phase, key), s in sorted(self.phases.items(), key=lambda item: (PHASES.index(item[0][0]), item[0][1])):
+            phases.setdefault(phase, {})[key] = {'calls': s.calls, 'time': s.time}
+        return {'phases': phases, 'artists': dict(self.artists)}
+
+    def __str__(self):
+        lines = ['{:<10} {:<24} {:>8} {:>12}'.format('phase', 'key', 'calls', 'time / ms')]
+        for phase, keys in self.summary()['phases'].items():
+            for key, s in keys.items():
+                lines.append('{:<10} {:<24} {:>8} {:>12.3f}'.format(phase, key, s['calls'], s['time'] * 1e3))
+        for key, n in sorted(self.artists.items()):
+            lines.append('{:<10} {:<24} {:>8}'.format('artists', key, n))
+        return '\n'.join(lines)
+
+
+@contextlib.contextmanager
+def profile() -> Iterator[Profile]:
+    """
+    Record the time spent in each phase of plotting within a ``with`` block.
+
+    Drawing is only included if the figure is drawn inside the block::
+
+        with profile() as p:
+            plot(ax, objs)
+            fig.canvas.draw()
+        print(p)
+        p.summary()
+
+    Only plotting on the current thread is recorded.
+    """
+    p = Profile()
+    _state.active.append(p)
+    try:
+        yield p
+    finally:
+        _state.active.remove(p)
+
+
+@contextlib.contextmanager
+def _timing(phase, key):
+    # only the outermost of nested calls within one phase is timed
+    running = _state.running
+    if phase in running:
+        yield
+        return
+    running.add(phase)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        running.discard(phase)
+        for p in _state.active:
+            s = p.phases[phase, key]
+            s.calls += 1
+            s.time += elapsed
+
+
+def timed(phase, key='all'):
+    """ A context manager timing ``phase``, which does nothing when not profiling """
+    if not _state.active:
+        return _null
+    return _timing(phase, key)
+
+
+def timed_method(phase, key):
+    """
+    Decorate a method to time it as ``phase``, where ``key(self, *args)``
+    gives the key to record it under
+    """
+    def decorator(f):
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            if not _state.active:
+                return f(*args, **kwargs)
+            with _timing(phase, key(*args)):
+                return f(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count_artists(key, n):
+    for p in _state.active:
+        p.artists[key] += n
@@ -0,0 +1,410 @@
+"""
+Animation of conformal objects, drawing only what changes each frame.
+
+Objects are split into static ones, which are drawn once into a cached
+background, and dynamic ones, which are updated in place and blitted over that
+background every frame::
+
+    animator = Animator(fig)
+    animator.static(ax, [C])
+    arm = animator.dynamic(ax, marker='x', color='tab:orange')
+
+    @animator.animate(interval=0.005, save_count=100)
+    def animation(t):
+        arm.update([up(0), up(elb), up(endpoint)])
+
+On 3D axes, blitting draws each artist on its own rather than through
+:meth:`Axes3D.draw`, so the dynamic artists are projected and depth-sorted
+among themselves before each frame. They are always drawn in front of the
+static background.
+
+For offline rendering, :func:`export` renders frames in parallel across
+worker processes, each with its own copy of the figure.
+
+When the objects come from a simulation running at its own pace,
+:class:`LiveViewer` produces them in a background thread, and shows the
+most recent frame each time the animation timer fires::
+
+    viewer = LiveViewer(animator, ([up(x)] for x in simulation()))
+    animation = viewer.start(interval=0.03)
+"""
+import collections.abc
+import multiprocessing
+import queue
+import subprocess
+import threading
+from typing import Callable, Iterable, List, Optional, Sequence, Union
+
+import matplotlib
+from matplotlib.animation import FuncAnimation
+from matplotlib.artist import Artist
+from matplotlib.collections import Collection
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.patches import Patch
+
+import numpy as np
+
+from . import plot, PlotHandle, _as_sequence, _common_layout
+
+__all__ = ['Animator', 'LiveViewer', 'export']
+
+
+def _do_3d_projection(artist):
+    try:
+        return artist.do_3d_projection()
+    except TypeError:
+        # before matplotlib 3.5, the renderer was needed for its projection matrix
+        return artist.do_3d_projection(artist.figure.canvas.get_renderer())
+
+
+def _project_3d(artists):
+    """
+    Project and depth-sort 3D collections and patches in the same way as
+    :meth:`Axes3D.draw`, which is skipped when blitting.
+    """
+    projected = [
+        a for a in artists
+        if a.axes.name == '3d' and isinstance(a, (Collection, Patch))
+        # the projection matrix is only set up by the first full draw
+        and getattr(a.axes, 'M', None) is not None
+    ]
+    if not projected:
+        return
+    depths = [_do_3d_projection(a) for a in projected]
+    zorder = min(a.zorder for a in projected)
+    for i in np.argsort(depths)[::-1]:
+        projected[i].zorder = zorder
+        zorder += 1
+
+
+class Animator:
+    """
+    Animate conformal objects on a figure, using blitting for the ones which
+    change.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+    """
+    def __init__(self, fig):
+        self.figure = fig
+        self._dynamic = []
+
+    def static(self, ax, cga_objs, **kwargs) -> PlotHandle:
+        """ Plot objects which stay the same in every frame. """
+        return plot(ax, cga_objs, **kwargs)
+
+    def dynamic(self, ax, cga_objs=(), **kwargs) -> PlotHandle:
+        """
+        Create a handle for objects which change between frames.
+
+        The animation function should call :meth:`PlotHandle.update` on the
+        result to set the objects for the current frame.
+        """
+        handle = plot(ax, cga_objs, **kwargs)
+        self._dynamic.append(handle)
+        return handle
+
+    def _dynamic_artists(self) -> List[Artist]:
+        # parts of a 3D scene are drawn by the scene as a whole
+        artists = list(dict.fromkeys(getattr(a, '_scene', a) for handle in self._dynamic for a in handle))
+        _project_3d(artists)
+        return artists
+
+    def animate(self, *, interval, blit=True, **kwargs) -> Callable[[Callable], FuncAnimation]:
+        """
+        Decorator to create a :class:`~matplotlib.animation.FuncAnimation`
+        from a function of time, which updates the dynamic handles.
+
+        Parameters
+        ----------
+        interval : float
+            The time between frames, in seconds.
+        blit : bool
+            Whether to redraw only the dynamic artists each frame.
+        **kwargs
+            Passed on to :class:`~matplotlib.animation.FuncAnimation`.
+        """
+        def decorator(f):
+            def animate(i):
+                f(i*interval)
+                return self._dynamic_artists()
+
+            return FuncAnimation(
+                self.figure, animate, init_func=lambda: animate(0),
+                blit=blit, interval=interval*1000, **kwargs)
+
+        return decorator
+
+
+class LiveViewer:
+    """
+    Show frames of objects produced in a background thread, dropping the
+    oldest frames when they are produced faster than they can be drawn.
+
+    The producer is read in a thread, and each frame is optionally
+    classified there too, so that a slow frame does not stall the user
+    interface. Finished frames wait in a queue of at most ``maxsize``, and
+    each time the animation timer fires, the oldest of them is shown.
+    Producing a frame when the queue is full discards its oldest one.
+
+    Parameters
+    ----------
+    animator : Animator
+        With its dynamic handles already created.
+    frames : iterable
+        Each item holds the objects to show in each dynamic handle, in the
+        order the handles were created, as returned by the ``frame``
+        function of :func:`export`. This is usually a generator, which is
+        only advanced from the background thread.
+    maxsize : int
+        The number of finished frames to hold. With the default of 1, the
+        latest frame is always the one shown.
+    classify : bool
+        Whether to classify the objects in the background thread too. Any
+        ``cache`` of the dynamic handles is then only used from that thread.
+        A frame which fails to classify is skipped, rather than ending the
+        thread.
+
+    Attributes
+    ----------
+    produced, rendered, dropped : int
+        The number of frames read from ``frames``, shown, and discarded
+        without being shown.
+    failed : int
+        The number of frames skipped because they could not be classified.
+    last_error : Exception or None
+        The error of the most recent of those frames.
+    """
+    def __init__(self, animator: Animator, frames: Iterable[Sequence], *, maxsize: int = 1, classify: bool = True):
+        self.animator = animator
+        self._frames = frames
+        self._classify = classify
+        self._queue = queue.Queue(maxsize)
+        self._stop = threading.Event()
+        self._thread = None
+        self._error = None
+        self.produced = 0
+        self.rendered = 0
+        self.dropped = 0
+        self.failed = 0
+        self.last_error = None
+
+    def __repr__(self):
+        return '<{} produced={} rendered={} dropped={} failed={}>'.format(
+            type(self).__name__, self.produced, self.rendered, self.dropped, self.failed)
+
+    def counters(self) -> dict:
+        """ The frame counters, as a dictionary """
+        return dict(produced=self.produced, rendered=self.rendered, dropped=self.dropped, failed=self.failed)
+
+    def _prepare(self, frame) -> list:
+        """ Classify the objects of each handle, if enabled, in the background thread """
+        from ._classify import _classify_groups
+        prepared = []
+        for handle, objs in zip(self.animator._dynamic, frame):
+            objs = _as_sequence(objs)
+            if not isinstance(objs, (collections.abc.Sequence, np.ndarray)):
+                objs = list(objs)
+            if self._classify and len(objs):
+                layout = _common_layout(objs)
+                prepared.append((objs, layout, _classify_groups(layout, objs, handle._cache)))
+            else:
+                prepared.append((objs, None, None))
+        return prepared
+
+    def _produce(self):
+        try:
+            for frame in self._frames:
+                if self._stop.is_set():
+                    return
+                self.produced += 1
+                try:
+                    prepared = self._prepare(frame)
+                except Exception as e:
+                    # such as degenerate objects, which only spoil this frame
+                    self.failed += 1
+                    self.last_error = e
+                    continue
+                while True:
+                    try:
+                        self._queue.put_nowait(prepared)
+                        break
+                    except queue.Full:
+                        try:
+                            self._queue.get_nowait()
+                            self.dropped += 1
+                        except queue.Empty:
+                            pass
+        except Exception as e:
+            # raised again from the timer, on the main thread
+            self._error = e
+
+    def _show_next(self):
+        """
+        Show the oldest finished frame, if there is one, or raise any error
+        of the producer once there are none left
+        """
+        try:
+            prepared = self._queue.get_nowait()
+        except queue.Empty:
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+            return
+        for handle, (objs, layout, groups) in zip(self.animator._dynamic, prepared):
+            if groups is None:
+                handle.update(objs)
+            else:
+                handle._plotter_for(layout)
+                handle._show_groups(groups)
+        self.rendered += 1
+
+    def start(self, *, interval: float = 0.03, blit: bool = True, **kwargs) -> FuncAnimation:
+        """
+        Start the background thread, and an animation showing its frames.
+
+        Parameters
+        ----------
+        interval : float
+            The time between checks for a new frame, in seconds.
+        blit : bool
+            Whether to redraw only the dynamic artists each frame.
+        **kwargs
+            Passed on to :class:`~matplotlib.animation.FuncAnimation`.
+
+        Returns
+        -------
+        FuncAnimation
+            Which must be kept referenced for as long as it should run.
+        """
+        if self._thread is not None:
+            raise RuntimeError("The viewer has already been started")
+        self._thread = threading.Thread(target=self._produce, name='LiveViewer producer', daemon=True)
+        self._thread.start()
+
+        def animate(i):
+            self._show_next()
+            return self.animator._dynamic_artists()
+
+        kwargs.setdefault('cache_frame_data', False)
+        return FuncAnimation(
+            self.animator.figure, animate, init_func=lambda: animate(0),
+            blit=blit, interval=interval*1000, **kwargs)
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Ask the background thread to stop, and wait for it to finish the
+        frame it is producing.
+        """
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+
+# the animator and frame function of an `export` worker process
+_worker = None
+
+
+def _init_export_worker(setup, frame, dpi):
+    global _worker
+    animator = setup()
+    # render with Agg whatever the backend, without going through pyplot
+    FigureCanvasAgg(animator.figure)
+    if dpi is not None:
+        animator.figure.set_dpi(dpi)
+    _worker = animator, frame
+
+
+def _render_frame(args):
+    i, t, pattern = args
+    animator, frame = _worker
+    for handle, objs in zip(animator._dynamic, frame(t)):
+        handle.update(objs)
+    canvas = animator.figure.canvas
+    if pattern is not None:
+        canvas.print_figure(pattern.format(i), dpi=animator.figure.dpi)
+        return None
+    canvas.draw()
+    return canvas.get_width_height(physical=True), bytes(canvas.buffer_rgba())
+
+
+def _ffmpeg_args(filename, size, fps) -> List[str]:
+    args = [
+        matplotlib.rcParams['animation.ffmpeg_path'], '-y',
+        '-f', 'rawvideo', '-vcodec', 'rawvideo', '-pix_fmt', 'rgba',
+        '-s', '{}x{}'.format(*size), '-framerate', str(fps), '-i', '-',
+    ]
+    if not str(filename).endswith('.gif'):
+        # most video codecs need even dimensions
+        args += ['-pix_fmt', 'yuv420p', '-vf', 'scale=trunc(iw/2)*2:trunc(ih/2)*2']
+    return args + [str(filename)]
+
+
+def export(setup: Callable[[], Animator], frame: Callable[..., Sequence], frames: Union[int, Iterable],
+           filename, *, fps=25, dpi=None, processes=None, chunksize=1):
+    """
+    Render an animation offline, using a pool of worker processes.
+
+    Each worker calls ``setup`` once to build its own figure, and then
+    renders whichever frames it is given with the Agg backend. The frames
+    are written out in order.
+
+    Parameters
+    ----------
+    setup : callable
+        Creates the figure, plots the static objects, and returns an
+        :class:`Animator` with its dynamic handles created.
+    frame : callable
+        Called with each item of ``frames``, returning the objects to show in
+        each dynamic handle, in the order the handles were created.
+    frames : int or iterable
+        The arguments to ``frame``, or a number of frames to pass
+        ``0, 1, ...``.
+    filename : str or path-like
+        Either a pattern like ``'frames/{:04d}.png'``, which each worker
+        formats with the frame number to save images directly, or a video
+        file, which the frames are piped to ``ffmpeg`` to encode.
+    fps : float
+        The frame rate of the video.
+    dpi : float, optional
+        Overrides the dpi of the figure.
+    processes : int, optional
+        The number of workers, by default the number of CPUs.
+    chunksize : int
+        The number of frames sent to a worker at once.
+
+    Notes
+    -----
+    The workers are always spawned rather than forked, as forking a process
+    which has already compiled :mod:`clifford`'s numba functions can hang.
+    ``setup``, ``frame`` and the items of ``frames`` are therefore sent to
+    the worker processes, so should be picklable, such as functions defined
+    at the top level of a module. The script calling this needs an
+    ``if __name__ == '__main__':`` guard, as the workers import it.
+    """
+    if isinstance(frames, int):
+        frames = range(frames)
+    pattern = filename if '{' in str(filename) else None
+    tasks = ((i, t, pattern) for i, t in enumerate(frames))
+
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(processes, _init_export_worker, (setup, frame, dpi)) as pool:
+        rendered = pool.imap(_render_frame, tasks, chunksize)
+        if pattern is not None:
+            for _ in rendered:
+                pass
+            return
+
+        encoder = None
+        try:
+            for size, rgba in rendered:
+                if encoder is None:
+                    encoder = subprocess.Popen(_ffmpeg_args(filename, size, fps), stdin=subprocess.PIPE)
+                encoder.stdin.write(rgba)
+        finally:
+            if encoder is not None:
+                encoder.stdin.close()
+                encoder.wait()
+        if encoder is not None and encoder.returncode:
+            raise subprocess.CalledProcessError(encoder.returncode, encoder.args)
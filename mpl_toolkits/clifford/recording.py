@@ -0,0 +1,312 @@
+"""
+Recording of classified geometry, to be plotted again without :mod:`clifford`.
+
+Classifying objects and extracting their geometry is usually the most
+expensive part of plotting them. A :class:`GeometryRecording` passed to
+:func:`~mpl_toolkits.clifford.plot` keeps the geometry shown by each update
+of the plot as a frame, and can be saved as columns of numbers::
+
+    recording = GeometryRecording()
+    handle = plot(ax, objs, color='tab:blue', record=recording)
+    for objs in simulation:
+        handle.update(objs)
+    recording.save('run.npz')
+
+Plotting a frame of the loaded file then needs only numpy and matplotlib, and
+creates the same artists as the original plot::
+
+    recording = GeometryRecording.load('run.npz')
+    handle = recording.plot(ax, frame=0)
+    handle.update(1000)
+
+Saving to a path without the ``.npz`` extension writes a directory of ``.npy``
+files instead, which are memory-mapped when loaded, so that single frames of
+a long recording can be read without reading the rest.
+"""
+import json
+import os
+from typing import List
+
+import numpy as np
+
+from . import PlotHandle, _groupby, _new_plotter
+
+__all__ = ['GeometryRecording', 'ReplayHandle']
+
+_FORMAT_VERSION = 1
+
+# the names of the arrays saved for each track
+_COLUMNS = ('location', 'direction', 'radius', 'group_type', 'group_stop', 'frame_stop')
+
+
+class _RecordedGroup:
+    """
+    Objects of a single type read from a recording, which stand in for a
+    ``_BladeGroup`` when plotting.
+
+    ``location`` and ``direction`` only hold the coefficients which the
+    plotters use, numbered as in the basis of the track.
+    """
+    def __init__(self, type_names, location, direction, radius):
+        self.type_names = type_names
+        self.location = location
+        self.direction = direction
+        self.radius = radius
+        self._geometry = {}
+
+    def __len__(self):
+        return len(self.location)
+
+    def take(self, rows) -> '_RecordedGroup':
+        return _RecordedGroup(self.type_names, self.location[rows], self.direction[rows], self.radius[rows])
+
+    @classmethod
+    def concatenate(cls, groups) -> '_RecordedGroup':
+        return cls(
+            groups[0].type_names,
+            np.concatenate([g.location for g in groups]),
+            np.concatenate([g.direction for g in groups]),
+            np.concatenate([g.radius for g in groups]),
+        )
+
+
+class _Track:
+    """
+    The frames shown by a single plotter.
+
+    Objects are stored one per row, in the order they were plotted. Groups
+    of objects of the same type end at the rows in ``group_stop``, and
+    frames end at the groups in ``frame_stop``.
+    """
+    def __init__(self, basis, kwargs, types=(), columns=None):
+        self.basis = basis
+        self.kwargs = kwargs
+        self.types = [tuple(t) for t in types]
+        self._columns = columns
+        # while recording, the pieces of each column not yet joined together
+        self._chunks = {name: [] for name in _COLUMNS[:-1]}
+        self._frame_stops = []
+        self._n_rows = 0
+
+    @classmethod
+    def _for_plotter(cls, plotter, kwargs) -> '_Track':
+        """ An empty track, storing only the coefficients used by ``plotter`` """
+        basis = plotter._basis_arrays
+        used = np.asarray(basis['point_indices'])
+        if 'normal_matrix' in basis:
+            used = np.union1d(used, np.flatnonzero(np.any(basis['normal_matrix'], axis=0)))
+        used = np.unique(used)
+        track = cls({'point_indices': np.searchsorted(used, basis['point_indices'])}, dict(kwargs))
+        if 'normal_matrix' in basis:
+            track.basis['normal_matrix'] = basis['normal_matrix'][:, used]
+        track._used = used
+        return track
+
+    def _record(self, groups, extend=False):
+        """ Add ``groups`` as a new frame, or to the last one if ``extend`` """
+        chunks = self._chunks
+        for g in groups:
+            if g.type_names not in self.types:
+                self.types.append(g.type_names)
+            chunks['location'].append(np.asarray(g.location)[:, self._used])
+            chunks['direction'].append(np.asarray(g.direction)[:, self._used])
+            # flats have no radius
+            chunks['radius'].append(np.zeros(len(g), complex) if g.radius is None else np.asarray(g.radius, complex))
+            chunks['group_type'].append([self.types.index(g.type_names)])
+            self._n_rows += len(g)
+            chunks['group_stop'].append([self._n_rows])
+        n_groups = len(groups) + (self._frame_stops[-1] if self._frame_stops else 0)
+        if extend and self._frame_stops:
+            self._frame_stops[-1] = n_groups
+        else:
+            self._frame_stops.append(n_groups)
+        self._columns = None
+
+    def columns(self) -> dict:
+        """ The arrays holding every frame, by name """
+        if self._columns is None:
+            k = len(self._used)
+            empty = dict(
+                location=np.zeros((0, k)), direction=np.zeros((0, k)), radius=np.zeros(0, complex),
+                group_type=np.zeros(0, int), group_stop=np.zeros(0, int),
+            )
+            columns = {
+                name: np.concatenate([empty[name]] + [np.asarray(c) for c in chunks])
+                for name, chunks in self._chunks.items()
+            }
+            # keep the joined pieces, so that the next call is cheaper
+            self._chunks = {name: [a] for name, a in columns.items()}
+            columns['frame_stop'] = np.array(self._frame_stops, dtype=int)
+            self._columns = columns
+        return self._columns
+
+    def __len__(self):
+        return len(self.columns()['frame_stop'])
+
+    def groups(self, frame) -> List[_RecordedGroup]:
+        """ The objects of ``frame``, read into memory """
+        c = self.columns()
+        frame = range(len(c['frame_stop']))[frame]
+        g0 = int(c['frame_stop'][frame - 1]) if frame else 0
+        groups = []
+        for g in range(g0, int(c['frame_stop'][frame])):
+            r0 = int(c['group_stop'][g - 1]) if g else 0
+            r1 = int(c['group_stop'][g])
+            groups.append(_RecordedGroup(
+                self.types[c['group_type'][g]],
+                np.array(c['location'][r0:r1]),
+                np.array(c['direction'][r0:r1]),
+                np.array(c['radius'][r0:r1]),
+            ))
+        # a frame streamed in chunks holds a group of each type per chunk,
+        # which are joined so that each type is plotted by a single part
+        return [
+            gs[0] if len(gs) == 1 else _RecordedGroup.concatenate(gs)
+            for _, gs in _groupby(groups, lambda g: g.type_names)
+        ]
+
+    def plotter(self, ax, cull=False, scene=False):
+        """ A plotter for the frames of this track, which needs no layout """
+        plotter = _new_plotter(ax, len(self.basis['point_indices']), None, cull=cull, scene=scene)
+        plotter._set_basis(**self.basis)
+        return plotter
+
+    def meta(self) -> dict:
+        """ Everything but the columns, in a form which can be written as JSON """
+        return dict(
+            kwargs=self.kwargs,
+            types=self.types,
+            basis={k: np.asarray(v).tolist() for k, v in self.basis.items()},
+        )
+
+
+def _json_default(value):
+    # numpy values, such as colors given as arrays
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError("Cannot save the plot argument {!r}".format(value))
+
+
+class GeometryRecording:
+    """
+    The classified geometry shown by plots, frame by frame.
+
+    Pass this to :func:`~mpl_toolkits.clifford.plot` with ``record=``, and
+    each update of the plot adds a frame holding the location, direction and
+    radius of each object, along with its type and the arguments of the
+    plot. Streamed chunks of objects are added to the same frame.
+
+    Every plot recorded, or plotter used by a plot whose layout changes,
+    makes a separate track, numbered in the order they were created.
+    """
+    def __init__(self):
+        self._tracks = []
+
+    def _new_track(self, plotter, kwargs) -> _Track:
+        track = _Track._for_plotter(plotter, kwargs)
+        self._tracks.append(track)
+        return track
+
+    def __len__(self):
+        """ The number of tracks """
+        return len(self._tracks)
+
+    def __repr__(self):
+        return '<{} with frames {}>'.format(type(self).__name__, [len(t) for t in self._tracks])
+
+    def frame_count(self, track: int = 0) -> int:
+        """ The number of frames in a track """
+        return len(self._tracks[track])
+
+    def plot(self, ax, frame: int = 0, track: int = 0, **kwargs) -> 'ReplayHandle':
+        """
+        Plot a recorded frame, without classifying anything.
+
+        Parameters
+        ----------
+        ax : matplotlib.axes.Axes
+        frame, track : int
+            Which frame to show, from which track.
+        **kwargs
+            As for :func:`~mpl_toolkits.clifford.plot`, overriding the
+            arguments the track was recorded with.
+        """
+        t = self._tracks[track]
+        handle = ReplayHandle(ax, t, **{**t.kwargs, **kwargs})
+        handle.update(frame)
+        return handle
+
+    def save(self, path):
+        """
+        Write the recording to ``path``, as a ``.npz`` file if it has that
+        extension, and otherwise as a directory of ``.npy`` files.
+        """
+        path = os.fspath(path)
+        meta = dict(version=_FORMAT_VERSION, tracks=[t.meta() for t in self._tracks])
+        meta = json.dumps(meta, default=_json_default)
+        arrays = {
+            '{}_{}'.format(i, name): a
+            for i, t in enumerate(self._tracks) for name, a in t.columns().items()
+        }
+        if path.endswith('.npz'):
+            np.savez(path, meta=np.array(meta), **arrays)
+        else:
+            os.makedirs(path, exist_ok=True)
+            with open(os.path.join(path, 'meta.json'), 'w') as f:
+                f.write(meta)
+            for name, a in arrays.items():
+                np.save(os.path.join(path, name + '.npy'), a)
+
+    @classmethod
+    def load(cls, path) -> 'GeometryRecording':
+        """
+        Read a recording written by :meth:`save`. The arrays of a directory
+        are memory-mapped, and only the frames plotted are read.
+        """
+        path = os.fspath(path)
+        if path.endswith('.npz'):
+            with np.load(path) as data:
+                meta = json.loads(str(data['meta']))
+                arrays = {name: data[name] for name in data.files if name != 'meta'}
+        else:
+            with open(os.path.join(path, 'meta.json')) as f:
+                meta = json.load(f)
+            arrays = {
+                name[:-len('.npy')]: np.load(os.path.join(path, name), mmap_mode='r')
+                for name in os.listdir(path) if name.endswith('.npy')
+            }
+        if meta['version'] != _FORMAT_VERSION:
+            raise ValueError("Unsupported recording version {!r}".format(meta['version']))
+
+        self = cls()
+        for i, m in enumerate(meta['tracks']):
+            basis = {k: np.array(v) for k, v in m['basis'].items()}
+            columns = {name: arrays['{}_{}'.format(i, name)] for name in _COLUMNS}
+            self._tracks.append(_Track(basis, m['kwargs'], m['types'], columns))
+        return self
+
+
+class ReplayHandle(PlotHandle):
+    """
+    The artists created by :meth:`GeometryRecording.plot`.
+
+    Rather than new objects, :meth:`update` takes the index of another frame
+    of the same track, and reuses the artists as
+    :meth:`PlotHandle.update` would.
+    """
+    def __init__(self, ax, track, **kwargs):
+        super().__init__(ax, **kwargs)
+        self._track = track
+
+    def update(self, frame) -> 'ReplayHandle':
+        """ Show frame ``frame`` of the track in place of the current one """
+        groups = self._track.groups(frame)
+        if not groups:
+            self._clear()
+        else:
+            if self._plotter is None:
+                self._plotter = self._track.plotter(self.axes, self._cull, self._scene)
+            self._connect_cull()
+            self._parts = self._plotter.update_groups(self._parts, groups, **self._kwargs)
+        self[:] = [a for _, artists in self._parts for a in artists]
+        return self
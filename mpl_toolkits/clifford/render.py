@@ -0,0 +1,143 @@
+"""
+Rendering of conformal objects straight to image arrays, without pyplot.
+
+This is intended for generating many images in a server, where creating a
+new figure for each one would dominate the cost::
+
+    pool = RenderPool(figsize=(2, 2), dpi=64, projection='3d')
+    rgba = pool.render(objs, color='tab:blue', setup=lambda ax: ax.set_axis_off())
+"""
+import threading
+from typing import Callable, Optional, Tuple
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import numpy as np
+
+from . import plot
+
+__all__ = ['RenderPool']
+
+# the lists of artists added to axes by plotting
+_ARTIST_LISTS = ('artists', 'collections', 'images', 'lines', 'patches', 'tables', 'texts')
+
+
+def _axes_state(ax):
+    """ What :func:`_restore_axes` needs to return ``ax`` to its current state """
+    names = 'xyz'[:3 if ax.name == '3d' else 2]
+    return dict(
+        data_lims={n: getattr(ax, n).frozen() for n in ('dataLim', 'xy_dataLim', 'zz_dataLim') if hasattr(ax, n)},
+        lims={n: getattr(ax, 'get_{}lim'.format(n))() for n in names},
+        autoscale={n: getattr(ax, 'get_autoscale{}_on'.format(n))() for n in names},
+    )
+
+
+def _restore_axes(ax, state):
+    """
+    Remove everything plotted on ``ax``, and reset its limits and color
+    cycle. This is much cheaper than :meth:`~matplotlib.axes.Axes.clear`,
+    which rebuilds the axis ticks.
+    """
+    for name in _ARTIST_LISTS:
+        for a in list(getattr(ax, name)):
+            a.remove()
+    if ax.get_legend() is not None:
+        ax.get_legend().remove()
+    for name, bbox in state['data_lims'].items():
+        getattr(ax, name).set(bbox)
+    ax.ignore_existing_data_limits = True
+    for n, lim in state['lims'].items():
+        getattr(ax, 'set_{}lim'.format(n))(*lim, auto=state['autoscale'][n])
+    ax.set_prop_cycle(None)
+
+
+class RenderPool:
+    """
+    Figures drawn with Agg, which are reused from one image to the next.
+
+    Each call to :meth:`render` takes an idle figure from the pool, or
+    creates one if there are none, and returns it to the pool afterwards.
+    The pool can be shared between threads, as no two threads draw on the
+    same figure at once and pyplot is never involved.
+
+    Between images, everything plotted on the axes is removed, and their
+    limits and color cycle are reset. To avoid the cost of clearing them
+    completely, other changes made by ``setup``, such as to labels or the
+    view angle, are kept, so it should make the same ones every time.
+
+    Parameters
+    ----------
+    figsize : (float, float)
+        The size of each image, in inches.
+    dpi : float
+        The resolution of each image.
+    projection : str, optional
+        The projection of the axes, such as ``'3d'``.
+    maxsize : int, optional
+        The most idle figures to keep. By default, this is as many as have
+        been in use at once.
+    """
+    def __init__(self, figsize: Tuple[float, float] = (4, 4), dpi: float = 100,
+                 projection: Optional[str] = None, maxsize: Optional[int] = None):
+        self.figsize = figsize
+        self.dpi = dpi
+        self.projection = projection
+        self.maxsize = maxsize
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def _new_axes(self):
+        if self.projection == '3d':
+            import mpl_toolkits.mplot3d  # noqa: F401, registers the 3d projection
+        fig = Figure(figsize=self.figsize, dpi=self.dpi)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(projection=self.projection)
+        return ax, _axes_state(ax)
+
+    def _acquire(self):
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._new_axes()
+
+    def _release(self, entry):
+        with self._lock:
+            if self.maxsize is None or len(self._idle) < self.maxsize:
+                self._idle.append(entry)
+
+    def render(self, cga_objs=(), *, setup: Optional[Callable] = None, **kwargs) -> np.ndarray:
+        """
+        Plot ``cga_objs`` on fresh axes, and return the image.
+
+        Parameters
+        ----------
+        cga_objs
+            Anything accepted by :func:`~mpl_toolkits.clifford.plot`.
+        setup : callable, optional
+            Called with the axes before plotting, to set limits or styles or
+            to make other plots. Only the axes are reset between images, so
+            this should not change the rest of the figure.
+        **kwargs
+            Passed on to :func:`~mpl_toolkits.clifford.plot`.
+
+        Returns
+        -------
+        np.ndarray
+            The ``(height, width, 4)`` RGBA image, of dtype ``uint8``.
+        """
+        entry = self._acquire()
+        ax, state = entry
+        _restore_axes(ax, state)
+        if setup is not None:
+            setup(ax)
+        handle = plot(ax, cga_objs, **kwargs)
+        canvas = ax.figure.canvas
+        canvas.draw()
+        # the buffer is overwritten by the next draw, so copy it
+        image = np.array(canvas.buffer_rgba())
+        # this also disconnects the callbacks of a culled plot
+        handle._remove_parts()
+        # if anything above failed, the axes are dropped rather than reused
+        self._release(entry)
+        return image
@@ -23,7 +23,6 @@ setup(
     install_requires=[
         'clifford',
         'matplotlib',
-        'trimesh',
     ],
     package_dir={'mpl_toolkits': 'mpl_toolkits'},
 
@@ -35,8 +34,6 @@ setup(
 
         'License :: OSI Approved :: MIT License',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
     ],
     project_urls={
@@ -44,5 +41,5 @@ setup(
         "Source Code": "https://github.com/pygae/mpl_toolkits.clifford",
     },
 
-    python_requires='>=3.5',
+    python_requires='>=3.7',
 )
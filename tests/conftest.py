@@ -0,0 +1,4 @@
+import matplotlib
+
+# the tests draw figures, but never show them
+matplotlib.use('Agg')
@@ -0,0 +1,73 @@
+import clifford
+import numpy as np
+from matplotlib.figure import Figure
+
+from clifford import g2c
+
+from mpl_toolkits.clifford import plot, plot_values, ClassificationCache
+
+
+def _points(*xs):
+    return [g2c.up(x * g2c.e1) for x in xs]
+
+
+def _plot(objs, cache):
+    plot(Figure().add_subplot(), objs, cache=cache, linestyle='none', marker='x')
+
+
+def test_hits_and_misses():
+    cache = ClassificationCache()
+    _plot(_points(0, 1), cache)
+    assert cache.cache_info() == (0, 2, 4096, 2)
+    _plot(_points(1, 2), cache)
+    assert cache.cache_info() == (1, 3, 4096, 3)
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 4096, 0)
+
+
+def test_evicts_least_recently_used():
+    cache = ClassificationCache(maxsize=2)
+    _plot(_points(0), cache)
+    _plot(_points(1), cache)
+    _plot(_points(0), cache)  # now the most recently used
+    _plot(_points(2), cache)  # evicting 1
+    assert len(cache) == 2
+    _plot(_points(0), cache)
+    assert cache.cache_info().hits == 2
+    _plot(_points(1), cache)
+    assert cache.cache_info().hits == 2
+
+
+def test_rounding():
+    cache = ClassificationCache(decimals=6)
+    _plot(_points(1), cache)
+    _plot(_points(1 + 1e-9), cache)
+    assert cache.cache_info().hits == 1
+    _plot(_points(1 + 1e-3), cache)
+    assert cache.cache_info().hits == 1
+
+    # zero and negative zero, as well as tiny numbers which round to either
+    values = np.zeros((3, g2c.layout.gaDims))
+    values[:, 0] = 1
+    values[:, 1] = [0.0, -0.0, -1e-9]
+    keys = cache._keys(g2c.layout, values)
+    assert keys[0] == keys[1] == keys[2]
+
+
+def test_exact_without_rounding():
+    cache = ClassificationCache()
+    _plot(_points(1), cache)
+    _plot(_points(1 + 1e-12), cache)
+    assert cache.cache_info().hits == 0
+
+
+def test_layouts_kept_apart():
+    other = clifford.conformalize(clifford.Cl(2)[0])[0]
+    assert other.gaDims == g2c.layout.gaDims
+    values = np.array([p.value for p in _points(0, 1)])
+    cache = ClassificationCache()
+    plot_values(Figure().add_subplot(), g2c.layout, values, cache=cache, linestyle='none')
+    plot_values(Figure().add_subplot(), other, values, cache=cache, linestyle='none')
+    assert cache.cache_info()[:2] == (0, 4)
+    plot_values(Figure().add_subplot(), other, values, cache=cache, linestyle='none')
+    assert cache.cache_info()[:2] == (2, 4)
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from clifford import g2c, g3c
+from clifford.tools import classify
+
+from mpl_toolkits.clifford._classify import _BATCH_MIN_SIZE, _classify_groups
+
+
+def _objects(g):
+    """ One of each kind of object, including degenerate ones, with arbitrary scales """
+    up, einf, eo = g.up, g.einf, g.eo
+    e1, e2 = g.blades['e1'], g.blades['e2']
+    A, B, C = up(e1 + 0.5*e2), up(-e1 + 2*e2), up(0.3*e1 - e2)
+    objs = [
+        A,
+        -2.5 * B,
+        A ^ B,                         # point pair
+        3 * (A ^ B ^ C),               # circle
+        (A ^ B ^ C).dual() ^ einf,     # the axis of the circle
+        A ^ B ^ einf,                  # line
+        A ^ (A | (e1 * einf)),         # tangent vector
+        A ^ (A | ((e1 ^ e2) * einf)),  # tangent bivector
+        (A ^ B).dual(),                # dual point pair, possibly imaginary
+        (A - 2*einf).dual(),           # the largest round
+        (A + 2*einf).dual(),           # imaginary
+        A.dual(),                      # zero radius, so a tangent
+        A ^ einf,                      # flat point
+        e1 ^ einf,                     # direction
+        e1 ^ e2,                       # dual flat
+        einf,
+        eo,
+    ]
+    if g is g3c:
+        e3 = g.blades['e3']
+        D = up(e3 - e1)
+        objs += [
+            A ^ B ^ C ^ D,              # sphere
+            -(A ^ B ^ C ^ D).dual().dual(),
+            A ^ B ^ D ^ einf,           # plane
+            (A ^ B ^ C).dual(),         # dual circle, imaginary
+            A ^ (A | ((e1 ^ e2 ^ e3) * einf)),
+        ]
+    return objs
+
+
+def _assert_blades_equal(actual, expected):
+    assert type(actual) is type(expected)
+    if isinstance(expected, (classify.Round, classify.Flat)):
+        np.testing.assert_allclose(actual.location.value, expected.location.value, atol=1e-8)
+        np.testing.assert_allclose(actual.direction.value, expected.direction.value, atol=1e-8)
+    if isinstance(expected, classify.Round):
+        np.testing.assert_allclose(actual.radius, expected.radius, atol=1e-8)
+
+
+@pytest.mark.parametrize('g', [g2c, g3c], ids=['2d', '3d'])
+@pytest.mark.parametrize('n', [1, _BATCH_MIN_SIZE - 1, _BATCH_MIN_SIZE, 50])
+@pytest.mark.parametrize('as_values', [False, True])
+def test_matches_classify(g, n, as_values):
+    objs = _objects(g)
+    objs = [objs[i % len(objs)] for i in range(n)]
+    expected = [classify.classify(o) for o in objs]
+    # groups are in order of the first appearance of each type
+    types = list(dict.fromkeys(type(e) for e in expected))
+
+    values = np.array([o.value for o in objs])
+    groups = _classify_groups(g.layout, values if as_values else objs)
+
+    assert [grp.type for grp in groups] == types
+    for grp in groups:
+        group_expected = [e for e in expected if type(e) is grp.type]
+        assert len(grp) == len(group_expected)
+        for actual, e in zip(grp, group_expected):
+            _assert_blades_equal(actual, e)
+        if issubclass(grp.type, (classify.Round, classify.Flat)):
+            np.testing.assert_allclose(grp.location, [e.location.value for e in group_expected], atol=1e-8)
+            np.testing.assert_allclose(grp.direction, [e.direction.value for e in group_expected], atol=1e-8)
+
+
+@pytest.mark.parametrize('n', [1, _BATCH_MIN_SIZE])
+def test_not_a_blade(n):
+    A, B = g3c.up(g3c.blades['e1']), g3c.up(g3c.blades['e2'])
+    objs = [A] * (n - 1) + [A + (A ^ B)]
+    with pytest.raises(ValueError, match='multiple grades'):
+        classify.classify(objs[-1])
+    with pytest.raises(ValueError, match='multiple grades'):
+        _classify_groups(g3c.layout, objs)
@@ -0,0 +1,34 @@
+import gc
+
+from matplotlib.figure import Figure
+
+from clifford import g2c
+
+from mpl_toolkits.clifford import plot
+
+
+def _circle(x):
+    return g2c.up(x * g2c.e1 + g2c.e2) ^ g2c.up(x * g2c.e1 - g2c.e2) ^ g2c.up((x + 1) * g2c.e1)
+
+
+def test_culled_objects_return_after_dropping_handle():
+    ax = Figure().add_subplot()
+    ax.set(xlim=[-5, 5], ylim=[-5, 5], autoscale_on=False)
+    plot(ax, [_circle(0), _circle(20)], color='k', cull=True)
+    gc.collect()
+    assert len(ax.collections) == 1
+    assert len(ax.collections[0]._radii) == 1
+
+    ax.set_xlim(-5, 30)
+    assert len(ax.collections) == 1
+    assert len(ax.collections[0]._radii) == 2
+
+
+def test_cleared_plot_stops_culling():
+    ax = Figure().add_subplot()
+    ax.set(xlim=[-5, 5], ylim=[-5, 5], autoscale_on=False)
+    h = plot(ax, [_circle(0), _circle(20)], color='k', cull=True)
+    h.update([])
+    ax.set_xlim(-5, 30)
+    assert not ax.collections
+    assert not ax.callbacks.callbacks.get('xlim_changed')
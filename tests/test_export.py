@@ -0,0 +1,52 @@
+import os
+import signal
+import subprocess
+import sys
+
+from matplotlib.figure import Figure
+
+from clifford import g2c
+
+from mpl_toolkits.clifford.animation import Animator
+
+
+def _setup():
+    fig = Figure(figsize=(1, 1), dpi=32)
+    ax = fig.add_subplot()
+    ax.set(xlim=[-2, 2], ylim=[-2, 2], autoscale_on=False)
+    animator = Animator(fig)
+    animator.dynamic(ax, marker='x', linestyle='none')
+    return animator
+
+
+def _frame(t):
+    return [[g2c.up(t / 4 * g2c.e1)]]
+
+
+_EXPORT_SCRIPT = '''
+import sys
+sys.path.insert(0, {tests!r})
+from test_export import _setup, _frame
+from mpl_toolkits.clifford.animation import export
+
+if __name__ == '__main__':
+    # run clifford's numba functions in this process first
+    _setup()._dynamic[0].update(_frame(1)[0])
+    export(_setup, _frame, 4, {pattern!r}, processes=2)
+'''
+
+
+def test_export_images(tmp_path):
+    # in a separate process, as a pool of forked workers used to hang either
+    # while rendering or when the interpreter exits
+    script = _EXPORT_SCRIPT.format(
+        tests=os.path.dirname(os.path.abspath(__file__)), pattern=str(tmp_path / '{:02d}.png'))
+    proc = subprocess.Popen([sys.executable, '-c', script], start_new_session=True)
+    try:
+        assert proc.wait(timeout=180) == 0
+    except subprocess.TimeoutExpired:
+        # including any workers left behind
+        os.killpg(proc.pid, signal.SIGKILL)
+        proc.wait()
+        raise
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['00.png', '01.png', '02.png', '03.png']
@@ -0,0 +1,30 @@
+from matplotlib.figure import Figure
+
+from clifford import g2c
+
+from mpl_toolkits.clifford.animation import Animator, LiveViewer
+
+
+def test_skips_frames_which_fail_to_classify():
+    fig = Figure()
+    ax = fig.add_subplot()
+    animator = Animator(fig)
+    handle = animator.dynamic(ax, color='k')
+    A, B = g2c.up(g2c.e1), g2c.up(g2c.e2)
+    frames = [
+        [[A ^ B ^ g2c.up(-g2c.e1)]],
+        # two of the points almost meet, so the circle cannot be inverted
+        [[A ^ B ^ g2c.up(g2c.e1 + 1e-9 * g2c.e2)]],
+        [[A ^ B ^ g2c.up(-g2c.e2)]],
+    ]
+    viewer = LiveViewer(animator, frames, maxsize=3)
+    # run the producer on this thread, to completion
+    viewer._produce()
+    assert viewer.counters() == dict(produced=3, rendered=0, dropped=0, failed=1)
+    assert viewer.last_error is not None
+
+    viewer._show_next()
+    viewer._show_next()
+    viewer._show_next()
+    assert viewer.rendered == 2
+    assert len(handle) == 1
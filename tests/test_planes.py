@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from mpl_toolkits.clifford._plot3d import _clip_planes, Plane3DCollection
+
+
+@pytest.mark.parametrize('normal, offset, n', [
+    ((1, 1, 1), 2.5, 3),   # cutting off a corner
+    ((0, 0, 1), 0.5, 4),   # parallel to a face
+    ((1, 1, 1), 1.5, 6),   # through the middle of the cube
+    ((0, 0, 1), 2.0, 0),   # missing the box
+])
+def test_clip_planes(normal, offset, n):
+    normal = np.array(normal, dtype=float) / np.linalg.norm(normal)
+    origin = normal * offset / np.sqrt(np.sum(normal != 0))
+    polygon, = _clip_planes(origin[np.newaxis], normal[np.newaxis], np.zeros(3), np.ones(3))
+    assert polygon.shape == (n, 3)
+    np.testing.assert_allclose(polygon @ normal, origin @ normal)
+    assert np.all((polygon >= -1e-12) & (polygon <= 1 + 1e-12))
+    if n:
+        # convex, and in order around the polygon
+        edges = np.roll(polygon, -1, axis=0) - polygon
+        turns = np.cross(edges, np.roll(edges, -1, axis=0)) @ normal
+        assert np.all(turns > 0) or np.all(turns < 0)
+
+
+def test_draw_clipped_planes():
+    # with a polygon of each size, including none
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(projection='3d')
+    ax.set(xlim=[0, 1], ylim=[0, 1], zlim=[0, 1])
+    ax.set_axis_off()
+    normals = np.array([[1, 1, 1], [0, 0, 1], [1, 1, 1], [0, 0, 1]]) / np.sqrt([[3], [1], [3], [1]])
+    origins = normals * np.array([[2.5 / np.sqrt(3)], [0.5], [1.5 / np.sqrt(3)], [2.0]])
+    ax.add_collection3d(Plane3DCollection(origins, normals, 'tab:blue'))
+    fig.canvas.draw()
+    image = np.asarray(fig.canvas.buffer_rgba())
+    assert np.any(image[..., :3] != 255)
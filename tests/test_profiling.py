@@ -0,0 +1,32 @@
+import threading
+
+from matplotlib.figure import Figure
+
+from clifford import g2c
+
+from mpl_toolkits.clifford import plot, profile
+
+
+def _plot_points():
+    ax = Figure().add_subplot()
+    plot(ax, [g2c.up(x * g2c.e1) for x in range(3)])
+
+
+def test_profile_records_only_its_thread():
+    thread_summaries = []
+
+    def other():
+        with profile() as p:
+            _plot_points()
+        thread_summaries.append(p.summary())
+
+    with profile() as p:
+        t = threading.Thread(target=other)
+        t.start()
+        t.join()
+    assert p.summary() == {'phases': {}, 'artists': {}}
+    assert thread_summaries[0]['artists'] == {'Point': 1}
+
+    with profile() as p:
+        _plot_points()
+    assert p.summary()['artists'] == {'Point': 1}
@@ -0,0 +1,47 @@
+import numpy as np
+
+from mpl_toolkits.clifford import _ray_box_intersection, _ray_box_intersections
+
+MINS, MAXS = np.zeros(3), np.ones(3)
+
+
+def _segments(origins, directions):
+    return _ray_box_intersections(origins, directions, MINS, MAXS)
+
+
+def test_axis_parallel():
+    origins = [[0.5, 0.5, 5], [0.2, -3, 0.7], [0.5, 0.5, 0.5]]
+    directions = [[0, 0, -2], [0, 1, 0], [1, 0, 0]]
+    segments = _segments(origins, directions)
+    np.testing.assert_allclose(segments, [
+        [[0.5, 0.5, 1], [0.5, 0.5, 0]],
+        [[0.2, 0, 0.7], [0.2, 1, 0.7]],
+        [[0, 0.5, 0.5], [1, 0.5, 0.5]],
+    ])
+
+
+def test_diagonal():
+    segments = _segments([[0.5, 0.5, 0.5]], [[1, 1, 1]])
+    np.testing.assert_allclose(segments, [[[0, 0, 0], [1, 1, 1]]])
+
+
+def test_miss():
+    origins = [[0.5, 0.5, 2], [2, 2, 0.5], [0.5, 2, 0.5], [-1, 0.5, 0.5]]
+    directions = [[1, 0, 0], [1, -1, 0], [1, 0, 1], [0, 0, 1]]
+    assert np.isnan(_segments(origins, directions)).all()
+    assert _ray_box_intersection(origins[0], directions[0], MINS, MAXS).shape == (0, 3)
+
+
+def test_touch_corner():
+    # meeting the box only at (1, 1, 1), from outside it
+    segments = _segments([[2, 0, 1]], [[-1, 1, 0]])
+    np.testing.assert_allclose(segments, [[[1, 1, 1], [1, 1, 1]]])
+    # and along an edge, parallel to two of the axes
+    segments = _segments([[1, 1, 3]], [[0, 0, 1]])
+    np.testing.assert_allclose(segments, [[[1, 1, 0], [1, 1, 1]]])
+
+
+def test_2d():
+    segments = _ray_box_intersections([[0, 0], [5, 5]], [[1, 2], [1, 0]], np.zeros(2), np.ones(2))
+    np.testing.assert_allclose(segments[0], [[0, 0], [0.5, 1]])
+    assert np.isnan(segments[1]).all()
@@ -0,0 +1,40 @@
+import numpy as np
+from matplotlib.figure import Figure
+
+from clifford import g2c
+
+import mpl_toolkits.clifford
+from mpl_toolkits.clifford import plot, GeometryRecording
+
+
+def _objs(n):
+    for x in range(n):
+        A = g2c.up(x * g2c.e1)
+        B = g2c.up(x * g2c.e1 + g2c.e2)
+        yield A
+        yield A ^ B ^ g2c.up((x + 1) * g2c.e1)
+
+
+def _state(handle):
+    state = []
+    for a in handle:
+        if hasattr(a, '_radii'):
+            state.append((type(a), a._centers, a._radii))
+        else:
+            state.append((type(a), a.get_xydata()))
+    return state
+
+
+def test_replay_streamed_frame(monkeypatch, tmp_path):
+    monkeypatch.setattr(mpl_toolkits.clifford, '_STREAM_CHUNK_SIZE', 3)
+    recording = GeometryRecording()
+    live = plot(Figure().add_subplot(), _objs(5), color='k', record=recording)
+    recording.save(tmp_path / 'run.npz')
+
+    replayed = GeometryRecording.load(tmp_path / 'run.npz').plot(Figure().add_subplot())
+    expected, actual = _state(live), _state(replayed)
+    assert len(actual) == len(expected) == 2
+    for e, a in zip(expected, actual):
+        assert e[0] is a[0]
+        for ev, av in zip(e[1:], a[1:]):
+            np.testing.assert_allclose(av, ev)
@@ -0,0 +1,19 @@
+from clifford import g2c
+
+from mpl_toolkits.clifford import RenderPool
+
+
+def test_render_releases_culled_plot():
+    pool = RenderPool(figsize=(1, 1), dpi=32)
+    objs = [g2c.up(x * g2c.e1) for x in range(3)]
+
+    def setup(ax):
+        ax.set(xlim=[-1, 1], ylim=[-1, 1], autoscale_on=False)
+
+    first = pool.render(objs, setup=setup, cull=True, linestyle='none', marker='x')
+    ax, _ = pool._idle[0]
+    for _ in range(3):
+        image = pool.render(objs, setup=setup, cull=True, linestyle='none', marker='x')
+        assert (image == first).all()
+        assert not ax.callbacks.callbacks.get('xlim_changed')
+    assert len(pool._idle) == 1
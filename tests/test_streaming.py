@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+from matplotlib.figure import Figure
+
+from clifford import g2c, g3c
+
+import mpl_toolkits.clifford
+from mpl_toolkits.clifford import plot
+
+# the data of each kind of artist, by attribute or getter
+_DATA = (
+    '_verts3d', '_centers', '_radii', '_axes3d', '_origins', '_directions', '_tails', '_heads', '_normals',
+    'get_xydata', 'get_offsets', 'get_segments', 'get_linestyle', 'U', 'V',
+)
+
+
+def _objects(g, kind, n):
+    up, einf = g.up, g.einf
+    e1, e2 = g.blades['e1'], g.blades['e2']
+    for i in range(n):
+        A = up(i * e1 + 0.5 * e2)
+        B = up(i * e1 - e2)
+        C = up((i + 1) * e1)
+        if kind == 'Point':
+            yield A
+        elif kind == 'PointPair':
+            # alternately real and imaginary in 2D, to check the line styles
+            yield A ^ B if i % 2 or g is g3c else (A ^ B).dual()
+        elif kind == 'Line':
+            yield A ^ B ^ einf
+        elif kind == 'Circle':
+            yield A ^ B ^ C
+        elif kind == 'Tangent':
+            yield A ^ (A | (e1 * einf))
+        elif kind == 'Sphere':
+            yield A ^ B ^ C ^ up(g.blades['e3'] + i * e1)
+        elif kind == 'Plane':
+            yield A ^ B ^ up(g.blades['e3'] + i * e1) ^ einf
+
+
+def _state(artist):
+    state = [type(artist)]
+    for name in _DATA:
+        if name == 'get_xydata' and hasattr(artist, '_verts3d'):
+            # only projected when drawn
+            continue
+        value = getattr(artist, name, None)
+        if callable(value):
+            value = value()
+        if value is not None:
+            state.append((name, value))
+    return state
+
+
+def _data_lims(ax):
+    # 3D axes keep theirs apart from the 2D `dataLim`
+    if ax.name == '3d':
+        return np.concatenate([ax.xy_dataLim.get_points().ravel(), ax.zz_dataLim.intervalx])
+    return ax.dataLim.get_points().ravel()
+
+
+def _assert_same(actual, expected):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        assert a[0] is e[0]
+        assert [name for name, _ in a[1:]] == [name for name, _ in e[1:]]
+        for (name, av), (_, ev) in zip(a[1:], e[1:]):
+            if name == 'get_linestyle':
+                assert av == ev
+            else:
+                np.testing.assert_allclose(np.asarray(av, dtype=float), np.asarray(ev, dtype=float))
+
+
+_KINDS = [
+    (g2c, None, kind, False) for kind in ('Point', 'PointPair', 'Line', 'Circle', 'Tangent')
+] + [
+    (g3c, '3d', kind, False) for kind in ('Point', 'Line', 'Circle', 'Tangent', 'Sphere')
+] + [
+    # the parts of a scene
+    (g3c, '3d', kind, True) for kind in ('Circle', 'Sphere')
+]
+
+
+@pytest.mark.parametrize('g, projection, kind, scene', _KINDS)
+def test_streamed_like_list(monkeypatch, g, projection, kind, scene):
+    monkeypatch.setattr(mpl_toolkits.clifford, '_STREAM_CHUNK_SIZE', 3)
+    kwargs = dict(color='k', scene=scene) if scene else dict(color='k')
+    ax_list = Figure().add_subplot(projection=projection)
+    ax_stream = Figure().add_subplot(projection=projection)
+    listed = plot(ax_list, list(_objects(g, kind, 10)), **kwargs)
+    streamed = plot(ax_stream, _objects(g, kind, 10), **kwargs)
+
+    _assert_same([_state(a) for a in streamed], [_state(a) for a in listed])
+    # including any artist replaced when the chunks were joined
+    for a in streamed:
+        assert a.axes is ax_stream
+    np.testing.assert_allclose(_data_lims(ax_stream), _data_lims(ax_list))
+
+    # and updating in place, with more chunks than before
+    listed.update(list(_objects(g, kind, 14)))
+    streamed.update(_objects(g, kind, 14))
+    _assert_same([_state(a) for a in streamed], [_state(a) for a in listed])
+
+
+@pytest.mark.parametrize('kind, n_artists', [('PointPair', 10), ('Plane', 4)])
+def test_streamed_without_extender(monkeypatch, kind, n_artists):
+    # these add the artists of each chunk to the same part instead
+    monkeypatch.setattr(mpl_toolkits.clifford, '_STREAM_CHUNK_SIZE', 3)
+    ax = Figure().add_subplot(projection='3d')
+    handle = plot(ax, _objects(g3c, kind, 10), color='k')
+    assert len(handle) == n_artists
+    assert all(a.axes is ax for a in handle)
+    (key, artists), = handle._parts
+    assert key[-1] == 'extended'
+
+    # which an update replaces, as the updaters expect one call's artists
+    first = list(handle)
+    handle.update(list(_objects(g3c, kind, 10)))
+    assert len(handle) == len(plot(Figure().add_subplot(projection='3d'), list(_objects(g3c, kind, 10)), color='k'))
+    assert not any(a in handle for a in first)
+    assert all(a.axes is None for a in first)
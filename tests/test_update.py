@@ -0,0 +1,59 @@
+import numpy as np
+from matplotlib.figure import Figure
+
+from clifford import g2c
+
+from mpl_toolkits.clifford import plot
+
+
+def _points(*xs):
+    return [g2c.up(x * g2c.e1) for x in xs]
+
+
+def _tangents(*xs):
+    return [A ^ (A | (g2c.e2 * g2c.einf)) for A in _points(*xs)]
+
+
+def _circles(*xs):
+    return [A ^ g2c.up(x * g2c.e1 + g2c.e2) ^ g2c.up((x + 1) * g2c.e1) for x, A in zip(xs, _points(*xs))]
+
+
+def test_reuses_artists():
+    ax = Figure().add_subplot()
+    handle = plot(ax, _points(0, 1) + _circles(0, 1), color='k')
+    line, circles = handle
+    handle.update(_points(2, 3, 4) + _circles(5))
+    assert handle[0] is line and handle[1] is circles
+    np.testing.assert_allclose(line.get_xydata(), [[2, 0], [3, 0], [4, 0]])
+    np.testing.assert_allclose(circles._centers[:, 0], [5.5])
+
+
+def test_recreates_quiver_of_another_size():
+    ax = Figure().add_subplot()
+    handle = plot(ax, _tangents(0, 1))
+    q, = handle
+    handle.update(_tangents(2, 3))
+    assert handle[0] is q
+
+    # a quiver cannot change its number of arrows
+    handle.update(_tangents(0, 1, 2))
+    new_q, = handle
+    assert new_q is not q
+    assert q.axes is None
+    assert list(ax.collections) == [new_q]
+    np.testing.assert_allclose(new_q.get_offsets(), [[0, 0], [1, 0], [2, 0]])
+
+
+def test_removes_types_which_disappear():
+    ax = Figure().add_subplot()
+    handle = plot(ax, _points(0) + _circles(1), color='k')
+    line, circles = handle
+    handle.update(_circles(2))
+    assert list(handle) == [circles]
+    assert line.axes is None
+    assert list(ax.lines) == []
+    assert list(ax.collections) == [circles]
+
+    handle.update([])
+    assert list(handle) == []
+    assert circles.axes is None
@@ -0,0 +1,30 @@
+from matplotlib.figure import Figure
+
+from clifford import g2c
+
+import mpl_toolkits.clifford
+from mpl_toolkits.clifford import plot_views
+
+
+def _tangents(n):
+    for x in range(n):
+        A = g2c.up(x * g2c.e1)
+        yield A ^ (A | (g2c.e2 * g2c.einf))
+
+
+def test_streamed_tangents(monkeypatch):
+    monkeypatch.setattr(mpl_toolkits.clifford, '_STREAM_CHUNK_SIZE', 4)
+    fig = Figure()
+    axes = [fig.add_subplot(1, 2, 1), fig.add_subplot(1, 2, 2)]
+    handles = plot_views(axes, _tangents(10))
+    for ax, handle in zip(axes, handles):
+        q, = handle
+        assert q.axes is ax
+        assert list(ax.collections) == [q]
+        assert len(q.get_offsets()) == 10
+
+    handles.update(_tangents(6))
+    for ax, handle in zip(axes, handles):
+        q, = handle
+        assert list(ax.collections) == [q]
+        assert len(q.get_offsets()) == 6